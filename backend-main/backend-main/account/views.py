@@ -14,6 +14,7 @@ from drf_yasg.utils import swagger_auto_schema
 
 from utils.index import custom_response, update_lock_count
 from utils.pagination import LargeResultsSetPagination
+from utils.conditional import dataset_conditional
 from utils.filters import *
 from .models import CustomAuthToken
 from .serializers import *
@@ -23,6 +24,7 @@ from espar.serializers import EsparNewsSerializer
 from espar.models import *
 from stardata.serializers import StarDataNewsSerializer
 from stardata.models import *
+from readiness.models import READINESS_MODELS
 from django_filters.rest_framework import DjangoFilterBackend
 
 User = get_user_model()
@@ -160,6 +162,7 @@ class TokenRefreshView(APIView):
     
                 
 class Overview(APIView):
+    @dataset_conditional(['chw', 'espar', 'stardata', *READINESS_MODELS])
     def get(self, request, *args, **kwargs):
         
         return custom_response(
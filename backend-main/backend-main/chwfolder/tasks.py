@@ -3,6 +3,7 @@ import pandas as pd
 from celery import shared_task
 from .models import *
 from utils.index import *
+from readiness.models import DatasetVersion
 from utils.constants import *
 
 @shared_task
@@ -20,52 +21,53 @@ def load_chw(file_path):
         df = df.where(pd.notna(df), None)  # NaN -> None
         return df
 
-    # ---- Countries ----
-    df_country = load_sheet("CHW Country")
-    if df_country is not None:
-        for _, row in df_country.iterrows():
-            Country.objects.update_or_create(
-                country_id=row["CountryID"],
-                defaults={
-                    "country": row["Country"],
-                    "population_2024": row["Population_2024"],
-                    "total_chws": row["Total_CHWs"],
-                    "chws_per_10000": row["CHWs_per_10000"],
-                    "total_regions": row["Total_Regions"],
-                    "total_districts": row["Total_Districts"],
-                    "data_year": row["Data_Year"],
-                    "last_updated": row["Last_Updated"],
-                }
-            )
+    with DatasetVersion.loading('chw'):
+        # ---- Countries ----
+        df_country = load_sheet("CHW Country")
+        if df_country is not None:
+            for _, row in df_country.iterrows():
+                Country.objects.update_or_create(
+                    country_id=row["CountryID"],
+                    defaults={
+                        "country": row["Country"],
+                        "population_2024": row["Population_2024"],
+                        "total_chws": row["Total_CHWs"],
+                        "chws_per_10000": row["CHWs_per_10000"],
+                        "total_regions": row["Total_Regions"],
+                        "total_districts": row["Total_Districts"],
+                        "data_year": row["Data_Year"],
+                        "last_updated": row["Last_Updated"],
+                    }
+                )
  
-    # ---- Regions ----
-    df_region = load_sheet("CHW Region")
-    if df_region is not None:
-        for _, row in df_region.iterrows():
-            Region.objects.update_or_create(
-                region_id=row["RegionID"],
-                defaults={
-                    "country_id": row["CountryID"],
-                    "region_name": row["Region_Name"],
-                    "district_count": row["District_Count"],
-                    "region_number": row["Region_Number"],
-                    "province": row["Province"],
-                }
-            )
+        # ---- Regions ----
+        df_region = load_sheet("CHW Region")
+        if df_region is not None:
+            for _, row in df_region.iterrows():
+                Region.objects.update_or_create(
+                    region_id=row["RegionID"],
+                    defaults={
+                        "country_id": row["CountryID"],
+                        "region_name": row["Region_Name"],
+                        "district_count": row["District_Count"],
+                        "region_number": row["Region_Number"],
+                        "province": row["Province"],
+                    }
+                )
 
-    # ---- Districts ----
-    df_district = load_sheet("CHW District")
-    if df_district is not None:
-        for _, row in df_district.iterrows():
-            District.objects.update_or_create(
-                district_id=row["DistrictID"],
-                defaults={
-                    "region_id": row["RegionID"],
-                    "country_id": row["CountryID"],
-                    "district_name": row["District_Name"],
-                    "chw_count": row["CHW_Count"],
-                    "population_est": row["Population_Est"],
-                    "chws_per_10k": row["CHWs_per_10K"],
-                }
-            )
+        # ---- Districts ----
+        df_district = load_sheet("CHW District")
+        if df_district is not None:
+            for _, row in df_district.iterrows():
+                District.objects.update_or_create(
+                    district_id=row["DistrictID"],
+                    defaults={
+                        "region_id": row["RegionID"],
+                        "country_id": row["CountryID"],
+                        "district_name": row["District_Name"],
+                        "chw_count": row["CHW_Count"],
+                        "population_est": row["Population_Est"],
+                        "chws_per_10k": row["CHWs_per_10K"],
+                    }
+                )
     print("END LOADING CHW DATA")
\ No newline at end of file
@@ -9,6 +9,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 
 from utils.index import *
 from utils.pagination import *
+from utils.values_serializer import ValuesListMixin
 from utils.filters import *
 from account.serializers import FileUploadSerializer
 from .models import *
@@ -32,10 +33,10 @@ class ExcelUploadView(APIView):
         )
 
 
-class DistrictListView(generics.ListAPIView):
+class DistrictListView(ValuesListMixin, generics.ListAPIView):
     serializer_class=DistrictSerializer
     queryset=District.objects.all()
-    pagination_class=LargeResultsSetPagination
+    pagination_class=SelectablePagination
     filterset_class = DistrictFilter
     filter_backends = [DjangoFilterBackend]
     
@@ -157,6 +157,9 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles/')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Columnar sidecars of uploaded CSVs read by the loaders (utils/storage.py)
+UPLOAD_COLUMNAR_CACHE_DIR = os.getenv('UPLOAD_COLUMNAR_CACHE_DIR', os.path.join(MEDIA_ROOT, '.columnar'))
+
 # Swagger Authentication Method Settings
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
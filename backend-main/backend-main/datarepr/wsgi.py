@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'datarepr.settings')
 
 application = get_wsgi_application()
+
+# Opt-in WHO data refresher, started in web server processes only (runserver loads this module too)
+from utils.who_data_refresher import start_refresher_from_environment  # noqa: E402
+
+start_refresher_from_environment()
@@ -1,3 +1,37 @@
 from django.test import TestCase
 
-# Create your tests here.
+from espar.models import Espar, Indicator, Sheet
+from espar.serializers import EsparNewsSerializer, EsparSerializer
+from utils.values_serializer import ValuesReader
+
+
+class ValuesReaderTests(TestCase):
+    """values() rows represented by ValuesReader match the serializer output"""
+
+    def setUp(self):
+        sheet = Sheet.objects.create(name='2024')
+        kenya = Espar.objects.create(
+            sheet=sheet, key_on_table='ke', data_received='yes', region='AFRO', states='Kenya', iso_code='KEN',
+            total_average=64,
+        )
+        Espar.objects.create(
+            sheet=sheet, key_on_table='ug', data_received='no', region='AFRO', states='Uganda', iso_code='UGA',
+            total_average=None,
+        )
+        Indicator.objects.create(espar=kenya, code='C.1.1', value=80)
+        Indicator.objects.create(espar=kenya, code='C.2.1', value=40)
+
+    def assertMatchesSerializer(self, serializer_class):
+        queryset = Espar.objects.order_by('pk')
+        reader = ValuesReader(serializer_class())
+        self.assertTrue(reader.supported)
+        self.assertEqual(
+            [dict(row) for row in reader.to_representation(reader.values(queryset))],
+            [dict(row) for row in serializer_class(queryset, many=True).data],
+        )
+
+    def test_nested_indicators(self):
+        self.assertMatchesSerializer(EsparSerializer)
+
+    def test_renamed_sources(self):
+        self.assertMatchesSerializer(EsparNewsSerializer)
@@ -13,6 +13,9 @@ from django.db.models.functions import Trim
 from account.serializers import FileUploadSerializer
 from utils.index import custom_response
 from utils.pagination import *
+from utils.sparse_fields import SparseFieldsMixin
+from utils.values_serializer import ValuesListMixin
+from utils.conditional import dataset_conditional
 from utils.filters import *
 from utils.constants import CAPACITIES
 from .models import *
@@ -36,10 +39,10 @@ class ExcelUploadView(APIView):
         )
 
 
-class EsparListView(generics.ListAPIView):
+class EsparListView(ValuesListMixin, SparseFieldsMixin, generics.ListAPIView):
     serializer_class=EsparSerializer
     queryset=Espar.objects.all()
-    pagination_class=LargeResultsSetPagination
+    pagination_class=SelectablePagination
     filterset_class = EsparFilter
     filter_backends = [DjangoFilterBackend]
     
@@ -75,6 +78,7 @@ def capacity_averages(indicators, named: bool=False):
     
     
 class SummaryAPIView(APIView):
+    @dataset_conditional(['espar'])
     def get(self, request, *args, **kwargs):
         state=request.query_params.get('country', "Algeria")
         year=request.query_params.get('year', "2024")
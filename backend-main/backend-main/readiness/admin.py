@@ -15,4 +15,5 @@ admin.site.register(MeningitiseElimination)
 admin.site.register(Mpox)
 admin.site.register(MpoxDistrict)
 admin.site.register(NaturalDisaster)
-admin.site.register(RiftValleyFever)
\ No newline at end of file
+admin.site.register(RiftValleyFever)
+admin.site.register(SignalEvent)
\ No newline at end of file
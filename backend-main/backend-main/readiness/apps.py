@@ -1,6 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def summarise_readiness_tables(sender, **kwargs):
+    """
+    Build the rollups of readiness tables that have none, e.g. after a
+    migration reset them, so read endpoints never have to write
+    """
+    from readiness.models import READINESS_MODELS
+    from readiness.tasks import ensure_readiness_summary
+
+    ensure_readiness_summary(list(READINESS_MODELS))
 
 
 class ReadinessConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'readiness'
+
+    def ready(self):
+        post_migrate.connect(summarise_readiness_tables, sender=self)
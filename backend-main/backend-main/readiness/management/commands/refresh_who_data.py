@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from readiness.views import WHODataView
+from utils.who_data_refresher import WHODataRefresher
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the signal CSVs and warm the WHO data caches (columnar sidecars, catalog and Excel outlines). "
+        "With --watch, keep polling who-data/ and refresh whenever a file changes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--watch', action='store_true', help='Keep running and refresh on file changes')
+        parser.add_argument('--interval', type=float, default=30, help='Polling interval in seconds (default: 30)')
+
+    def handle(self, *args, **options):
+        view = WHODataView()
+        refresher = WHODataRefresher(view._get_existing_events, interval=options['interval'],
+                                     signal_source=view._get_signal_source)
+
+        if not options['watch']:
+            if not refresher.refresh():
+                self.stderr.write(self.style.ERROR(f"WHO data refresh failed: {refresher.last_error}"))
+                return
+            self.stdout.write(self.style.SUCCESS(f"WHO data cache warmed in {refresher.last_duration}s"))
+            return
+
+        self.stdout.write(f"Watching WHO data every {options['interval']}s (Ctrl+C to stop)")
+        refresher.start()
+        try:
+            while refresher.is_alive():
+                refresher.join(timeout=1)
+        except KeyboardInterrupt:
+            refresher.stop()
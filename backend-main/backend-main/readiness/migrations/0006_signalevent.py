@@ -0,0 +1,37 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0005_alter_marburg_data_period_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SignalEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key_on_table', models.CharField(max_length=150, unique=True)),
+                ('event_id', models.CharField(blank=True, max_length=100, null=True)),
+                ('event_type', models.CharField(max_length=30)),
+                ('country', models.CharField(blank=True, max_length=100, null=True)),
+                ('lat', models.FloatField(default=0)),
+                ('lon', models.FloatField(default=0)),
+                ('disease', models.CharField(blank=True, max_length=255, null=True)),
+                ('grade', models.CharField(default='Ungraded', max_length=30)),
+                ('status', models.CharField(default='Ongoing', max_length=30)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('year', models.IntegerField(blank=True, null=True)),
+                ('report_date', models.DateField(blank=True, null=True)),
+                ('cases', models.IntegerField(default=0)),
+                ('deaths', models.IntegerField(default=0)),
+                ('source_file', models.CharField(blank=True, max_length=100, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['country', 'disease', 'report_date'], name='signal_country_disease_date'), models.Index(fields=['grade'], name='signal_grade_idx'), models.Index(fields=['status'], name='signal_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:19
+
+from django.db import migrations, models
+
+from readiness.migrations._rollups import reset_rollups
+
+
+READINESS_MODELS = [
+    'arbovirus', 'cholera', 'cholerasubnational', 'cyclone', 'fvd', 'fvdpoe', 'lassafever',
+    'lassafeverdistrict', 'marburg', 'meningitis', 'meningitiseelimination', 'mpox', 'mpoxdistrict',
+    'naturaldisaster', 'riftvalleyfever',
+]
+
+
+def normalize_key(value):
+    if value is None:
+        return None
+    return str(value).strip().lower()
+
+
+def populate_norm_keys(apps, schema_editor):
+    # One UPDATE per distinct name, normalized in Python so non-ASCII names match what save() writes
+    for model_name in READINESS_MODELS:
+        model = apps.get_model('readiness', model_name)
+        for country in model.objects.values_list('country', flat=True).distinct():
+            model.objects.filter(country=country).update(country_norm=normalize_key(country))
+        if any(field.name == 'district_norm' for field in model._meta.get_fields()):
+            for district in model.objects.values_list('district', flat=True).distinct():
+                model.objects.filter(district=district).update(district_norm=normalize_key(district))
+
+    # Rollups were keyed with SQL LOWER(); drop them so they are rebuilt from country_norm after migrate
+    reset_rollups(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0008_datasetversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arbovirus',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='cholera',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='district_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='cyclone',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='fvd',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='district_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='lassafever',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='district_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='marburg',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='meningitis',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='meningitiseelimination',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpox',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='district_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='naturaldisaster',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='riftvalleyfever',
+            name='country_norm',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.RunPython(populate_norm_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,260 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0009_country_norm'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='arbovirus',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholera',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholerasubnational',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cyclone',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvd',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvdpoe',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafever',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafeverdistrict',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='marburg',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitis',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitiseelimination',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpox',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpoxdistrict',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='naturaldisaster',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='riftvalleyfever',
+            name='country_norm',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='arbovirus',
+            index=models.Index(fields=['country_norm', 'category_code'], name='arbovirus_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='arbovirus',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='arbovirus_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='cholera',
+            index=models.Index(fields=['country_norm', 'category_code'], name='cholera_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='cholera',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='cholera_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='cholera',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='cholera_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(fields=['country_norm', 'category_code'], name='cholerasub_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='cholerasub_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='cholerasub_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='cyclone',
+            index=models.Index(fields=['country_norm', 'category_code'], name='cyclone_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='cyclone',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='cyclone_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='cyclone',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='cyclone_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='fvd',
+            index=models.Index(fields=['country_norm', 'category_code'], name='fvd_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='fvd',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='fvd_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='fvd',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='fvd_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(fields=['country_norm', 'category_code'], name='fvdpoe_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='fvdpoe_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='fvdpoe_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafever',
+            index=models.Index(fields=['country_norm', 'category_code'], name='lassa_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafever',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='lassa_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafever',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='lassa_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(fields=['country_norm', 'category_code'], name='lassadistrict_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='lassadistrict_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='lassadistrict_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='marburg',
+            index=models.Index(fields=['country_norm', 'category_code'], name='marburg_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='marburg',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='marburg_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='marburg',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='marburg_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitis',
+            index=models.Index(fields=['country_norm', 'category_code'], name='meningitis_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitis',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='meningitis_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitiseelimination',
+            index=models.Index(fields=['country_norm', 'category_code'], name='meningitiselim_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitiseelimination',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='meningitiselim_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitiseelimination',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='meningitiselim_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='mpox',
+            index=models.Index(fields=['country_norm', 'category_code'], name='mpox_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='mpox',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='mpox_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='mpox',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='mpox_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(fields=['country_norm', 'category_code'], name='mpoxdistrict_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='mpoxdistrict_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='mpoxdistrict_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='naturaldisaster',
+            index=models.Index(fields=['country_norm', 'category_code'], name='naturaldisaster_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='naturaldisaster',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='naturaldisaster_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='naturaldisaster',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='naturaldisaster_country_period'),
+        ),
+        migrations.AddIndex(
+            model_name='riftvalleyfever',
+            index=models.Index(fields=['country_norm', 'category_code'], name='riftvalley_country_cat'),
+        ),
+        migrations.AddIndex(
+            model_name='riftvalleyfever',
+            index=models.Index(condition=models.Q(('question_score__gt', 0)), fields=['country_norm', 'category_code'], name='riftvalley_answered'),
+        ),
+        migrations.AddIndex(
+            model_name='riftvalleyfever',
+            index=models.Index(fields=['country_norm', 'data_period_id'], name='riftvalley_country_period'),
+        ),
+    ]
@@ -0,0 +1,424 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from readiness.models import dictionary_digest, dictionary_text
+
+
+# Readiness model name -> hazard key
+READINESS_MODELS = {
+    'arbovirus': 'arbovirus', 'cholera': 'cholera', 'cholerasubnational': 'cholerasubnational',
+    'cyclone': 'cyclone', 'fvd': 'fvd', 'fvdpoe': 'fvdpoe', 'lassafever': 'lassafever',
+    'lassafeverdistrict': 'lassafeverdistrict', 'marburg': 'marburg', 'meningitis': 'meningitis',
+    'meningitiseelimination': 'meningitiseelimination', 'mpox': 'mpox', 'mpoxdistrict': 'mpoxdistrict',
+    'naturaldisaster': 'naturaldisaster', 'riftvalleyfever': 'riftvalley',
+}
+QUESTION_FIELDS = ['question_key', 'language', 'question', 'question_language']
+CATEGORY_FIELDS = ['category_code', 'category', 'category_language']
+
+
+def populate_dictionaries(apps, schema_editor):
+    # One dictionary entry and one UPDATE per distinct text combination
+    for model_name, hazard in READINESS_MODELS.items():
+        model = apps.get_model('readiness', model_name)
+        for dictionary_name, fields, ref in (
+            ('ReadinessQuestion', QUESTION_FIELDS, 'question_ref'),
+            ('ReadinessCategory', CATEGORY_FIELDS, 'category_ref'),
+        ):
+            dictionary = apps.get_model('readiness', dictionary_name)
+            for values in model.objects.values(*fields).distinct():
+                # Same digest and canonical texts as the loaders, so a later load reuses the entry
+                entry, _ = dictionary.objects.get_or_create(
+                    hazard=hazard, digest=dictionary_digest(values, fields),
+                    defaults={field: dictionary_text(value) or None for field, value in values.items()},
+                )
+                model.objects.filter(**{
+                    field if value is not None else f'{field}__isnull': value if value is not None else True
+                    for field, value in values.items()
+                }).update(**{ref: entry})
+
+
+def restore_texts(apps, schema_editor):
+    # Reversed after the text columns are added back: one UPDATE per dictionary entry
+    for model_name, hazard in READINESS_MODELS.items():
+        model = apps.get_model('readiness', model_name)
+        for dictionary_name, fields, ref in (
+            ('ReadinessQuestion', ['question', 'question_language'], 'question_ref'),
+            ('ReadinessCategory', ['category_language'], 'category_ref'),
+        ):
+            dictionary = apps.get_model('readiness', dictionary_name)
+            for entry in dictionary.objects.filter(hazard=hazard).values('id', *fields):
+                model.objects.filter(**{ref: entry.pop('id')}).update(**entry)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0010_readiness_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadinessCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hazard', models.CharField(max_length=50)),
+                ('digest', models.CharField(max_length=40)),
+                ('category_code', models.CharField(blank=True, max_length=255, null=True)),
+                ('category', models.CharField(blank=True, max_length=255, null=True)),
+                ('category_language', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReadinessQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hazard', models.CharField(max_length=50)),
+                ('digest', models.CharField(max_length=40)),
+                ('question_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('language', models.CharField(blank=True, max_length=100, null=True)),
+                ('question', models.TextField(blank=True, null=True)),
+                ('question_language', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='readinessquestion',
+            constraint=models.UniqueConstraint(fields=('hazard', 'digest'), name='readiness_question_digest'),
+        ),
+        migrations.AddConstraint(
+            model_name='readinesscategory',
+            constraint=models.UniqueConstraint(fields=('hazard', 'digest'), name='readiness_category_digest'),
+        ),
+        migrations.AddField(
+            model_name='arbovirus',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='arbovirus',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='cholera',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='cholera',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='cyclone',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='cyclone',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='fvd',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='fvd',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='lassafever',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='lassafever',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='marburg',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='marburg',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='meningitis',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='meningitis',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='meningitiseelimination',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='meningitiseelimination',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='mpox',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='mpox',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='naturaldisaster',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='naturaldisaster',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.AddField(
+            model_name='riftvalleyfever',
+            name='category_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscategory'),
+        ),
+        migrations.AddField(
+            model_name='riftvalleyfever',
+            name='question_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinessquestion'),
+        ),
+        migrations.RunPython(populate_dictionaries, restore_texts),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='question_language',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='category_language',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='question',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='question_language',
+        ),
+    ]
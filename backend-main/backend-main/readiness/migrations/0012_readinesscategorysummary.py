@@ -0,0 +1,37 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:31
+
+from django.db import migrations, models
+
+from readiness.migrations._rollups import reset_rollups
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0011_readiness_dictionaries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadinessCategorySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hazard', models.CharField(max_length=50)),
+                ('country', models.CharField(blank=True, max_length=100, null=True)),
+                ('country_norm', models.CharField(blank=True, max_length=100, null=True)),
+                ('data_period', models.CharField(blank=True, max_length=100, null=True)),
+                ('category_code', models.CharField(blank=True, max_length=255, null=True)),
+                ('category', models.CharField(blank=True, max_length=255, null=True)),
+                ('total_questions', models.IntegerField(default=0)),
+                ('answered_questions', models.IntegerField(default=0)),
+                ('completion_pct', models.FloatField(default=0)),
+                ('weighted_score_sum', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['hazard', 'country_norm'], name='readiness_category_lookup')],
+            },
+        ),
+        # Rebuilt after migrate, now filling both rollups
+        migrations.RunPython(reset_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:32
+
+from django.db import migrations, models
+
+from readiness.migrations._rollups import reset_rollups
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0012_readinesscategorysummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readinesscategorysummary',
+            name='category_score_sum',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='readinesscategorysummary',
+            name='category_weight',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='readinesscategorysummary',
+            name='no_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='readinesscategorysummary',
+            name='yes_count',
+            field=models.IntegerField(default=0),
+        ),
+        # Existing category rollups have no yes/no counts or category scores
+        migrations.RunPython(reset_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:35
+
+from django.db import migrations, models
+
+from readiness.migrations._rollups import reset_rollups
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0013_category_scorecard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readinesssummary',
+            name='district_norm',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='readinesssummary',
+            name='poe_name',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholerasubnational',
+            name='district_norm',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvdpoe',
+            name='district_norm',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafeverdistrict',
+            name='district_norm',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpoxdistrict',
+            name='district_norm',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(fields=['country_norm', 'district_norm'], name='cholerasub_district'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(fields=['country_norm', 'district_norm', 'poe_name'], name='fvdpoe_district'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(fields=['country_norm', 'district_norm'], name='lassadistrict_district'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(fields=['country_norm', 'district_norm'], name='mpoxdistrict_district'),
+        ),
+        # Existing rollups are grouped by district name only; rebuild them per district and PoE
+        migrations.RunPython(reset_rollups, migrations.RunPython.noop),
+    ]
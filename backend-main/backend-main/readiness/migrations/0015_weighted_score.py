@@ -0,0 +1,394 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:36
+
+from django.db import migrations, models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+
+from readiness.migrations._rollups import reset_rollups
+
+
+READINESS_MODELS = [
+    'ArboVirus', 'Cholera', 'CholeraSubNational', 'Cyclone', 'FVD', 'FVDPoE', 'LassaFever',
+    'LassaFeverDistrict', 'Marburg', 'Meningitis', 'MeningitiseElimination', 'Mpox',
+    'MpoxDistrict', 'NaturalDisaster', 'RiftValleyFever',
+]
+
+
+def fill_weighted_score(apps, schema_editor):
+    for name in READINESS_MODELS:
+        apps.get_model('readiness', name).objects.update(
+            weighted_score=Coalesce(F('question_score'), Value(0.0)) * Coalesce(F('question_category_weight'), Value(0.0))
+        )
+    # Resetting the rollups bumps the version of every summarised hazard, so clients drop responses with the
+    # old Decimal strings
+    reset_rollups(apps, schema_editor)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0014_readiness_drilldown'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arbovirus',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cholera',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cyclone',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='fvd',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='lassafever',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='marburg',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meningitis',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='meningitiseelimination',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='mpox',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='naturaldisaster',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='riftvalleyfever',
+            name='weighted_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='arbovirus',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='arbovirus',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='arbovirus',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholera',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholera',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholera',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholerasubnational',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholerasubnational',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cholerasubnational',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cyclone',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cyclone',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='cyclone',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvd',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvd',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvd',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvdpoe',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvdpoe',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='fvdpoe',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafever',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafever',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafever',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafeverdistrict',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafeverdistrict',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lassafeverdistrict',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='marburg',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='marburg',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='marburg',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitis',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitis',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitis',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitiseelimination',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitiseelimination',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meningitiseelimination',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpox',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpox',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpox',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpoxdistrict',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpoxdistrict',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpoxdistrict',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='naturaldisaster',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='naturaldisaster',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='naturaldisaster',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='riftvalleyfever',
+            name='category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='riftvalleyfever',
+            name='question_category_weight',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AlterField(
+            model_name='riftvalleyfever',
+            name='question_score',
+            field=models.FloatField(blank=True, default=0, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='arbovirus',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='arbovirus_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='cholera',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='cholera_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='cholerasub_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='cyclone',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='cyclone_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='fvd',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='fvd_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='fvdpoe_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafever',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='lassa_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='lassadistrict_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='marburg',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='marburg_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitis',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='meningitis_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitiseelimination',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='meningitiselim_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='mpox',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='mpox_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='mpoxdistrict_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='naturaldisaster',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='naturaldisaster_weighted'),
+        ),
+        migrations.AddIndex(
+            model_name='riftvalleyfever',
+            index=models.Index(fields=['country_norm', 'weighted_score'], name='riftvalley_weighted'),
+        ),
+        migrations.RunPython(fill_weighted_score, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.4 on 2026-10-19 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0015_weighted_score'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='arbovirus',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm'], name='arbovirus_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='cholera',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='cholera_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='cholerasubnational',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='cholerasub_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='cyclone',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='cyclone_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='fvd',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='fvd_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='fvdpoe',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='fvdpoe_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafever',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='lassa_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='lassafeverdistrict',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='lassadistrict_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='marburg',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='marburg_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitis',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm'], name='meningitis_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='meningitiseelimination',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='meningitiselim_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='mpox',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='mpox_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='mpoxdistrict',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='mpoxdistrict_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='naturaldisaster',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='naturaldisaster_gaps'),
+        ),
+        migrations.AddIndex(
+            model_name='riftvalleyfever',
+            index=models.Index(condition=models.Q(('national_yn', 'no')), fields=['country_norm', 'data_period'], name='riftvalley_gaps'),
+        ),
+    ]
@@ -0,0 +1,354 @@
+# Generated by Django 4.2.4 on 2026-10-19 16:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from readiness.models import dictionary_digest, dictionary_text
+
+
+# Readiness model name -> hazard key
+READINESS_MODELS = {
+    'arbovirus': 'arbovirus', 'cholera': 'cholera', 'cholerasubnational': 'cholerasubnational',
+    'cyclone': 'cyclone', 'fvd': 'fvd', 'fvdpoe': 'fvdpoe', 'lassafever': 'lassafever',
+    'lassafeverdistrict': 'lassafeverdistrict', 'marburg': 'marburg', 'meningitis': 'meningitis',
+    'meningitiseelimination': 'meningitiseelimination', 'mpox': 'mpox', 'mpoxdistrict': 'mpoxdistrict',
+    'naturaldisaster': 'naturaldisaster', 'riftvalleyfever': 'riftvalley',
+}
+DICTIONARIES = (
+    ('ReadinessQuestion', ['question_key', 'language', 'question', 'question_language'], 'question_ref'),
+    ('ReadinessCategory', ['category_code', 'category', 'category_language'], 'category_ref'),
+)
+
+
+def merge_entries(apps, hazard, model, dictionary_name, fields, ref):
+    """
+    Re-digest a hazard's entries with the canonical texts and merge the ones
+    that now share a digest (e.g. 'nan' and an empty cell) into the oldest
+    """
+    dictionary = apps.get_model('readiness', dictionary_name)
+    kept = {}
+    for entry in dictionary.objects.filter(hazard=hazard).order_by('id'):
+        digest = dictionary_digest({field: getattr(entry, field) for field in fields}, fields)
+        if digest in kept:
+            model.objects.filter(**{ref: entry}).update(**{ref: kept[digest]})
+            entry.delete()
+        else:
+            kept[digest] = entry
+    # Saved once the duplicates are gone, so no entry takes a digest another one still holds
+    for digest, entry in kept.items():
+        for field in fields:
+            setattr(entry, field, dictionary_text(getattr(entry, field)) or None)
+        entry.digest = digest
+        entry.save()
+
+
+def move_texts_to_dictionaries(apps, schema_editor):
+    # Category names and languages are already held by the category and question entries;
+    # comments get their own entries, one UPDATE per distinct comment
+    comment_dictionary = apps.get_model('readiness', 'ReadinessComment')
+    for model_name, hazard in READINESS_MODELS.items():
+        model = apps.get_model('readiness', model_name)
+        for dictionary_name, fields, ref in DICTIONARIES:
+            merge_entries(apps, hazard, model, dictionary_name, fields, ref)
+        for comments in model.objects.exclude(comments__isnull=True).values_list('comments', flat=True).distinct():
+            if not dictionary_text(comments):
+                continue
+            entry, _ = comment_dictionary.objects.get_or_create(
+                hazard=hazard, digest=dictionary_digest({'comments': comments}, ['comments']),
+                defaults={'comments': comments},
+            )
+            model.objects.filter(comments=comments).update(comment_ref=entry)
+
+
+def restore_texts(apps, schema_editor):
+    # Reversed after the text columns are added back: one UPDATE per dictionary entry
+    for model_name, hazard in READINESS_MODELS.items():
+        model = apps.get_model('readiness', model_name)
+        for dictionary_name, fields, ref in (
+            ('ReadinessQuestion', ['language'], 'question_ref'),
+            ('ReadinessCategory', ['category'], 'category_ref'),
+            ('ReadinessComment', ['comments'], 'comment_ref'),
+        ):
+            dictionary = apps.get_model('readiness', dictionary_name)
+            for entry in dictionary.objects.filter(hazard=hazard).values('id', *fields):
+                model.objects.filter(**{ref: entry.pop('id')}).update(**entry)
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('readiness', '0016_readiness_gaps_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadinessComment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hazard', models.CharField(max_length=50)),
+                ('digest', models.CharField(max_length=40)),
+                ('comments', models.TextField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='readinesscomment',
+            constraint=models.UniqueConstraint(fields=('hazard', 'digest'), name='readiness_comment_digest'),
+        ),
+        migrations.AddField(
+            model_name='arbovirus',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='cholera',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='cholerasubnational',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='cyclone',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='fvd',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='fvdpoe',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='lassafever',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='lassafeverdistrict',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='marburg',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='meningitis',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='meningitiseelimination',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='mpox',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='mpoxdistrict',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='naturaldisaster',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.AddField(
+            model_name='riftvalleyfever',
+            name='comment_ref',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='readiness.readinesscomment'),
+        ),
+        migrations.RunPython(move_texts_to_dictionaries, restore_texts),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='arbovirus',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='cholera',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='cholerasubnational',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='cyclone',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='fvd',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='fvdpoe',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='lassafever',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='lassafeverdistrict',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='marburg',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='meningitis',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='meningitiseelimination',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='mpox',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='mpoxdistrict',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='naturaldisaster',
+            name='language',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='comments',
+        ),
+        migrations.RemoveField(
+            model_name='riftvalleyfever',
+            name='language',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Shared by the readiness migrations; the leading underscore keeps the migration loader from picking it up
+from django.db.models import F
+from django.utils import timezone
+
+
+def reset_rollups(apps, schema_editor):
+    # Drop both rollups and bump the version of every hazard that had them, so cached responses
+    # built from the old rollups are not served again. Hazards with rows are re-summarised after
+    # migrate (ReadinessConfig runs ensure_readiness_summary), which rebuilds both rollups.
+    summary = apps.get_model('readiness', 'ReadinessSummary')
+    hazards = set(summary.objects.values_list('hazard', flat=True).distinct())
+    summary.objects.all().delete()
+    try:
+        category_summary = apps.get_model('readiness', 'ReadinessCategorySummary')
+    except LookupError:
+        # Migrations before 0012 have no category rollup yet
+        pass
+    else:
+        hazards.update(category_summary.objects.values_list('hazard', flat=True).distinct())
+        category_summary.objects.all().delete()
+    apps.get_model('readiness', 'DatasetVersion').objects.filter(dataset__in=hazards).update(
+        version=F('version') + 1, updated_at=timezone.now(),
+    )
@@ -1,22 +1,110 @@
-from django.db import models
+import hashlib
+import math
+import re
+from contextlib import contextmanager
+
+from django.db import models, transaction
+from django.utils import timezone
+
+
+def normalize_key(value):
+    """Lookup key for country and district names: trimmed and lower-cased"""
+    if value is None:
+        return None
+    return str(value).strip().lower()
+
+
+DATA_PERIOD_RE = re.compile(r'^(\d{4})(?:[-_ ]?([QSHM])(\d{1,2}))?$', re.IGNORECASE)
+# First month of each sub-year period: Q1-Q4, S1/H1-S2/H2, M1-M12
+DATA_PERIOD_MONTHS = {'Q': 3, 'S': 6, 'H': 6, 'M': 1}
+
+
+def data_period_key(label):
+    """
+    Chronological sort key of a data period label (2024, 2024-Q1, 2025-S1),
+    or None when the label is not a period, e.g. the 'nan' written for
+    empty CSV cells. A year sorts before its quarters and halves.
+    """
+    match = DATA_PERIOD_RE.match(str(label).strip()) if label is not None else None
+    if match is None:
+        return None
+    year, unit, number = match.groups()
+    if unit is None:
+        return (int(year), 0, str(label))
+    return (int(year), (int(number) - 1) * DATA_PERIOD_MONTHS[unit.upper()] + 1, str(label))
+
+
+def latest_data_period(labels):
+    """Latest of ``labels`` by data_period_key, or None when none of them is a period"""
+    return max((label for label in labels if data_period_key(label)), key=data_period_key, default=None)
+
+
+def dictionary_text(value):
+    """
+    Canonical string form of a dictionary text. Missing values - None, NaN,
+    the 'nan' written for empty CSV cells and blank strings - are all ''.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    text = str(value)
+    return '' if text.strip().lower() in ('', 'nan') else text
+
+
+def dictionary_digest(values, fields):
+    """
+    SHA-1 of the canonical texts of ``fields``. The loaders hash pandas
+    values and the migrations hash database strings; both go through
+    dictionary_text so the same texts always get the same digest.
+    """
+    raw = '\x1f'.join(dictionary_text(values.get(field)) for field in fields)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def readiness_indexes(prefix, data_period=True, district=False, poe=False):
+    """
+    Indexes for the readiness hot-path filters. Every filter is keyed on
+    country_norm first, so these also serve plain country lookups.
+    Databases without partial index support skip the answered index.
+    The weighted score index serves top/bottom N questions of a country.
+    The gaps index holds only the unanswered ('no') questions, for the gap
+    analysis.
+    Subnational tables add a country -> district (-> PoE) index for the
+    drill-down.
+    """
+    indexes = [
+        models.Index(fields=['country_norm', 'category_code'], name=f'{prefix}_country_cat'),
+        models.Index(
+            fields=['country_norm', 'category_code'],
+            condition=models.Q(question_score__gt=0),
+            name=f'{prefix}_answered',
+        ),
+        models.Index(fields=['country_norm', 'weighted_score'], name=f'{prefix}_weighted'),
+    ]
+    if data_period:
+        indexes.append(models.Index(fields=['country_norm', 'data_period_id'], name=f'{prefix}_country_period'))
+    indexes.append(models.Index(
+        fields=['country_norm', 'data_period'] if data_period else ['country_norm'],
+        condition=models.Q(national_yn='no'),
+        name=f'{prefix}_gaps',
+    ))
+    if district:
+        fields = ['country_norm', 'district_norm', 'poe_name'] if poe else ['country_norm', 'district_norm']
+        indexes.append(models.Index(fields=fields, name=f'{prefix}_district'))
+    return indexes
+
 
 class BaseReadiness(models.Model):
     key_on_table = models.CharField(max_length=100, unique=True)
     question_id=models.IntegerField(default=0, null=True, blank=True)
     question_key=models.CharField(max_length=255, null=True, blank=True)
-    language=models.CharField(max_length=100, null=True, blank=True)
-    category=models.CharField(max_length=255, null=True, blank=True)
     category_code=models.CharField(max_length=255, null=True, blank=True)
     affects_score=models.IntegerField(default=0, null=True, blank=True)
     category_score=models.IntegerField(default=0, null=True, blank=True)
-    category_weight=models.DecimalField(decimal_places=10, default=0, max_digits=20, null=True, blank=True)
-    question_score=models.DecimalField(decimal_places=10, default=0, max_digits=20, null=True, blank=True)
-    question_category_weight=models.DecimalField(decimal_places=10, default=0, max_digits=20, null=True, blank=True)
-    category_language=models.TextField(null=True, blank=True)
-    question_language=models.TextField(null=True, blank=True)
+    category_weight=models.FloatField(default=0, null=True, blank=True)
+    question_score=models.FloatField(default=0, null=True, blank=True)
+    question_category_weight=models.FloatField(default=0, null=True, blank=True)
     national_yn_value=models.CharField(max_length=255, null=True, blank=True)
     national_yn=models.CharField(max_length=30, null=True, blank=True)
-    comments=models.TextField(blank=True, null=True)
     file_name=models.CharField(max_length=100, null=True, blank=True)
     country=models.CharField(max_length=100, null=True, blank=True)
     admin_level=models.CharField(max_length=100, null=True, blank=True)
@@ -24,14 +112,31 @@ class BaseReadiness(models.Model):
     file_language=models.CharField(max_length=100, null=True, blank=True)
     table=models.CharField(max_length=100, null=True, blank=True)
     row_no=models.IntegerField(default=0, null=True, blank=True)
-    question=models.TextField(null=True, blank=True)
+    # Question, category and comment texts live in the per-hazard dictionaries
+    question_ref=models.ForeignKey('ReadinessQuestion', on_delete=models.PROTECT, null=True, blank=True, related_name='+')
+    category_ref=models.ForeignKey('ReadinessCategory', on_delete=models.PROTECT, null=True, blank=True, related_name='+')
+    comment_ref=models.ForeignKey('ReadinessComment', on_delete=models.PROTECT, null=True, blank=True, related_name='+')
+    # Normalized lookup keys and the weighted score, kept in sync on save
+    country_norm=models.CharField(max_length=100, null=True, blank=True)
+    weighted_score=models.FloatField(default=0)
     
-    @property
-    def weighted_score(self):
+    def get_derived_fields(self):
+        """Columns save() recomputes from the other columns"""
+        fields = ['country_norm', 'weighted_score']
+        return fields + ['district_norm'] if hasattr(self, 'district_norm') else fields
+
+    def save(self, *args, **kwargs):
+        self.country_norm = normalize_key(self.country)
+        if hasattr(self, 'district_norm'):
+            self.district_norm = normalize_key(self.district)
         try:
-            return float(self.question_score or 0) * float(self.question_category_weight or 0)
-        except:
-            return 0
+            self.weighted_score = float(self.question_score or 0) * float(self.question_category_weight or 0)
+        except (TypeError, ValueError):
+            self.weighted_score = 0
+        # update_or_create() (every re-upload) saves only its defaults; write the recomputed columns too
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *self.get_derived_fields()}
+        super().save(*args, **kwargs)
     
     class Meta:
         abstract = True
@@ -39,65 +144,336 @@ class BaseReadiness(models.Model):
 
 
 class ArboVirus(BaseReadiness):
-    pass
+    class Meta:
+        indexes = readiness_indexes('arbovirus', data_period=False)
 
 class Cholera(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('cholera')
+
 class CholeraSubNational(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
     district=models.CharField(max_length=255)
+    district_norm=models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        indexes = readiness_indexes('cholerasub', district=True)
 
 class Cyclone(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
 
+    class Meta:
+        indexes = readiness_indexes('cyclone')
+
 class FVD(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('fvd')
+
 class FVDPoE(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
     district=models.CharField(max_length=255, null=True, blank=True)
+    district_norm=models.CharField(max_length=255, null=True, blank=True)
     poe_name=models.CharField(max_length=255, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('fvdpoe', district=True, poe=True)
+
 class LassaFever(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('lassa')
+
 class LassaFeverDistrict(BaseReadiness):
     has_international_poe=models.IntegerField(default=0, null=True, blank=True)
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
     district=models.CharField(max_length=255, null=True, blank=True)
-    
+    district_norm=models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        indexes = readiness_indexes('lassadistrict', district=True)
+
 class Marburg(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('marburg')
+
 class Meningitis(BaseReadiness):
-    pass
+    class Meta:
+        indexes = readiness_indexes('meningitis', data_period=False)
 
 class MeningitiseElimination(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
 
+    class Meta:
+        indexes = readiness_indexes('meningitiselim')
+
 class Mpox(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
 
+    class Meta:
+        indexes = readiness_indexes('mpox')
+
 class MpoxDistrict(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
     district=models.CharField(max_length=255, null=True, blank=True)
-    
+    district_norm=models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        indexes = readiness_indexes('mpoxdistrict', district=True)
+
 class NaturalDisaster(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
     data_period_id=models.CharField(max_length=100, null=True, blank=True)
-    
+
+    class Meta:
+        indexes = readiness_indexes('naturaldisaster')
+
 class RiftValleyFever(BaseReadiness):
     data_period=models.CharField(max_length=100, null=True, blank=True)
-    data_period_id=models.CharField(max_length=100, null=True, blank=True)
\ No newline at end of file
+    data_period_id=models.CharField(max_length=100, null=True, blank=True)
+
+    class Meta:
+        indexes = readiness_indexes('riftvalley')
+
+# Readiness tables by the hazard key used in URLs and query params
+READINESS_MODELS = {
+    'arbovirus': ArboVirus,
+    'cholera': Cholera,
+    'cholerasubnational': CholeraSubNational,
+    'cyclone': Cyclone,
+    'fvd': FVD,
+    'fvdpoe': FVDPoE,
+    'lassafever': LassaFever,
+    'lassafeverdistrict': LassaFeverDistrict,
+    'marburg': Marburg,
+    'meningitis': Meningitis,
+    'meningitiseelimination': MeningitiseElimination,
+    'mpox': Mpox,
+    'mpoxdistrict': MpoxDistrict,
+    'naturaldisaster': NaturalDisaster,
+    'riftvalley': RiftValleyFever,
+}
+
+
+class ReadinessDictionaryEntry(models.Model):
+    """
+    Text shared by many readiness rows, stored once per hazard. Entries are
+    looked up by a digest of their texts, so identical texts in different
+    files resolve to the same entry.
+    """
+    TEXT_FIELDS = []
+
+    hazard = models.CharField(max_length=50)
+    digest = models.CharField(max_length=40)
+
+    @classmethod
+    def get_digest(cls, values):
+        return dictionary_digest(values, cls.TEXT_FIELDS)
+
+    @classmethod
+    def get_texts(cls, values):
+        """The entry's texts in canonical form, missing ones as None"""
+        return {field: dictionary_text(values.get(field)) or None for field in cls.TEXT_FIELDS}
+
+    class Meta:
+        abstract = True
+
+
+class ReadinessQuestion(ReadinessDictionaryEntry):
+    TEXT_FIELDS = ['question_key', 'language', 'question', 'question_language']
+
+    question_key = models.CharField(max_length=255, null=True, blank=True)
+    language = models.CharField(max_length=100, null=True, blank=True)
+    question = models.TextField(null=True, blank=True)
+    question_language = models.TextField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['hazard', 'digest'], name='readiness_question_digest'),
+        ]
+
+
+class ReadinessCategory(ReadinessDictionaryEntry):
+    TEXT_FIELDS = ['category_code', 'category', 'category_language']
+
+    category_code = models.CharField(max_length=255, null=True, blank=True)
+    category = models.CharField(max_length=255, null=True, blank=True)
+    category_language = models.TextField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['hazard', 'digest'], name='readiness_category_digest'),
+        ]
+
+
+class ReadinessComment(ReadinessDictionaryEntry):
+    TEXT_FIELDS = ['comments']
+
+    comments = models.TextField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['hazard', 'digest'], name='readiness_comment_digest'),
+        ]
+
+
+class ReadinessSummary(models.Model):
+    """
+    Rollup of one readiness table per (hazard, country, district, PoE, data
+    period), refreshed by the loaders for the groups each load touches
+    """
+    hazard = models.CharField(max_length=50)
+    country = models.CharField(max_length=100, null=True, blank=True)
+    country_norm = models.CharField(max_length=100, null=True, blank=True)
+    district = models.CharField(max_length=255, null=True, blank=True)
+    district_norm = models.CharField(max_length=255, null=True, blank=True)
+    poe_name = models.CharField(max_length=255, null=True, blank=True)
+    data_period = models.CharField(max_length=100, null=True, blank=True)
+    total_questions = models.IntegerField(default=0)
+    answered_questions = models.IntegerField(default=0)
+    completion_pct = models.FloatField(default=0)
+    weighted_score_sum = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['hazard', 'country_norm'], name='readiness_summary_lookup'),
+        ]
+
+
+class ReadinessCategorySummary(models.Model):
+    """
+    Rollup of one readiness table per (hazard, country, data period, category
+    code), refreshed together with ReadinessSummary by every load
+    """
+    hazard = models.CharField(max_length=50)
+    country = models.CharField(max_length=100, null=True, blank=True)
+    country_norm = models.CharField(max_length=100, null=True, blank=True)
+    data_period = models.CharField(max_length=100, null=True, blank=True)
+    category_code = models.CharField(max_length=255, null=True, blank=True)
+    category = models.CharField(max_length=255, null=True, blank=True)
+    total_questions = models.IntegerField(default=0)
+    answered_questions = models.IntegerField(default=0)
+    yes_count = models.IntegerField(default=0)
+    no_count = models.IntegerField(default=0)
+    completion_pct = models.FloatField(default=0)
+    weighted_score_sum = models.FloatField(default=0)
+    category_score_sum = models.FloatField(default=0)
+    category_weight = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['hazard', 'country_norm'], name='readiness_category_lookup'),
+        ]
+
+
+class DatasetVersion(models.Model):
+    """Version counter per dataset, bumped by the ingest tasks and used to key response caches"""
+    dataset = models.CharField(max_length=50, unique=True)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def bump(cls, dataset):
+        cls.objects.get_or_create(dataset=dataset)
+        cls.objects.filter(dataset=dataset).update(version=models.F('version') + 1, updated_at=timezone.now())
+
+    @classmethod
+    @contextmanager
+    def loading(cls, dataset):
+        """
+        Run a loader's row writes and the dataset's version bump in one
+        transaction: the version only moves once every row is written, and a
+        load that fails partway leaves rows and version as they were.
+        """
+        with transaction.atomic():
+            yield
+            cls.bump(dataset)
+
+    @classmethod
+    def get_versions(cls, datasets):
+        """Current version of each dataset; datasets never loaded are at 0"""
+        versions = dict(cls.objects.filter(dataset__in=datasets).values_list('dataset', 'version'))
+        return {dataset: versions.get(dataset, 0) for dataset in datasets}
+
+    @classmethod
+    def get_state(cls, datasets):
+        """
+        (ETag, last modified) of a response built from the given datasets, in
+        one query. The last modified time is None until one of them is loaded.
+        """
+        rows = dict(
+            (dataset, (version, updated_at))
+            for dataset, version, updated_at in
+            cls.objects.filter(dataset__in=datasets).values_list('dataset', 'version', 'updated_at')
+        )
+        tag = ','.join(f"{dataset}:{rows.get(dataset, (0, None))[0]}" for dataset in sorted(set(datasets)))
+        etag = '"%s"' % hashlib.sha1(tag.encode()).hexdigest()[:20]
+        last_modified = max((updated_at for _, updated_at in rows.values()), default=None)
+        return etag, last_modified
+
+
+class SignalEvent(models.Model):
+    """WHO signal intelligence event (PHE, SIGNAL, RRA, EIS) loaded from the signal CSVs"""
+    key_on_table = models.CharField(max_length=150, unique=True)
+    event_id = models.CharField(max_length=100, null=True, blank=True)
+    event_type = models.CharField(max_length=30)
+    country = models.CharField(max_length=100, null=True, blank=True)
+    lat = models.FloatField(default=0)
+    lon = models.FloatField(default=0)
+    disease = models.CharField(max_length=255, null=True, blank=True)
+    grade = models.CharField(max_length=30, default='Ungraded')
+    status = models.CharField(max_length=30, default='Ongoing')
+    description = models.TextField(null=True, blank=True)
+    year = models.IntegerField(null=True, blank=True)
+    report_date = models.DateField(null=True, blank=True)
+    cases = models.IntegerField(default=0)
+    deaths = models.IntegerField(default=0)
+    source_file = models.CharField(max_length=100, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['country', 'disease', 'report_date'], name='signal_country_disease_date'),
+            models.Index(fields=['grade'], name='signal_grade_idx'),
+            models.Index(fields=['status'], name='signal_status_idx'),
+        ]
+
+    def as_event(self):
+        """Same shape as the events WHODataParser builds from the signal CSVs"""
+        return {
+            'id': self.event_id,
+            'country': self.country,
+            'lat': self.lat,
+            'lon': self.lon,
+            'disease': self.disease,
+            'grade': self.grade,
+            'eventType': self.event_type,
+            'status': self.status,
+            'description': self.description,
+            'year': self.year,
+            'reportDate': self.report_date.isoformat() if self.report_date else None,
+            'cases': self.cases,
+            'deaths': self.deaths,
+            'source': 'WHO',
+            'dataType': 'signal',
+            'sourceFile': self.source_file,
+            'source_priority': 1,
+        }
@@ -1,78 +1,88 @@
 from rest_framework import serializers
 from .models import *
 
-class ArbovirusSerializer(serializers.ModelSerializer):
+class BaseReadinessSerializer(serializers.ModelSerializer):
+    """Expands the question, category and comment dictionary entries referenced by a readiness row"""
+    language = serializers.CharField(source='question_ref.language', read_only=True, allow_null=True)
+    question = serializers.CharField(source='question_ref.question', read_only=True, allow_null=True)
+    question_language = serializers.CharField(source='question_ref.question_language', read_only=True, allow_null=True)
+    category = serializers.CharField(source='category_ref.category', read_only=True, allow_null=True)
+    category_language = serializers.CharField(source='category_ref.category_language', read_only=True, allow_null=True)
+    comments = serializers.CharField(source='comment_ref.comments', read_only=True, allow_null=True)
+
+
+class ArbovirusSerializer(BaseReadinessSerializer):
     class Meta:
         model=ArboVirus
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class CholeraSerializer(serializers.ModelSerializer):
+class CholeraSerializer(BaseReadinessSerializer):
     class Meta:
         model=Cholera
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class CholeraSubNationalSerializer(serializers.ModelSerializer):
+class CholeraSubNationalSerializer(BaseReadinessSerializer):
     class Meta:
         model=CholeraSubNational
-        fields = "__all__"
+        exclude = ['country_norm', 'district_norm']
         
-class CycloneSerializer(serializers.ModelSerializer):
+class CycloneSerializer(BaseReadinessSerializer):
     class Meta:
         model=Cyclone
-        fields = "__all__"
+        exclude = ['country_norm']
         
 
-class FVDSerializer(serializers.ModelSerializer):
+class FVDSerializer(BaseReadinessSerializer):
     class Meta:
         model=FVD
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class FVDPoESerializer(serializers.ModelSerializer):
+class FVDPoESerializer(BaseReadinessSerializer):
     class Meta:
         model=FVDPoE
-        fields = "__all__"
+        exclude = ['country_norm', 'district_norm']
         
-class LassaFeverSerializer(serializers.ModelSerializer):
+class LassaFeverSerializer(BaseReadinessSerializer):
     class Meta:
         model=LassaFever
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class LassaFeverDistrictSerializer(serializers.ModelSerializer):
+class LassaFeverDistrictSerializer(BaseReadinessSerializer):
     class Meta:
         model=LassaFeverDistrict
-        fields = "__all__"
+        exclude = ['country_norm', 'district_norm']
         
-class MarburgSerializer(serializers.ModelSerializer):
+class MarburgSerializer(BaseReadinessSerializer):
     class Meta:
         model=Marburg
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class MeningitisSerializer(serializers.ModelSerializer):
+class MeningitisSerializer(BaseReadinessSerializer):
     class Meta:
         model=Meningitis
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class MeningitisEliminationSerializer(serializers.ModelSerializer):
+class MeningitisEliminationSerializer(BaseReadinessSerializer):
     class Meta:
         model=MeningitiseElimination
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class MpoxSerializer(serializers.ModelSerializer):
+class MpoxSerializer(BaseReadinessSerializer):
     class Meta:
         model=Mpox
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class MpoxDistrictSerializer(serializers.ModelSerializer):
+class MpoxDistrictSerializer(BaseReadinessSerializer):
     class Meta:
         model=MpoxDistrict
-        fields = "__all__"
+        exclude = ['country_norm', 'district_norm']
 
-class NaturalDisasterSerializer(serializers.ModelSerializer):
+class NaturalDisasterSerializer(BaseReadinessSerializer):
     class Meta:
         model=NaturalDisaster
-        fields = "__all__"
+        exclude = ['country_norm']
         
-class RiftValleySerializer(serializers.ModelSerializer):
+class RiftValleySerializer(BaseReadinessSerializer):
     class Meta:
         model=RiftValleyFever
-        fields = "__all__"
\ No newline at end of file
+        exclude = ['country_norm']
\ No newline at end of file
@@ -1,8 +1,14 @@
+import os
+from contextlib import contextmanager
 from django.core.files.storage import default_storage
 import pandas as pd
 from celery import shared_task
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
 from .models import *
 from utils.index import *
+from utils.storage import read_storage_csv
+from utils.who_data_parser import WHODataParser
 from utils.constants import *
 
 def snake_case(name: str) -> str:
@@ -35,198 +41,410 @@ def extract_base_data(row, extra_fields=[]):
     return {snake_case(f): row.get(f, None) for f in fields}
 
 
+class ReadinessDictionary:
+    """
+    Resolves the question, category and comment texts of extracted rows to
+    the hazard's dictionary entries during one load. Each distinct text costs
+    one lookup per load; rows keep only the entry ids. Rows without a
+    comment reference no comment entry.
+    """
+
+    def __init__(self, hazard):
+        self.hazard = hazard
+        self.entries = {ReadinessQuestion: {}, ReadinessCategory: {}, ReadinessComment: {}}
+
+    def resolve(self, data):
+        data['question_ref'] = self._get_entry(ReadinessQuestion, data)
+        data['category_ref'] = self._get_entry(ReadinessCategory, data)
+        data['comment_ref'] = self._get_entry(ReadinessComment, data) if dictionary_text(data.get('comments')) else None
+        for model in self.entries:
+            for field in model.TEXT_FIELDS:
+                if field not in ('question_key', 'category_code'):
+                    data.pop(field, None)
+        return data
+
+    def _get_entry(self, model, data):
+        digest = model.get_digest(data)
+        entries = self.entries[model]
+        if digest not in entries:
+            entries[digest], _ = model.objects.get_or_create(
+                hazard=self.hazard, digest=digest, defaults=model.get_texts(data)
+            )
+        return entries[digest]
+
+
+def summarise_readiness(queryset, group_fields, **names):
+    """
+    Totals, answered questions and weighted score sum of a readiness table
+    per ``group_fields``, in one GROUP BY query. ``names`` adds Min() of
+    other columns (e.g. the display name of a normalized key).
+    """
+    return (
+        queryset
+        .values(*group_fields)
+        .annotate(
+            total=Count('id'),
+            answered=Count('id', filter=Q(question_score__gt=0)),
+            weighted=Sum('weighted_score'),
+            **{name: Min(field) for name, field in names.items()},
+        )
+        .order_by()
+    )
+
+
+def readiness_group_filter(groups, period_fields):
+    """
+    Q selecting the rows of the given (country_norm, data_period) groups, for
+    a readiness table or its rollups. Countries and periods are matched
+    separately, which may select a few more groups than given; the rollup
+    refresh deletes and rebuilds the same selection, so that is harmless.
+    """
+    def in_filter(field, values):
+        q = Q(**{f'{field}__in': [value for value in values if value is not None]})
+        return q | Q(**{f'{field}__isnull': True}) if None in values else q
+
+    q = in_filter('country_norm', {country for country, _ in groups})
+    if period_fields:
+        q &= in_filter('data_period', {period for _, period in groups})
+    return q
+
+
+def refresh_readiness_summary(hazard, groups=None):
+    """
+    Rebuild the ReadinessSummary rows (per country, district, PoE and data
+    period) and ReadinessCategorySummary rows (per country, data period and
+    category) of one hazard from its table, and bump the hazard's
+    DatasetVersion. With ``groups``, a set of (country_norm, data_period)
+    pairs, only those groups are recomputed.
+    """
+    model = READINESS_MODELS[hazard]
+    field_names = {field.name for field in model._meta.get_fields()}
+    district_fields = [name for name in ('district_norm', 'poe_name') if name in field_names]
+    period_fields = ['data_period'] if 'data_period' in field_names else []
+    group_fields = ['country_norm', *district_fields, *period_fields]
+    district_names = {'district_name': 'district'} if 'district' in field_names else {}
+
+    rows = model.objects.all()
+    summary = ReadinessSummary.objects.filter(hazard=hazard)
+    category_summary = ReadinessCategorySummary.objects.filter(hazard=hazard)
+    if groups is not None:
+        if not groups:
+            DatasetVersion.bump(hazard)
+            return 0
+        scope = readiness_group_filter(groups, period_fields)
+        rows, summary, category_summary = rows.filter(scope), summary.filter(scope), category_summary.filter(scope)
+
+    summaries = [
+        ReadinessSummary(
+            hazard=hazard,
+            country=row['country_name'],
+            country_norm=row['country_norm'],
+            district=row.get('district_name'),
+            district_norm=row.get('district_norm'),
+            poe_name=row.get('poe_name'),
+            data_period=row.get('data_period'),
+            total_questions=row['total'],
+            answered_questions=row['answered'],
+            completion_pct=(row['answered'] / row['total']) * 100 if row['total'] else 0,
+            weighted_score_sum=float(row['weighted'] or 0),
+        )
+        for row in summarise_readiness(rows, group_fields, country_name='country', **district_names)
+    ]
+    category_summaries = [
+        ReadinessCategorySummary(
+            hazard=hazard,
+            country=row['country_name'],
+            country_norm=row['country_norm'],
+            data_period=row.get('data_period'),
+            category_code=row['category_code'],
+            category=row['category_name'],
+            total_questions=row['total'],
+            answered_questions=row['answered'],
+            yes_count=row['yes'],
+            no_count=row['no'],
+            completion_pct=(row['answered'] / row['total']) * 100 if row['total'] else 0,
+            weighted_score_sum=float(row['weighted'] or 0),
+            category_score_sum=float(row['category_score'] or 0),
+            category_weight=float(row['category_weight'] or 0),
+        )
+        for row in summarise_readiness(
+            rows, ['country_norm', *period_fields, 'category_code'],
+            country_name='country', category_name='category_ref__category',
+        ).annotate(
+            yes=Count('id', filter=Q(national_yn='yes')),
+            no=Count('id', filter=Q(national_yn='no')),
+            category_score=Sum('category_score'),
+            category_weight=Max('category_weight'),
+        )
+    ]
+
+    with transaction.atomic():
+        summary.delete()
+        ReadinessSummary.objects.bulk_create(summaries, batch_size=500)
+        category_summary.delete()
+        ReadinessCategorySummary.objects.bulk_create(category_summaries, batch_size=500)
+        DatasetVersion.bump(hazard)
+    return len(summaries)
+
+
+def ensure_readiness_summary(hazards):
+    """
+    Summarise hazards that have no rollup rows yet, e.g. tables loaded before
+    the rollup existed or whose rollups a migration reset. Run after
+    ``migrate`` (see ReadinessConfig), never on the request path. Unknown
+    hazard keys are ignored.
+    """
+    summarised = set(
+        ReadinessSummary.objects.filter(hazard__in=hazards).values_list('hazard', flat=True).distinct()
+    )
+    for hazard in hazards:
+        if hazard in READINESS_MODELS and hazard not in summarised and READINESS_MODELS[hazard].objects.exists():
+            refresh_readiness_summary(hazard)
+
+
+class ReadinessLoad:
+    """
+    Row writes of one loader run. Records the (country_norm, data_period)
+    group of every row it writes, both the group a row had before the write
+    and the one it has after, so the rollups of both are refreshed.
+    """
+
+    def __init__(self, hazard):
+        self.hazard = hazard
+        self.model = READINESS_MODELS[hazard]
+        self.has_period = any(field.name == 'data_period' for field in self.model._meta.get_fields())
+        self.groups = set()
+        # Groups of the rows already stored, read once instead of once per row
+        columns = ['key_on_table', 'country_norm'] + (['data_period'] if self.has_period else [])
+        self.stored = {
+            key: (country_norm, period[0] if period else None)
+            for key, country_norm, *period in self.model.objects.values_list(*columns)
+        }
+
+    def update_or_create(self, key_on_table, defaults):
+        if key_on_table in self.stored:
+            self.groups.add(self.stored[key_on_table])
+        row, created = self.model.objects.update_or_create(key_on_table=key_on_table, defaults=defaults)
+        self.groups.add((row.country_norm, row.data_period if self.has_period else None))
+        return row, created
+
+
+@contextmanager
+def readiness_load(hazard):
+    """
+    Run a loader's row writes, the refresh of the rollup groups they touched
+    and the hazard's version bump in one transaction. A load that fails
+    partway leaves rows, rollups and version as they were.
+    """
+    with transaction.atomic():
+        load = ReadinessLoad(hazard)
+        yield load
+        refresh_readiness_summary(hazard, load.groups)
+
+
 @shared_task
 def load_arbovirus(file_path):
     print("START LOADING ARBOVIRUS")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row)
-        unique_key = gen_unique_key('arbovirus', idx)
+    dictionary = ReadinessDictionary('arbovirus')
+    with readiness_load('arbovirus') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row))
+            unique_key = gen_unique_key('arbovirus', idx)
 
-        ArboVirus.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING ARBOVIRUS")
     
 
 @shared_task
 def load_cholera(file_path):
     print("START LOADING CHOLERA")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('cholera', idx)
+    dictionary = ReadinessDictionary('cholera')
+    with readiness_load('cholera') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('cholera', idx)
 
-        Cholera.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING CHOLERA")
     
 
 @shared_task
 def load_cholerasubnational(file_path):
     print("START LOADING CHOLERA SUBNATIONAL")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId", "District"])
-        unique_key = gen_unique_key('cholerasubnational', idx)
+    dictionary = ReadinessDictionary('cholerasubnational')
+    with readiness_load('cholerasubnational') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId", "District"]))
+            unique_key = gen_unique_key('cholerasubnational', idx)
 
-        CholeraSubNational.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING CHOLERA SUBNATIONAL")
     
 
 @shared_task
 def load_cyclone(file_path):
     print("START LOADING CYCLONE")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('cyclone', idx)
+    dictionary = ReadinessDictionary('cyclone')
+    with readiness_load('cyclone') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('cyclone', idx)
 
-        Cyclone.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING CYCLONE")
     
 
 @shared_task
 def load_fvd(file_path):
     print("START LOADING FVD")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('fvd', idx)
+    dictionary = ReadinessDictionary('fvd')
+    with readiness_load('fvd') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('fvd', idx)
 
-        FVD.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING FVD")
     
 
 @shared_task
 def load_fvdpoe(file_path):
     print("START LOADING FVDPoE")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId", "District", "PoEName"])
-        unique_key = gen_unique_key('fvdpoe', idx)
+    dictionary = ReadinessDictionary('fvdpoe')
+    with readiness_load('fvdpoe') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId", "District", "PoEName"]))
+            unique_key = gen_unique_key('fvdpoe', idx)
 
-        FVDPoE.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING FVDPoE")
     
     
 @shared_task
 def load_lassafever(file_path):
     print("START LOADING LASSAFEVER")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('lassafever', idx)
+    dictionary = ReadinessDictionary('lassafever')
+    with readiness_load('lassafever') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('lassafever', idx)
 
-        LassaFever.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING LASSAFEVER")
     
     
 @shared_task
 def load_lassafeverdistrict(file_path):
     print("START LOADING LASSAFEVERDISTRICT")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId", "HasInternationalPOE", "District"])
-        unique_key = gen_unique_key('lassafeverdistrict', idx)
+    dictionary = ReadinessDictionary('lassafeverdistrict')
+    with readiness_load('lassafeverdistrict') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId", "HasInternationalPOE", "District"]))
+            unique_key = gen_unique_key('lassafeverdistrict', idx)
 
-        LassaFeverDistrict.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING LASSAFEVERDISTRICT")
     
 
 @shared_task
 def load_marburg(file_path):
     print("START LOADING MARBURG")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('marbug', idx)
+    dictionary = ReadinessDictionary('marburg')
+    with readiness_load('marburg') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('marbug', idx)
 
-        Marburg.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING MARBURG")
     
 
 @shared_task
 def load_meningitis(file_path):
     print("START LOADING Meningitis")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row)
-        unique_key = gen_unique_key('meningitis', idx)
+    dictionary = ReadinessDictionary('meningitis')
+    with readiness_load('meningitis') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row))
+            unique_key = gen_unique_key('meningitis', idx)
 
-        Meningitis.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            load.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING Meningitis")
     
 
 @shared_task
 def load_meningitiselimination(file_path):
     print("START LOADING MeningitisElimination")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('meningitiseelimination', idx)
+    dictionary = ReadinessDictionary('meningitiseelimination')
+    with readiness_load('meningitiseelimination') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('meningitiseelimination', idx)
 
-        MeningitiseElimination.objects.update_or_create(
+            load.update_or_create(
                 key_on_table=unique_key,
                 defaults=base_data
             )
@@ -236,15 +454,16 @@ def load_meningitiselimination(file_path):
 @shared_task
 def load_mpox(file_path):
     print("START LOADING MPOX")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('mpox', idx)
+    dictionary = ReadinessDictionary('mpox')
+    with readiness_load('mpox') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('mpox', idx)
 
-        Mpox.objects.update_or_create(
+            load.update_or_create(
                 key_on_table=unique_key,
                 defaults=base_data
             )
@@ -254,15 +473,16 @@ def load_mpox(file_path):
 @shared_task
 def load_mpoxdistrict(file_path):
     print("START LOADING mpoxdistrict")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId", "District"])
-        unique_key = gen_unique_key('mpoxdistrict', idx)
+    dictionary = ReadinessDictionary('mpoxdistrict')
+    with readiness_load('mpoxdistrict') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId", "District"]))
+            unique_key = gen_unique_key('mpoxdistrict', idx)
 
-        MpoxDistrict.objects.update_or_create(
+            load.update_or_create(
                 key_on_table=unique_key,
                 defaults=base_data
             )
@@ -272,15 +492,16 @@ def load_mpoxdistrict(file_path):
 @shared_task
 def load_naturaldisaster(file_path):
     print("START LOADING naturaldisaster")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('naturaldisaster', idx)
+    dictionary = ReadinessDictionary('naturaldisaster')
+    with readiness_load('naturaldisaster') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('naturaldisaster', idx)
 
-        NaturalDisaster.objects.update_or_create(
+            load.update_or_create(
                 key_on_table=unique_key,
                 defaults=base_data
             )
@@ -290,16 +511,111 @@ def load_naturaldisaster(file_path):
 @shared_task
 def load_riftvalley(file_path):
     print("START LOADING riftvalley")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row, ["DataPeriod", "DataPeriodId"])
-        unique_key = gen_unique_key('riftvalleyfever', idx)
+    dictionary = ReadinessDictionary('riftvalley')
+    with readiness_load('riftvalley') as load:
+        for idx, row in df.iterrows():
+            base_data = dictionary.resolve(extract_base_data(row, ["DataPeriod", "DataPeriodId"]))
+            unique_key = gen_unique_key('riftvalleyfever', idx)
 
-        RiftValleyFever.objects.update_or_create(
+            load.update_or_create(
                 key_on_table=unique_key,
                 defaults=base_data
             )
-    print("END LOADING riftvalley")
\ No newline at end of file
+    print("END LOADING riftvalley")
+
+
+SIGNAL_EVENT_UPDATE_FIELDS = [
+    'event_id', 'event_type', 'country', 'lat', 'lon', 'disease', 'grade', 'status',
+    'description', 'year', 'report_date', 'cases', 'deaths', 'source_file',
+]
+
+
+def signal_event_types(parser):
+    """Event types of the WHO signal feeds: phe_data.csv -> PHE"""
+    return {csv_file.replace('_data.csv', '').upper() for csv_file in parser.signal_files}
+
+
+def upsert_signal_events(df, source_file, event_type=None):
+    """
+    Normalise a signal CSV frame the same way WHODataParser does and upsert it
+    into SignalEvent in batches. Events are keyed by event type and CSV id.
+
+    The event type is ``event_type`` when given, else each row's eventType
+    column; a type that is not one of the WHO signal feeds raises ValueError.
+    """
+    parser = WHODataParser()
+    known_types = signal_event_types(parser)
+
+    df = parser.standardize_signal_columns(df)
+    for col in parser.SIGNAL_COLUMNS:
+        df[col] = df[col].fillna(parser.get_default_value(col))
+
+    events = []
+    for idx, record in enumerate(df.to_dict('records')):
+        row_type = str(event_type or record.get('eventType') or '').strip().upper()
+        if row_type not in known_types:
+            raise ValueError(
+                f"Unknown signal event type {row_type or None!r} in {os.path.basename(source_file)} row {idx + 1}; "
+                f"expected one of {sorted(known_types)}"
+            )
+        event = parser.validate_signal_event(record)
+        report_date = pd.to_datetime(event.get('reportDate'), errors='coerce')
+        event_id = str(event.get('id') or '') or None
+        events.append(SignalEvent(
+            key_on_table=f"{row_type}:{event_id or idx}",
+            event_id=event_id,
+            event_type=row_type,
+            country=event.get('country'),
+            lat=event['lat'],
+            lon=event['lon'],
+            disease=event.get('disease'),
+            grade=event['grade'],
+            status=event['status'],
+            description=event.get('description'),
+            year=event['year'],
+            report_date=None if pd.isna(report_date) else report_date.date(),
+            cases=event['cases'],
+            deaths=event['deaths'],
+            source_file=os.path.basename(source_file),
+        ))
+
+    # The version bump shares the transaction, so the event store never keys new rows under the old version
+    with transaction.atomic():
+        SignalEvent.objects.bulk_create(
+            events,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['key_on_table'],
+            update_fields=SIGNAL_EVENT_UPDATE_FIELDS,
+        )
+        DatasetVersion.bump('signal')
+    return len(events)
+
+
+@shared_task
+def load_signal_events(file_path):
+    print("START LOADING SIGNAL EVENTS")
+    df = read_storage_csv(file_path)
+    count = upsert_signal_events(df, file_path)
+    print(f"END LOADING SIGNAL EVENTS ({count})")
+
+
+@shared_task
+def load_who_signal_events(who_data_dir=None):
+    """
+    Load the signal CSVs shipped in who-data/ (phe, signal, rra, eis). Run by
+    the WHO data refresher whenever one of them changes.
+    """
+    print("START LOADING WHO SIGNAL EVENTS")
+    parser = WHODataParser(who_data_dir)
+    for csv_file in parser.signal_files:
+        file_path = os.path.join(parser.who_data_dir, csv_file)
+        if os.path.exists(file_path):
+            event_type = csv_file.replace('_data.csv', '').upper()
+            count = upsert_signal_events(parser.columnar_cache.read_csv(file_path), csv_file, event_type)
+            print(f"✅ Loaded {count} signal events from {csv_file}")
+    print("END LOADING WHO SIGNAL EVENTS")
+
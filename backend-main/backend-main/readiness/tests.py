@@ -1,3 +1,1300 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import Count, Q
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+import pandas as pd
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from readiness.models import (
+    READINESS_MODELS, ArboVirus, CholeraSubNational, DatasetVersion, FVDPoE, Marburg, Mpox, MpoxDistrict,
+    ReadinessCategory, ReadinessCategorySummary, ReadinessComment, ReadinessQuestion, ReadinessSummary, SignalEvent,
+    data_period_key,
+)
+from readiness.migrations._rollups import reset_rollups
+from readiness.serializers import FVDPoESerializer, MarburgSerializer
+from readiness.tasks import (
+    ReadinessDictionary, ensure_readiness_summary, load_marburg, load_who_signal_events, refresh_readiness_summary,
+    upsert_signal_events,
+)
+from readiness.views import WHODataView
+from utils.who_data_parser import WHODataParser, combine_and_deduplicate, dedupe_key
+from utils.columnar_cache import ColumnarCache
+from utils.who_data_catalog import WHODataCatalog
+from utils.who_event_store import WHOEventStore
+from utils import readiness_simulator, who_data_refresher
+from utils.pagination import KeysetPagination
+from utils.values_serializer import ValuesReader
+
+
+def setUpModule():
+    # Columnar sidecars and the catalog go to a scratch directory instead of who-data/ and media/
+    cache_dir = tempfile.TemporaryDirectory()
+    environ = mock.patch.dict(os.environ, {'WHO_DATA_CACHE_DIR': os.path.join(cache_dir.name, 'who-data')})
+    settings = override_settings(UPLOAD_COLUMNAR_CACHE_DIR=os.path.join(cache_dir.name, 'uploads'))
+    environ.start()
+    settings.enable()
+    unittest.addModuleCleanup(cache_dir.cleanup)
+    unittest.addModuleCleanup(environ.stop)
+    unittest.addModuleCleanup(settings.disable)
+
+
+def strict_json(content):
+    """Parse a response body, rejecting the NaN/Infinity tokens json.loads accepts"""
+    def reject(token):
+        raise ValueError(f'{token} is not valid JSON')
+    return json.loads(content, parse_constant=reject)
+
+
+class ReadinessAPITestCase(TestCase):
+    """Authenticated client and a small Marburg fixture for the readiness endpoints"""
+
+    def setUp(self):
+        # Responses are cached per dataset version, which restarts with every test's database
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user('reviewer@example.com', 'x'))
+
+    def readiness_row(self, model, idx, country, question_key, national_yn, category_code='C1',
+                      question_score=None, question_category_weight=1.0, category_weight=1.0, comments=None,
+                      **fields):
+        if question_score is None:
+            question_score = 1.0 if national_yn == 'yes' else 0.0
+        hazard = model._meta.model_name
+        category, _ = ReadinessCategory.objects.get_or_create(
+            hazard=hazard, digest=category_code, defaults={'category_code': category_code, 'category': category_code},
+        )
+        if comments is not None:
+            fields['comment_ref'], _ = ReadinessComment.objects.get_or_create(
+                hazard=hazard, digest=comments, defaults={'comments': comments},
+            )
+        return model.objects.create(
+            key_on_table=f'{model._meta.model_name}_{idx}', country=country, question_key=question_key,
+            category_code=category_code, category_ref=category, national_yn=national_yn,
+            question_score=question_score, question_category_weight=question_category_weight,
+            category_weight=category_weight, **fields,
+        )
+
+    def summarise(self):
+        """Rollups of every table, as the loaders leave them"""
+        for hazard in READINESS_MODELS:
+            refresh_readiness_summary(hazard)
+
+    def marburg(self, idx, country, question_key, national_yn, data_period='2024', **fields):
+        return self.readiness_row(Marburg, idx, country, question_key, national_yn, data_period=data_period, **fields)
+
+
+class ReadinessQueryPlanTests(TestCase):
+    """The readiness summary queries should be answered from the filter indexes"""
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            # Tiny test tables would otherwise always be sequentially scanned
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f'{index_name} not used by:\n{plan}')
+
+    def test_country_filter_uses_composite_index(self):
+        # Ordered by category so the weighted score index, also keyed on country first, is not an equal choice
+        queryset = ArboVirus.objects.filter(country_norm='kenya').order_by('category_code')
+        self.assertUsesIndex(queryset, 'arbovirus_country_cat')
+
+    def test_period_filter_uses_country_period_index(self):
+        queryset = Marburg.objects.filter(country_norm='uganda', data_period_id='2024')
+        self.assertUsesIndex(queryset, 'marburg_country_period')
+
+    def test_category_breakdown_uses_country_category_index(self):
+        queryset = (
+            ArboVirus.objects
+            .filter(country_norm='kenya')
+            .values('category_code')
+            .annotate(total=Count('id'), answered=Count('id', filter=Q(question_score__gt=0)))
+        )
+        self.assertUsesIndex(queryset, 'arbovirus_country_cat')
+
+    def test_answered_questions_use_partial_index(self):
+        if not connection.features.supports_partial_indexes:
+            self.skipTest('Database does not support partial indexes')
+        queryset = (
+            CholeraSubNational.objects
+            .filter(country_norm='nigeria', question_score__gt=0)
+            .values('category_code')
+            .annotate(answered=Count('id'))
+        )
+        self.assertUsesIndex(queryset, 'cholerasub_answered')
+
+    def test_top_questions_use_weighted_score_index(self):
+        queryset = ArboVirus.objects.filter(country_norm='kenya').order_by('-weighted_score')[:10]
+        self.assertUsesIndex(queryset, 'arbovirus_weighted')
+
+    def test_gap_analysis_uses_unanswered_index(self):
+        if not connection.features.supports_partial_indexes:
+            self.skipTest('Database does not support partial indexes')
+        queryset = Marburg.objects.filter(country_norm='uganda', national_yn='no', data_period='2024')
+        self.assertUsesIndex(queryset, 'marburg_gaps')
+
+    def test_district_filter_uses_drilldown_index(self):
+        queryset = FVDPoE.objects.filter(country_norm='kenya', district_norm='kwale').values('poe_name').annotate(total=Count('id'))
+        self.assertUsesIndex(queryset, 'fvdpoe_district')
+
+    def test_summary_lookup_uses_rollup_index(self):
+        queryset = ReadinessSummary.objects.filter(hazard='arbovirus', country_norm='kenya')
+        self.assertUsesIndex(queryset, 'readiness_summary_lookup')
+
+
+class WHODataViewTests(TestCase):
+    """who-data against the WHO files bundled with the repo"""
+
+    def test_parsed_events_are_json_compliant(self):
+        _, events = WHODataParser().get_cached_events()
+        self.assertTrue(events)
+        json.dumps(events, allow_nan=False, default=str)
+
+    def test_default_request_returns_valid_json(self):
+        response = APIClient().get('/api/v1/readiness/who-data')
+        self.assertEqual(response.status_code, 200)
+        data = strict_json(response.content)['data']
+        self.assertTrue(data['events'])
+
+    def test_readiness_summary_returns_valid_json(self):
+        response = APIClient().get('/api/v1/readiness/who-data', {'dataType': 'readiness_summary'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(strict_json(response.content)['data']['events'])
+
+    def test_ndjson_stream_writes_null_for_missing_values(self):
+        response = APIClient().get('/api/v1/readiness/who-data', {'dataType': 'readiness_summary', 'stream': 'ndjson'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            strict_json(line)
+
+    def test_database_signal_events_stream_valid_json(self):
+        SignalEvent.objects.create(key_on_table='phe_row_0', event_type='PHE', country='Kenya', lat=float('inf'), lon=1.0)
+        response = APIClient().get('/api/v1/readiness/who-data', {'dataType': 'signal', 'stream': 'ndjson'})
+        event = strict_json(b''.join(response.streaming_content).decode().splitlines()[0])
+        self.assertIsNone(event['lat'])
+
+    def signal_events(self, data_type):
+        response = APIClient().get('/api/v1/readiness/who-data', {'dataType': data_type})
+        events = [event for event in strict_json(response.content)['data']['events'] if event['dataType'] == 'signal']
+        return sorted(events, key=lambda event: (event['eventType'], str(event['id'])))
+
+    def test_loaded_signal_events_match_the_csvs(self):
+        from_csv = self.signal_events('signal')
+        with redirect_stdout(io.StringIO()):
+            load_who_signal_events()
+        self.assertTrue(from_csv)
+        self.assertEqual(self.signal_events('signal'), from_csv)
+        self.assertEqual(self.signal_events('all'), from_csv)
+
+    def test_loaded_signal_events_serve_every_data_type(self):
+        SignalEvent.objects.create(key_on_table='PHE:X1', event_id='X1', event_type='PHE', country='Atlantis')
+        for data_type in ('signal', 'all'):
+            response = APIClient().get('/api/v1/readiness/who-data', {'dataType': data_type, 'country': 'Atlantis'})
+            events = strict_json(response.content)['data']['events']
+            self.assertEqual([event['id'] for event in events], ['X1'])
+
+    def test_mpox_rows_add_one_existing_event_per_country(self):
+        for idx, country in enumerate(['Kenya', 'Kenya', 'Chad']):
+            Mpox.objects.create(key_on_table=f'mpox_{idx}', country=country, question_key='q1', national_yn='yes')
+        response = APIClient().get('/api/v1/readiness/who-data', {'source': 'EXISTING'})
+        data = strict_json(response.content)['data']
+        self.assertEqual(sorted(event['country'] for event in data['events']), ['Chad', 'Kenya'])
+        self.assertEqual(data['metadata']['existing_events'], 2)
+
+    def test_stale_store_skips_existing_events_query(self):
+        APIClient().get('/api/v1/readiness/who-data')
+        with mock.patch.object(who_data_refresher, 'is_refresher_running', return_value=True), \
+                mock.patch.object(WHODataView, '_get_existing_events') as get_existing_events:
+            response = APIClient().get('/api/v1/readiness/who-data')
+        self.assertEqual(response.status_code, 200)
+        get_existing_events.assert_not_called()
+
+
+class SignalEventLoaderTests(TestCase):
+    def frame(self, event_type):
+        return pd.DataFrame([{
+            'id': 'E1', 'country': 'Kenya', 'lat': 1.0, 'lon': 36.0, 'disease': 'Cholera', 'grade': 'Grade 2',
+            'eventType': event_type, 'status': 'Ongoing', 'year': 2024, 'cases': 3, 'deaths': 0,
+        }])
+
+    def test_event_type_from_content(self):
+        upsert_signal_events(self.frame('Signal'), 'uploads/readiness/signal/latest_export.csv')
+        self.assertEqual(SignalEvent.objects.get().event_type, 'SIGNAL')
+
+    def test_explicit_event_type_wins(self):
+        upsert_signal_events(self.frame('Signal'), 'phe_data.csv', 'PHE')
+        self.assertEqual(SignalEvent.objects.get().key_on_table, 'PHE:E1')
+
+    def test_unknown_event_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            upsert_signal_events(self.frame('Unknown'), 'unknown_data.csv')
+        self.assertFalse(SignalEvent.objects.exists())
+
+
+class ColumnarCacheTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.cache = ColumnarCache(os.path.join(self.dir, '.columnar'))
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as fh:
+            fh.write(content)
+        return path
+
+    def sidecars(self):
+        return sorted(name for name in os.listdir(self.cache.cache_dir) if name.endswith('.feather'))
+
+    def test_second_read_uses_the_sidecar(self):
+        path = self.write('a.csv', 'x,y\n1,2\n')
+        self.cache.read_csv(path)
+        with mock.patch('pandas.read_csv') as read_csv:
+            df = self.cache.read_csv(path)
+        read_csv.assert_not_called()
+        self.assertEqual(df.to_dict('records'), [{'x': 1, 'y': 2}])
+
+    def test_changed_source_is_reparsed(self):
+        path = self.write('a.csv', 'x,y\n1,2\n')
+        self.cache.read_csv(path)
+        self.write('a.csv', 'x,y\n3,4\n5,6\n')
+        self.assertEqual(self.cache.read_csv(path)['x'].tolist(), [3, 5])
+        self.assertEqual(len(self.sidecars()), 1)
+
+    def test_same_size_rewrite_is_detected_by_mtime(self):
+        path = self.write('a.csv', 'x\n1\n')
+        self.cache.read_csv(path)
+        self.write('a.csv', 'x\n2\n')
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.cache.read_csv(path)['x'].tolist(), [2])
+
+    def test_corrupt_sidecar_is_rebuilt(self):
+        path = self.write('a.csv', 'x\n1\n')
+        self.cache.read_csv(path)
+        with open(os.path.join(self.cache.cache_dir, self.sidecars()[0]), 'wb') as fh:
+            fh.write(b'not feather')
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(self.cache.read_csv(path)['x'].tolist(), [1])
+        with mock.patch('pandas.read_csv') as read_csv:
+            self.cache.read_csv(path)
+        read_csv.assert_not_called()
+
+    def test_same_bytes_under_another_name_share_the_sidecar(self):
+        self.cache.read_csv(self.write('a.csv', 'x\n1\n'))
+        with mock.patch('pandas.read_csv') as read_csv:
+            self.cache.read_csv(self.write('b.csv', 'x\n1\n'))
+        read_csv.assert_not_called()
+        self.assertEqual(len(self.sidecars()), 1)
+
+    def test_one_manifest_entry_per_source_and_options(self):
+        path = self.write('a.csv', 'x;y\n1;2\n')
+        self.cache.read_csv(path)
+        self.cache.read_csv(path, sep=';')
+        entries = dict(self.cache._iter_entries())
+        self.assertEqual(len(entries), 2)
+        self.assertFalse([name for name in os.listdir(os.path.join(self.cache.cache_dir, 'manifest'))
+                          if not name.endswith('.json')])
+
+    def test_invalidate_drops_entries_and_sidecars(self):
+        a = self.write('a.csv', 'x\n1\n')
+        self.cache.read_csv(a)
+        self.cache.read_csv(self.write('b.csv', 'x\n2\n'))
+        self.cache.invalidate(a)
+        self.assertEqual([entry['key'].split('::')[0] for _, entry in self.cache._iter_entries()], ['b.csv'])
+        self.assertEqual(len(self.sidecars()), 1)
+
+
+class WHODataCatalogTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.cache_dir = os.path.join(self.dir, '.columnar')
+        # Catalogs are shared per data directory and source signature across parser instances
+        memo = mock.patch.dict('utils.who_data_parser._catalog_cache', clear=True)
+        memo.start()
+        self.addCleanup(memo.stop)
+        self.write('cholerareadiness_DataUnweighted.csv', 'Country,District,DataPeriod\nKenya,Kwale,2024\n Uganda ,,2025\n')
+        self.write('phe_data.csv', 'country,disease\nNigeria,Lassa fever\n')
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as fh:
+            fh.write(content)
+        return path
+
+    def catalog(self):
+        return WHODataParser(self.dir, cache_dir=self.cache_dir).get_catalog()
+
+    def test_catalog_indexes_every_source(self):
+        self.assertEqual(self.catalog(), {
+            'countries': ['Kenya', 'Nigeria', 'Uganda'],
+            'districts': ['Kwale'],
+            # Free-text signal diseases are left out; hazards come from the readiness file names
+            'diseases': ['Cholera'],
+            'data_periods': ['2024', '2025'],
+        })
+
+    def test_unchanged_files_are_not_reread(self):
+        expected = self.catalog()
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, WHODataCatalog.FILE_NAME)))
+        with mock.patch.dict('utils.who_data_parser._catalog_cache', clear=True), \
+                mock.patch.object(ColumnarCache, 'read_csv') as read_csv:
+            self.assertEqual(self.catalog(), expected)
+        read_csv.assert_not_called()
+
+    def test_changed_file_is_reindexed(self):
+        self.catalog()
+        path = self.write('phe_data.csv', 'country,disease\nGhana,Lassa fever\n')
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.catalog()['countries'], ['Ghana', 'Kenya', 'Uganda'])
+
+    def test_removed_file_is_pruned(self):
+        self.catalog()
+        os.remove(os.path.join(self.dir, 'phe_data.csv'))
+        self.assertEqual(self.catalog()['countries'], ['Kenya', 'Uganda'])
+
+    def test_catalog_view(self):
+        response = APIClient().get('/api/v1/readiness/who-data/catalog')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'], WHODataParser().get_catalog())
+        self.assertTrue(response.data['data']['countries'])
+
+
+class WHOExcelTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        memo = mock.patch.dict('utils.who_data_parser._excel_cache', clear=True)
+        memo.start()
+        self.addCleanup(memo.stop)
+        with pd.ExcelWriter(os.path.join(tmp.name, 'scores.xlsx')) as writer:
+            pd.DataFrame({'Country': ['Kenya', 'Uganda', 'Ghana'], 'Score': [80, None, 60]}).to_excel(
+                writer, sheet_name='2024', index=False,
+            )
+            pd.DataFrame({'Country': ['Kenya'], 'Drill': ['SIMEX']}).to_excel(writer, sheet_name='Exercises', index=False)
+        self.parser = WHODataParser(tmp.name, cache_dir=os.path.join(tmp.name, '.columnar'))
+
+    def test_outline_reads_no_rows(self):
+        with mock.patch.object(ColumnarCache, 'read_excel') as read_excel:
+            outline = self.parser.get_excel_outline('scores.xlsx')
+        read_excel.assert_not_called()
+        self.assertEqual(outline, {'2024': ['Country', 'Score'], 'Exercises': ['Country', 'Drill']})
+
+    def test_only_the_requested_sheet_is_loaded(self):
+        with mock.patch.object(ColumnarCache, 'read_excel', wraps=self.parser.columnar_cache.read_excel) as read_excel:
+            sheet = self.parser.load_excel_sheet('scores.xlsx', '2024', 1, 2)
+            self.parser.load_excel_sheet('scores.xlsx', '2024')
+        read_excel.assert_called_once_with(mock.ANY, '2024')
+        self.assertEqual(sheet, {'columns': ['Country', 'Score'], 'row_count': 3,
+                                 'data': [{'Country': 'Uganda', 'Score': None}]})
+
+    def test_unknown_sheet_and_file(self):
+        with self.assertRaises(ValueError):
+            self.parser.get_excel_sheet('scores.xlsx', '2019')
+        with self.assertRaises(FileNotFoundError):
+            self.parser.get_excel_outline('missing.xlsx')
+
+    def test_parse_excel_files_loads_sheets_on_access(self):
+        with redirect_stdout(io.StringIO()):
+            excel_data = self.parser.parse_excel_files()
+        workbook = excel_data['scores.xlsx']
+        self.assertEqual(workbook['sheets'], ['2024', 'Exercises'])
+        with mock.patch.object(ColumnarCache, 'read_excel', wraps=self.parser.columnar_cache.read_excel) as read_excel:
+            self.assertEqual(len(workbook['data']), 2)
+            self.assertEqual(workbook['data']['Exercises']['data'], [{'Country': 'Kenya', 'Drill': 'SIMEX'}])
+        read_excel.assert_called_once_with(mock.ANY, 'Exercises')
+
+    def test_excel_view(self):
+        client = APIClient()
+        with mock.patch('utils.who_data_parser.WHODataParser', return_value=self.parser):
+            listing = client.get('/api/v1/readiness/who-data/excel')
+            rows = client.get('/api/v1/readiness/who-data/excel',
+                              {'file': 'scores.xlsx', 'sheet': '2024', 'offset': 2, 'limit': 5})
+            invalid = client.get('/api/v1/readiness/who-data/excel', {'file': 'scores.xlsx', 'sheet': '2024', 'limit': -1})
+            missing = client.get('/api/v1/readiness/who-data/excel', {'file': 'missing.xlsx'})
+        self.assertEqual(list(listing.data['data']['scores.xlsx']), ['2024', 'Exercises'])
+        self.assertEqual(rows.data['data']['data'], [{'Country': 'Ghana', 'Score': 60.0}])
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(missing.status_code, 404)
+
+
+class WHOEventStoreTests(TestCase):
+    def setUp(self):
+        self.store = WHOEventStore([
+            {'dataType': 'signal', 'country': 'Kenya', 'disease': 'Cholera', 'eventType': 'PHE', 'isSubnational': False},
+            {'dataType': 'readiness_summary', 'country': 'kenya', 'disease': 'Mpox', 'eventType': 'Readiness', 'isSubnational': True},
+            {'dataType': 'readiness_summary', 'country': 'Uganda', 'disease': 'Cholera', 'eventType': 'Readiness', 'isSubnational': False},
+            {'dataType': 'existing', 'country': 'Kenya', 'disease': 'Marburg', 'eventType': 'Existing'},
+        ])
+
+    def test_exact_filter_ignores_case(self):
+        self.assertEqual(self.store.filter_ids({'country': 'KENYA'}), {0, 1, 3})
+
+    def test_contains_filter_and_data_type(self):
+        self.assertEqual(self.store.filter_ids({'disease': 'chol'}, 'readiness_summary'), {2})
+
+    def test_data_type_keeps_existing_events(self):
+        self.assertEqual(self.store.filter_ids({}, 'signal'), {0, 3})
+
+    def test_bool_filter(self):
+        self.assertEqual(self.store.filter_ids({'isSubnational': 'true'}), {1})
+
+    def test_counts_under_combined_filters(self):
+        params = {'country': 'kenya', 'disease': 'm'}
+        ids = self.store.filter_ids(params, 'readiness_summary')
+        self.assertEqual(ids, {1, 3})
+        self.assertEqual(self.store.count('eventType', 'Readiness', ids), 1)
+        self.assertEqual(self.store.count('eventType', 'Readiness'), 2)
+        self.assertEqual(self.store.filter_ids({'country': 'kenya', 'grade': 'x'}), set())
+        described = self.store.describe(ids)
+        self.assertEqual(described['by_data_type'], {'readiness_summary': 1, 'existing': 1})
+        self.assertEqual(described['facets']['disease'], ['Marburg', 'Mpox'])
+
+    def test_describe_is_memoized_per_key(self):
+        key = self.store.filter_key({'country': 'Kenya'})
+        first = self.store.describe(self.store.filter_ids({'country': 'Kenya'}), key)
+        # Same key: the memo is served even for other ids
+        self.assertIs(self.store.describe({2}, key), first)
+        self.assertIsNot(self.store.describe({2}), first)
+
+    def test_describe_memo_evicts_oldest_entry(self):
+        with mock.patch.object(WHOEventStore, 'DESCRIBE_CACHE_SIZE', 2):
+            first = self.store.describe({0}, ('a',))
+            self.store.describe({1}, ('b',))
+            self.store.describe({0}, ('a',))
+            self.store.describe({2}, ('c',))
+            self.assertEqual(list(self.store._describe_cache), [('b',), ('c',)])
+            self.assertIsNot(self.store.describe({0}, ('a',)), first)
+
+    def test_describe_from_concurrent_threads(self):
+        keys = [('key', index) for index in range(WHOEventStore.DESCRIBE_CACHE_SIZE * 2)]
+        errors = []
+
+        def describe(chunk):
+            try:
+                for key in chunk:
+                    self.store.describe({key[1] % 4}, key)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=describe, args=(keys[index::4],)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.store._describe_cache), WHOEventStore.DESCRIBE_CACHE_SIZE)
+
+
+class DeduplicationTests(TestCase):
+    def signal(self, country, disease='Cholera', report_date='2024-05-01', **fields):
+        return {'dataType': 'signal', 'country': country, 'disease': disease, 'reportDate': report_date, **fields}
+
+    def existing(self, country, disease='Cholera', report_date='2024-05-01', **fields):
+        return {'dataType': 'existing', 'source': 'EXISTING', 'country': country, 'disease': disease,
+                'reportDate': report_date, **fields}
+
+    def test_separator_inside_a_value_does_not_collide(self):
+        self.assertNotEqual(dedupe_key(self.signal('A|B', disease='C')), dedupe_key(self.signal('A', disease='B|C')))
+
+    def test_report_date_compared_by_day(self):
+        self.assertEqual(dedupe_key(self.signal('Kenya', report_date='2024-05-01T08:00:00')),
+                         dedupe_key(self.signal('Kenya', report_date='2024-05-01')))
+
+    def test_data_types_never_collide(self):
+        summary = {'dataType': 'readiness_summary', 'country': 'Kenya', 'disease': 'Cholera'}
+        category = dict(summary, dataType='readiness_category', categoryCode='C1')
+        self.assertEqual(len({dedupe_key(self.signal('Kenya')), dedupe_key(summary), dedupe_key(category)}), 3)
+
+    def test_later_who_event_wins_in_first_position(self):
+        events = combine_and_deduplicate(
+            [self.signal('Kenya', id='old'), self.signal('Uganda', id='u'), self.signal('Kenya', id='new')], []
+        )
+        self.assertEqual([event['id'] for event in events], ['new', 'u'])
+
+    def test_first_existing_event_wins_after_who_events(self):
+        events = combine_and_deduplicate(
+            [self.signal('Kenya', id='who')],
+            [self.existing('Kenya', id='first'), self.existing('Kenya', id='second'), self.existing('Chad', id='chad')],
+        )
+        self.assertEqual([event['id'] for event in events], ['who', 'first', 'chad'])
+
+    def test_existing_event_kept_beside_matching_who_event(self):
+        # Existing keys are namespaced, so a WHO event never hides or replaces one
+        events = combine_and_deduplicate([self.signal('Kenya', id='who')], [self.existing('Kenya', id='existing')])
+        self.assertEqual([event['id'] for event in events], ['who', 'existing'])
+
+    def test_inputs_left_untouched(self):
+        who_events = [self.signal('Kenya', id='a'), self.signal('Kenya', id='b')]
+        combine_and_deduplicate(who_events, [])
+        self.assertEqual([event['id'] for event in who_events], ['a', 'b'])
+
+
+class WHODataRefresherStartTests(TestCase):
+    def test_refresh_loads_changed_signal_csvs_once(self):
+        refresher = who_data_refresher.WHODataRefresher(list, signal_source=WHODataView()._get_signal_source)
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(refresher.refresh())
+        self.assertTrue(SignalEvent.objects.exists())
+        with mock.patch('readiness.tasks.load_who_signal_events') as load:
+            refresher.refresh()
+        load.assert_not_called()
+
+    def test_not_started_without_opt_in(self):
+        with mock.patch.dict(os.environ, {'WHO_DATA_REFRESH': ''}), \
+                mock.patch.object(who_data_refresher, 'start_refresher') as start_refresher:
+            self.assertIsNone(who_data_refresher.start_refresher_from_environment())
+        start_refresher.assert_not_called()
+
+    def test_started_with_configured_interval(self):
+        with mock.patch.dict(os.environ, {'WHO_DATA_REFRESH': 'true', 'WHO_DATA_REFRESH_INTERVAL': '5'}), \
+                mock.patch.object(who_data_refresher, 'start_refresher') as start_refresher:
+            who_data_refresher.start_refresher_from_environment()
+        self.assertEqual(start_refresher.call_args.kwargs['interval'], 5.0)
+
+
+class ReadinessSummaryViewTests(ReadinessAPITestCase):
+    def test_country_filter_normalises_like_the_rows(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.marburg(1, 'Kenya', 'q2', 'no')
+        self.marburg(2, 'Uganda', 'q1', 'yes')
+        self.summarise()
+        response = self.client.get('/api/v1/readiness/summary/marburg', {'country': ' KENYA '})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_questions'], 2)
+        self.assertEqual(response.data['answered_questions'], 1)
+        self.assertEqual(response.data['count'], 2)
+
+
+class ReadinessReuploadTests(TestCase):
+    """Re-uploading a file updates the rows in place through update_or_create()"""
+
+    HEADER = 'QuestionID,QuestionKey,Category,CategoryCode,CategoryWeight,QuestionScore,QuestionCategoryWeight,NationalYN,DataPeriod,Country,Question'
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings = override_settings(MEDIA_ROOT=media_root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, *rows):
+        content = '\n'.join([self.HEADER, *rows]).encode()
+        path = default_storage.save('uploads/readiness/marburg/marburg.csv', ContentFile(content))
+        with redirect_stdout(io.StringIO()):
+            load_marburg(path)
+
+    def test_reupload_renormalises_country(self):
+        self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place')
+        self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Uganda ,Policy in place')
+
+        row = Marburg.objects.get()
+        self.assertEqual(row.country_norm, 'uganda')
+        self.assertEqual(
+            list(ReadinessSummary.objects.filter(hazard='marburg').values_list('country_norm', flat=True)),
+            ['uganda'],
+        )
+
+    def test_reupload_recomputes_weighted_score(self):
+        self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place')
+        self.upload('1,q1,Coordination,C1,0.5,0.8,0.5,yes,2024,Kenya,Policy in place')
+
+        self.assertAlmostEqual(Marburg.objects.get().weighted_score, 0.4)
+        summary = ReadinessSummary.objects.get(hazard='marburg', country_norm='kenya')
+        self.assertAlmostEqual(summary.weighted_score_sum, 0.4)
+
+    def test_reupload_only_recomputes_touched_groups(self):
+        self.upload(
+            '1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place',
+            '2,q2,Coordination,C1,0.5,0.4,0.04,yes,2024,Uganda,Policy in place',
+        )
+        untouched = ReadinessSummary.objects.get(hazard='marburg', country_norm='uganda').pk
+        self.upload('1,q1,Coordination,C1,0.5,0.8,0.5,yes,2024,Kenya,Policy in place')
+
+        self.assertEqual(ReadinessSummary.objects.get(hazard='marburg', country_norm='uganda').pk, untouched)
+        summary = ReadinessSummary.objects.get(hazard='marburg', country_norm='kenya')
+        self.assertAlmostEqual(summary.weighted_score_sum, 0.4)
+
+    def test_failed_load_keeps_rows_rollups_and_version(self):
+        self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place')
+        version = DatasetVersion.get_versions(['marburg'])
+        with mock.patch('readiness.tasks.refresh_readiness_summary', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,no,2024,Uganda,Policy in place')
+
+        self.assertEqual(Marburg.objects.get().country_norm, 'kenya')
+        self.assertEqual(
+            list(ReadinessSummary.objects.filter(hazard='marburg').values_list('country_norm', flat=True)),
+            ['kenya'],
+        )
+        self.assertEqual(DatasetVersion.get_versions(['marburg']), version)
+
+    def test_load_failing_partway_keeps_rows_and_version(self):
+        self.upload('1,q1,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place')
+        version = DatasetVersion.get_versions(['marburg'])
+        resolve = ReadinessDictionary.resolve
+        calls = []
+
+        def fail_on_second_row(dictionary, data):
+            calls.append(data)
+            if len(calls) == 2:
+                raise RuntimeError('boom')
+            return resolve(dictionary, data)
+
+        with mock.patch.object(ReadinessDictionary, 'resolve', fail_on_second_row):
+            with self.assertRaises(RuntimeError):
+                self.upload(
+                    '1,q1,Coordination,C1,0.5,0.4,0.04,no,2024,Uganda,Policy in place',
+                    '2,q2,Coordination,C1,0.5,0.4,0.04,yes,2024,Kenya,Policy in place',
+                )
+
+        self.assertEqual(Marburg.objects.get().country_norm, 'kenya')
+        self.assertEqual(DatasetVersion.get_versions(['marburg']), version)
+
+
+class ReadinessDictionaryMigrationTests(TransactionTestCase):
+    """Rows moved into the dictionaries by the migrations and rows loaded later share entries"""
+
+    BEFORE = [('readiness', '0010_readiness_filter_indexes')]
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings = override_settings(MEDIA_ROOT=media_root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def test_migrated_and_loaded_rows_share_one_entry(self):
+        latest = [('readiness', MigrationExecutor(connection).loader.graph.leaf_nodes('readiness')[0][1])]
+        old_apps = self.migrate(self.BEFORE)
+        self.addCleanup(self.migrate, latest)
+        # Empty cells as the pre-dictionary loaders stored them: NaN saved into a CharField as 'nan'
+        old_apps.get_model('readiness', 'Marburg').objects.create(
+            key_on_table='legacy_0', country='Kenya', question_key='q1', language='nan', question='Policy in place?',
+            question_language='nan', category_code='C1', category='Coordination', category_language='nan',
+            comments='nan', national_yn='yes',
+        )
+        self.migrate(latest)
+
+        content = (
+            'QuestionKey,Language,Question,QuestionLanguage,CategoryCode,Category,CategoryLanguage,Comments,'
+            'NationalYN,Country\nq1,,Policy in place?,,C1,Coordination,,,yes,Uganda\n'
+        )
+        path = default_storage.save('uploads/readiness/marburg/marburg.csv', ContentFile(content.encode()))
+        with redirect_stdout(io.StringIO()):
+            load_marburg(path)
+
+        self.assertEqual(ReadinessQuestion.objects.filter(hazard='marburg').count(), 1)
+        self.assertEqual(ReadinessCategory.objects.filter(hazard='marburg').count(), 1)
+        self.assertFalse(ReadinessComment.objects.exists())
+        refs = set(Marburg.objects.values_list('question_ref', 'category_ref', 'comment_ref'))
+        self.assertEqual(len(refs), 1)
+        self.assertEqual(ReadinessQuestion.objects.get().language, None)
+
+
+class ResetRollupsTests(ReadinessAPITestCase):
+    """Migrations that change the rollup inputs drop both rollups and the responses built from them"""
+
+    def test_reset_clears_both_rollups_and_bumps_versions(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.readiness_row(ArboVirus, 0, 'Kenya', 'a1', 'no')
+        self.summarise()
+        versions = DatasetVersion.get_versions(['marburg', 'arbovirus', 'espar'])
+
+        reset_rollups(django_apps, None)
+
+        self.assertFalse(ReadinessSummary.objects.exists())
+        self.assertFalse(ReadinessCategorySummary.objects.exists())
+        self.assertEqual(
+            DatasetVersion.get_versions(['marburg', 'arbovirus', 'espar']),
+            {'marburg': versions['marburg'] + 1, 'arbovirus': versions['arbovirus'] + 1, 'espar': versions['espar']},
+        )
+
+    def test_hazards_are_summarised_after_migrate(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        reset_rollups(django_apps, None)
+
+        ensure_readiness_summary(list(READINESS_MODELS))
+
+        self.assertEqual(ReadinessSummary.objects.get().country_norm, 'kenya')
+        self.assertEqual(ReadinessCategorySummary.objects.get().category_code, 'C1')
+
+
+class DatasetConditionalTests(ReadinessAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.marburg(1, 'Kenya', 'q2', 'no')
+        self.summarise()
+
+    def assertRevalidates(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        return first['ETag']
+
+    def test_first_summary_etag_revalidates(self):
+        self.assertRevalidates('/api/v1/readiness/summary/marburg')
+
+    def test_rollup_views_revalidate(self):
+        for view in ('trend', 'categories'):
+            with self.subTest(view=view):
+                self.assertRevalidates(f'/api/v1/readiness/marburg/{view}')
+
+    def test_reads_never_write(self):
+        ReadinessSummary.objects.all().delete()
+        ReadinessCategorySummary.objects.all().delete()
+        urls = ['/api/v1/readiness/summary/marburg', '/api/v1/readiness/matrix'] + [
+            f'/api/v1/readiness/marburg/{view}' for view in ('trend', 'categories')
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            for url in urls:
+                self.assertEqual(self.client.get(url).status_code, 200)
+        writes = [query['sql'] for query in queries.captured_queries
+                  if query['sql'].split(' ', 1)[0] in ('INSERT', 'UPDATE', 'DELETE')]
+        self.assertEqual(writes, [])
+
+    def test_reload_invalidates_etag(self):
+        etag = self.assertRevalidates('/api/v1/readiness/summary/marburg')
+        refresh_readiness_summary('marburg')
+        response = self.client.get('/api/v1/readiness/summary/marburg', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class DataPeriodKeyTests(TestCase):
+    def test_orders_chronologically(self):
+        labels = ['2025-S1', '2024-M10', '2024', '2024-Q1', '2024-M2', '2023']
+        self.assertEqual(
+            sorted(labels, key=data_period_key),
+            ['2023', '2024', '2024-Q1', '2024-M2', '2024-M10', '2025-S1'],
+        )
+
+    def test_rejects_non_periods(self):
+        for label in ('nan', '', None, 'Q1'):
+            self.assertIsNone(data_period_key(label))
+
+
+class ReadinessTrendViewTests(ReadinessAPITestCase):
+    def test_periods_are_chronological_without_invalid_labels(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes', data_period='2024-Q1')
+        self.marburg(1, 'Kenya', 'q1', 'no', data_period='2023')
+        self.marburg(2, 'Kenya', 'q1', 'yes', data_period='nan')
+        self.marburg(3, 'Uganda', 'q1', 'yes', data_period='nan')
+        self.summarise()
+
+        data = self.client.get('/api/v1/readiness/marburg/trend').data['data']
+        self.assertEqual(data['periods'], ['2023', '2024-Q1'])
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya'])
+        self.assertEqual(
+            [period['data_period'] for period in data['countries'][0]['periods']], ['2023', '2024-Q1'],
+        )
+
+    def test_country_filter_uses_normalized_keys(self):
+        self.marburg(0, 'Kenya ', 'q1', 'yes')
+        self.marburg(1, 'Uganda', 'q1', 'yes')
+        self.summarise()
+
+        data = self.client.get('/api/v1/readiness/marburg/trend', {'countries': ' KENYA ,'}).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya'])
+
+
+class ReadinessGapsViewTests(ReadinessAPITestCase):
+    def test_default_period_skips_invalid_labels(self):
+        self.marburg(0, 'Kenya', 'q1', 'no', data_period='2024-Q1', question_category_weight=0.2)
+        self.marburg(1, 'Kenya', 'q2', 'no', data_period='2024-Q1', question_category_weight=0.5)
+        self.marburg(2, 'Kenya', 'q3', 'yes', data_period='2024-Q1')
+        self.marburg(3, 'Kenya', 'q1', 'no', data_period='nan')
+        self.marburg(4, 'Kenya', 'q1', 'no', data_period='2023')
+
+        data = self.client.get('/api/v1/readiness/marburg/gaps', {'country': 'Kenya'}).data['data']
+        self.assertEqual(data['data_period'], '2024-Q1')
+        self.assertEqual(data['total_gaps'], 2)
+        self.assertEqual([gap['question_key'] for gap in data['gaps']], ['q2', 'q1'])
+
+    def test_fully_answered_latest_period_has_no_gaps(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes', data_period='2024-Q1')
+        self.marburg(1, 'Kenya', 'q1', 'no', data_period='2023')
+
+        data = self.client.get('/api/v1/readiness/marburg/gaps', {'country': ' Kenya'}).data['data']
+        self.assertEqual(data['data_period'], '2024-Q1')
+        self.assertEqual((data['total_gaps'], data['gaps']), (0, []))
+
+    def test_country_without_real_period(self):
+        self.marburg(0, 'Kenya', 'q1', 'no', data_period='nan')
+
+        data = self.client.get('/api/v1/readiness/marburg/gaps', {'country': 'kenya'}).data['data']
+        self.assertIsNone(data['data_period'])
+        self.assertEqual([gap['question_key'] for gap in data['gaps']], ['q1'])
+
+    def test_explicit_period(self):
+        self.marburg(0, 'Kenya', 'q1', 'no', data_period='2024-Q1')
+        self.marburg(1, 'Kenya', 'q2', 'no', data_period='2023')
+
+        data = self.client.get('/api/v1/readiness/marburg/gaps', {'country': 'kenya', 'period': '2023'}).data['data']
+        self.assertEqual([gap['question_key'] for gap in data['gaps']], ['q2'])
+
+    def test_country_and_limit_are_validated(self):
+        self.assertEqual(self.client.get('/api/v1/readiness/marburg/gaps').status_code, 400)
+        response = self.client.get('/api/v1/readiness/marburg/gaps', {'country': 'kenya', 'limit': 0})
+        self.assertEqual(response.status_code, 400)
+
+
+class ReadinessSimulationViewTests(ReadinessAPITestCase):
+    """
+    With unit question category weights the simulator's category score is
+    10 x weighted_score_sum / total_questions of the category rollup, so
+    its scores can be checked against ReadinessSummary and
+    ReadinessCategorySummary.
+    """
+
+    def setUp(self):
+        super().setUp()
+        readiness_simulator._simulators.clear()
+        # Kenya's latest period is 2024-Q1; the 2023 and 'nan' rows must not be scored
+        self.marburg(0, 'Kenya', 'q1', 'yes', data_period='2024-Q1', category_code='C1', category_weight=2.0)
+        self.q2 = self.marburg(1, 'Kenya', 'q2', 'no', data_period='2024-Q1', category_code='C1', category_weight=2.0)
+        self.marburg(2, 'Kenya', 'q3', 'no', data_period='2024-Q1', category_code='C2')
+        self.marburg(3, 'Kenya', 'q4', 'yes', data_period='2024-Q1', category_code='C2')
+        self.marburg(4, 'Kenya', 'q5', 'yes', data_period='2024-Q1', category_code='C2')
+        self.marburg(5, 'Kenya', 'q1', 'no', data_period='2023', category_code='C1', category_weight=2.0)
+        self.marburg(6, 'Kenya', 'q3', 'yes', data_period='nan', category_code='C2')
+        refresh_readiness_summary('marburg')
+
+    def simulate(self, *scenarios):
+        response = self.client.post(
+            '/api/v1/readiness/marburg/simulate', {'country': 'KENYA', 'scenarios': list(scenarios)}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data['data']
+
+    def expected_scores(self):
+        """Category and overall scores of Kenya's 2024-Q1 rollups"""
+        rollups = ReadinessCategorySummary.objects.filter(hazard='marburg', country_norm='kenya', data_period='2024-Q1')
+        categories = {row.category_code: 10 * row.weighted_score_sum / row.total_questions for row in rollups}
+        weights = {row.category_code: row.category_weight for row in rollups}
+        overall = sum(categories[code] * weights[code] for code in categories) / sum(weights.values())
+        summary = ReadinessSummary.objects.get(hazard='marburg', country_norm='kenya', data_period='2024-Q1')
+        self.assertEqual(summary.total_questions, 5)
+        return overall, categories
+
+    def assertScores(self, result, overall, categories):
+        self.assertAlmostEqual(result['overall_score'], overall, places=4)
+        self.assertEqual(result['categories'].keys(), categories.keys())
+        for code, score in categories.items():
+            self.assertAlmostEqual(result['categories'][code], score, places=4)
+
+    def test_baseline_matches_latest_period_rollup(self):
+        data = self.simulate(['q3'])
+        self.assertEqual(data['data_period'], '2024-Q1')
+        self.assertScores(data['baseline'], *self.expected_scores())
+
+    def test_scenario_matches_rollup_after_the_change(self):
+        scenario = self.simulate(['q2'])['scenarios'][0]
+
+        self.q2.national_yn, self.q2.question_score = 'yes', 1.0
+        self.q2.save()
+        refresh_readiness_summary('marburg')
+        overall, categories = self.expected_scores()
+
+        self.assertScores(scenario, overall, categories)
+        self.assertEqual(self.simulate([])['baseline']['overall_score'], scenario['overall_score'])
+
+    def test_unknown_country_and_question(self):
+        response = self.client.post(
+            '/api/v1/readiness/marburg/simulate', {'country': 'Chad', 'scenarios': [['q1']]}, format='json',
+        )
+        self.assertEqual(response.status_code, 404)
+        response = self.client.post(
+            '/api/v1/readiness/marburg/simulate', {'country': 'Kenya', 'scenarios': [['q9']]}, format='json',
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_country_uses_normalized_key(self):
+        response = self.client.post(
+            '/api/v1/readiness/marburg/simulate', {'country': ' kenya ', 'scenarios': [['q1']]}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post(
+            '/api/v1/readiness/marburg/simulate', {'country': None, 'scenarios': [['q1']]}, format='json',
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class ReadinessMatrixViewTests(ReadinessAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.marburg(0, 'Kenya', 'q1', 'yes', category_code='C1', question_category_weight=0.5)
+        self.marburg(1, 'Kenya', 'q2', 'no', category_code='C2')
+        self.marburg(2, 'Uganda', 'q1', 'no')
+        self.readiness_row(ArboVirus, 0, 'kenya ', 'a1', 'yes')
+        self.summarise()
+
+    def test_cells_per_country_and_hazard(self):
+        data = self.client.get('/api/v1/readiness/matrix', {'hazards': 'marburg,arbovirus'}).data['data']
+        self.assertEqual(data['hazards'], ['marburg', 'arbovirus'])
+        kenya, uganda = data['matrix']
+        self.assertEqual(kenya['country_norm'], 'kenya')
+        self.assertEqual(set(kenya['hazards']), {'arbovirus', 'marburg'})
+        self.assertEqual(kenya['hazards']['marburg'], {
+            'total_questions': 2, 'answered_questions': 1, 'completion_pct': 50.0, 'weighted_score_sum': 0.5,
+        })
+        self.assertEqual(set(uganda['hazards']), {'marburg'})
+
+    def test_country_filter_and_category_breakdown(self):
+        data = self.client.get(
+            '/api/v1/readiness/matrix', {'hazards': 'marburg', 'countries': 'KENYA', 'breakdown': 'category'},
+        ).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['matrix']], ['kenya'])
+        categories = data['matrix'][0]['hazards']['marburg']['categories']
+        self.assertEqual(set(categories), {'C1', 'C2'})
+        self.assertEqual(categories['C1']['answered_questions'], 1)
+        self.assertEqual(categories['C2']['answered_questions'], 0)
+
+    def test_country_filter_uses_normalized_keys(self):
+        data = self.client.get('/api/v1/readiness/matrix', {'hazards': ' Marburg ', 'countries': ' Uganda ,KENYA '}).data['data']
+        self.assertEqual(data['hazards'], ['marburg'])
+        self.assertEqual([entry['country_norm'] for entry in data['matrix']], ['kenya', 'uganda'])
+
+    def test_unknown_hazard(self):
+        response = self.client.get('/api/v1/readiness/matrix', {'hazards': 'marburg,plague'})
+        self.assertEqual(response.status_code, 400)
+
+
+class RegionalHeatmapViewTests(ReadinessAPITestCase):
+    def setUp(self):
+        super().setUp()
+        # Scores are weighted_score x 100 capped at 100, averaged per admin level name or country
+        self.marburg(0, 'Kenya', 'q1', 'yes', question_category_weight=0.25)
+        self.marburg(1, 'Kenya', 'q2', 'yes', question_category_weight=0.75)
+        self.marburg(2, 'Uganda', 'q1', 'yes', question_category_weight=2.0)
+        self.readiness_row(ArboVirus, 0, 'Kenya', 'a1', 'yes', question_category_weight=0.1, admin_level_name='Nairobi')
+
+    def test_single_hazard(self):
+        response = self.client.get('/api/v1/readiness/heatmap', {'readiness': 'marburg'})
+        self.assertEqual(response.data, [{'region': 'Kenya', 'score': 50.0}, {'region': 'Uganda', 'score': 100.0}])
+
+    def test_multiple_hazards_in_one_response(self):
+        response = self.client.get('/api/v1/readiness/heatmap', {'hazards': 'marburg, arbovirus'})
+        self.assertEqual(set(response.data), {'marburg', 'arbovirus'})
+        self.assertEqual(response.data['arbovirus'], [{'region': 'Nairobi', 'score': 10.0}])
+        single = self.client.get('/api/v1/readiness/heatmap', {'readiness': 'marburg'})
+        self.assertEqual(response.data['marburg'], single.data)
+
+    def test_unknown_hazard(self):
+        response = self.client.get('/api/v1/readiness/heatmap', {'hazards': 'marburg,plague'})
+        self.assertEqual(response.status_code, 400)
+
+
+class KeysetPaginationTests(ReadinessAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for idx in range(7):
+            self.marburg(idx, 'Kenya', f'q{idx}', 'yes' if idx % 2 else 'no')
+        self.summarise()
+
+    def test_cursor_pages_walk_every_row_once(self):
+        url, params, ids = '/api/v1/readiness/summary/marburg', {'pagination': 'cursor', 'page_size': 3}, []
+        while url:
+            page = self.client.get(url, params).data
+            self.assertEqual(page['count'], 7)
+            ids += [row['id'] for row in page['results']]
+            url, params = page['next'], None
+        self.assertEqual(ids, list(Marburg.objects.order_by('pk').values_list('pk', flat=True)))
+
+    def test_cursor_switches_pagination(self):
+        first = self.client.get('/api/v1/readiness/summary/marburg', {'pagination': 'cursor', 'page_size': 3}).data
+        self.assertNotIn('page=', first['next'])
+        self.assertIn('cursor=', first['next'])
+        self.assertIsNone(first['previous'])
+
+    def test_page_numbers_stay_the_default(self):
+        page = self.client.get('/api/v1/readiness/summary/marburg', {'page_size': 3}).data
+        self.assertEqual(page['count'], 7)
+        self.assertIn('page=2', page['next'])
+
+    def test_keyset_count_only_on_request(self):
+        for params, count in (({}, None), ({'with_count': 'true'}, 7)):
+            paginator = KeysetPagination()
+            request = Request(APIRequestFactory().get('/', {'page_size': 5, **params}))
+            page = paginator.paginate_queryset(Marburg.objects.all(), request)
+            self.assertEqual(len(page), 5)
+            self.assertEqual(paginator.get_paginated_response([]).data.get('count'), count)
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-a-cursor', 'cD0xMA'):
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/v1/readiness/summary/marburg', {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+
+    def assertEmptyCursorPage(self, params):
+        page = self.client.get('/api/v1/readiness/summary/marburg', {'pagination': 'cursor', **params}).data
+        self.assertEqual((page['count'], page['results']), (0, []))
+        self.assertIsNone(page['next'])
+        self.assertIsNone(page['previous'])
+
+    def test_unknown_country_cursor_page(self):
+        self.assertEmptyCursorPage({'country': 'Atlantis'})
+
+    def test_empty_table_cursor_page(self):
+        Marburg.objects.all().delete()
+        self.summarise()
+        self.assertEmptyCursorPage({})
+
+
+class SparseFieldsTests(ReadinessAPITestCase):
+    url = '/api/v1/readiness/summary/marburg'
+
+    def setUp(self):
+        super().setUp()
+        question = ReadinessQuestion.objects.create(
+            hazard='marburg', digest='q1', question_key='q1', question='Policy in place?',
+        )
+        self.marburg(0, 'Kenya', 'q1', 'yes', question_ref=question, comments='Reviewed')
+        self.summarise()
+
+    def test_fields_selects_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.client.get(self.url, {'fields': 'id,country,question'}).data['results']
+        self.assertEqual(rows, [{'id': Marburg.objects.get().pk, 'country': 'Kenya', 'question': 'Policy in place?'}])
+        page_query = next(
+            query['sql'] for query in queries.captured_queries
+            if 'FROM "readiness_marburg"' in query['sql'] and 'LIMIT' in query['sql']
+        )
+        self.assertNotIn('"comments"', page_query)
+
+    def test_omit_drops_fields(self):
+        row = self.client.get(self.url, {'omit': 'comments,question'}).data['results'][0]
+        self.assertNotIn('comments', row)
+        self.assertNotIn('question', row)
+        self.assertEqual(row['country'], 'Kenya')
+
+    def test_unknown_field(self):
+        self.assertEqual(self.client.get(self.url, {'fields': 'id,secret'}).status_code, 400)
+
+    def test_blank_params_return_every_field(self):
+        full = self.client.get(self.url).data['results']
+        for params in ({'fields': ''}, {'fields': ' , ', 'omit': ','}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.url, params).data['results'], full)
+
+    def test_unknown_country(self):
+        page = self.client.get(self.url, {'country': 'Atlantis', 'fields': 'id,country'}).data
+        self.assertEqual((page['count'], page['results']), (0, []))
+
+    def test_empty_table(self):
+        Marburg.objects.all().delete()
+        self.summarise()
+        for params in ({'fields': 'id,question'}, {'omit': 'comments', 'pagination': 'cursor'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.url, params).data['results'], [])
+        self.assertEqual(self.client.get(self.url, {'fields': 'secret'}).status_code, 400)
+
+
+class ValuesReaderTests(ReadinessAPITestCase):
+    """values() rows represented by ValuesReader match the serializer output"""
+
+    def assertMatchesSerializer(self, serializer_class, queryset):
+        reader = ValuesReader(serializer_class())
+        self.assertTrue(reader.supported)
+        self.assertEqual(
+            [dict(row) for row in reader.to_representation(reader.values(queryset.order_by('pk')))],
+            [dict(row) for row in serializer_class(queryset.order_by('pk'), many=True).data],
+        )
+
+    def test_readiness_rows_with_and_without_dictionary_entries(self):
+        question = ReadinessQuestion.objects.create(
+            hazard='marburg', digest='q1', question_key='q1', question='Policy in place?', question_language='en',
+        )
+        self.marburg(0, 'Kenya', 'q1', 'yes', question_ref=question, comments='Reviewed')
+        self.marburg(1, 'Uganda', 'q2', 'no', data_period=None)
+        self.assertMatchesSerializer(MarburgSerializer, Marburg.objects.all())
+
+    def test_subnational_rows(self):
+        self.readiness_row(
+            FVDPoE, 0, 'Kenya', 'q1', 'yes', district='Busia', poe_name='Busia OSBP', data_period='2025-Q3',
+        )
+        self.assertMatchesSerializer(FVDPoESerializer, FVDPoE.objects.all())
+
+    def test_list_view_serves_reader_rows(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.summarise()
+        rows = self.client.get('/api/v1/readiness/summary/marburg').data['results']
+        expected = MarburgSerializer(Marburg.objects.all(), many=True).data
+        self.assertEqual([dict(row) for row in rows], [dict(row) for row in expected])
+
+    def test_empty_queryset(self):
+        for serializer_class, model in ((MarburgSerializer, Marburg), (FVDPoESerializer, FVDPoE)):
+            with self.subTest(serializer=serializer_class.__name__):
+                reader = ValuesReader(serializer_class())
+                self.assertEqual(list(reader.to_representation(reader.values(model.objects.all()))), [])
+
+    def test_list_view_without_rows(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.summarise()
+        for hazard, params in (('marburg', {'country': 'Atlantis'}), ('fvdpoe', {}), ('fvdpoe', {'pagination': 'cursor'})):
+            with self.subTest(hazard=hazard, params=params):
+                response = self.client.get(f'/api/v1/readiness/summary/{hazard}', params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['results'], [])
+
+    def test_list_view_invalid_cursor(self):
+        self.marburg(0, 'Kenya', 'q1', 'yes')
+        self.summarise()
+        response = self.client.get('/api/v1/readiness/summary/marburg', {'cursor': 'not-a-cursor', 'fields': 'id'})
+        self.assertEqual(response.status_code, 404)
+
+
+class ReadinessCategoriesViewTests(ReadinessAPITestCase):
+    url = '/api/v1/readiness/marburg/categories'
+
+    def setUp(self):
+        super().setUp()
+        self.marburg(0, 'Kenya', 'q1', 'yes', category_code='C1', category_score=10, category_weight=0.25)
+        self.marburg(1, 'Kenya', 'q2', 'no', category_code='C1', category_score=6, category_weight=0.25)
+        self.marburg(2, 'Kenya', 'q3', 'no', category_code='C2', category_score=2, category_weight=0.5)
+        self.marburg(3, 'Kenya', 'q1', 'no', category_code='C1', category_score=0, data_period='2023')
+        self.marburg(4, 'Uganda', 'q1', 'yes', category_code='C1', category_score=9)
+        self.summarise()
+
+    def test_scorecard_per_country_and_category(self):
+        data = self.client.get(self.url, {'countries': 'Kenya', 'period': '2024'}).data['data']
+        self.assertEqual(data['data_period'], '2024')
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya'])
+        c1, c2 = data['countries'][0]['categories']
+        self.assertEqual(c1['category_code'], 'C1')
+        self.assertEqual(c1['category_score'], 8.0)
+        self.assertEqual(c1['category_grade'], 'Grade 1')
+        self.assertEqual(c1['category_weight'], 0.25)
+        self.assertEqual((c1['yes_responses'], c1['no_responses']), (1, 1))
+        self.assertEqual(c1['completion_rate'], 50.0)
+        self.assertEqual(c1['total_questions'], 2)
+        self.assertEqual((c2['category_code'], c2['category_grade'], c2['completion_rate']), ('C2', 'Grade 3', 0))
+
+    def test_all_periods_by_default(self):
+        data = self.client.get(self.url).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya', 'uganda'])
+        c1 = data['countries'][0]['categories'][0]
+        self.assertEqual(c1['total_questions'], 3)
+        self.assertAlmostEqual(c1['category_score'], 16 / 3, places=4)
+
+    def test_country_filter_uses_normalized_keys(self):
+        data = self.client.get(self.url, {'countries': ' UGANDA , kenya'}).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya', 'uganda'])
+
+    def test_unknown_hazard(self):
+        self.assertEqual(self.client.get('/api/v1/readiness/plague/categories').status_code, 400)
+
+    def test_unknown_country_and_period(self):
+        for params in ({'countries': 'Atlantis'}, {'period': '1999'}):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['data']['countries'], [])
+
+    def test_blank_countries_select_all(self):
+        data = self.client.get(self.url, {'countries': ' , '}).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya', 'uganda'])
+
+    def test_hazard_without_rows(self):
+        data = self.client.get('/api/v1/readiness/arbovirus/categories').data['data']
+        self.assertEqual(data, {'hazard': 'arbovirus', 'data_period': None, 'countries': []})
+
+
+class ReadinessDrilldownViewTests(ReadinessAPITestCase):
+    def poe(self, idx, country, district, poe_name, national_yn, data_period='2025-Q3'):
+        return self.readiness_row(
+            FVDPoE, idx, country, f'q{idx}', national_yn, district=district, poe_name=poe_name, data_period=data_period,
+        )
+
+    def test_country_district_poe_tree(self):
+        self.poe(0, 'Kenya', 'Busia', 'Busia OSBP', 'yes')
+        self.poe(1, 'Kenya', 'busia ', 'Malaba', 'no')
+        self.poe(2, 'Kenya', 'Busia', 'Malaba', 'yes')
+        self.poe(3, 'Kenya', 'Mombasa', 'Port', 'no')
+        self.poe(4, 'Kenya', 'Mombasa', 'Port', 'no', data_period='2024')
+        self.summarise()
+
+        data = self.client.get('/api/v1/readiness/fvdpoe/drilldown', {'period': '2025-Q3'}).data['data']
+        (kenya,) = data['countries']
+        self.assertEqual((kenya['total_questions'], kenya['answered_questions']), (4, 2))
+        busia, mombasa = kenya['districts']
+        self.assertEqual(busia['district_norm'], 'busia')
+        self.assertEqual((busia['total_questions'], busia['answered_questions']), (3, 2))
+        self.assertEqual(
+            [(poe['poe_name'], poe['total_questions'], poe['answered_questions']) for poe in busia['poes']],
+            [('Busia OSBP', 1, 1), ('Malaba', 2, 1)],
+        )
+        self.assertEqual((mombasa['total_questions'], mombasa['completion_pct']), (1, 0))
+
+    def test_districts_without_poes(self):
+        self.readiness_row(MpoxDistrict, 0, 'Uganda', 'q1', 'yes', district='Gulu', data_period='2025')
+        self.readiness_row(MpoxDistrict, 1, 'Uganda', 'q2', 'no', district='Gulu', data_period='2025')
+        self.summarise()
+
+        (uganda,) = self.client.get('/api/v1/readiness/mpoxdistrict/drilldown').data['data']['countries']
+        self.assertEqual(uganda['districts'], [{
+            'district': 'Gulu', 'district_norm': 'gulu', 'total_questions': 2, 'answered_questions': 1,
+            'completion_pct': 50.0, 'weighted_score_sum': 1.0,
+        }])
+
+    def test_country_filter_uses_normalized_keys(self):
+        self.poe(0, 'Kenya ', 'Busia', 'Malaba', 'yes')
+        self.poe(1, 'Uganda', 'Tororo', 'Malaba', 'no')
+        self.summarise()
+
+        data = self.client.get('/api/v1/readiness/fvdpoe/drilldown', {'countries': ' KENYA'}).data['data']
+        self.assertEqual([entry['country_norm'] for entry in data['countries']], ['kenya'])
+
+    def test_unknown_country_and_period(self):
+        self.poe(0, 'Kenya', 'Busia', 'Malaba', 'yes')
+        self.summarise()
+
+        for params in ({'countries': 'Atlantis'}, {'period': '1999'}):
+            with self.subTest(params=params):
+                response = self.client.get('/api/v1/readiness/fvdpoe/drilldown', params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data['data']['countries'], [])
+
+    def test_hazard_without_rows(self):
+        data = self.client.get('/api/v1/readiness/lassafeverdistrict/drilldown').data['data']
+        self.assertEqual(data, {'hazard': 'lassafeverdistrict', 'data_period': None, 'countries': []})
+
+    def test_rows_without_district(self):
+        self.readiness_row(MpoxDistrict, 0, 'Uganda', 'q1', 'yes', district=None, data_period='2025')
+        self.summarise()
+
+        (uganda,) = self.client.get('/api/v1/readiness/mpoxdistrict/drilldown').data['data']['countries']
+        self.assertEqual([(entry['district'], entry['total_questions']) for entry in uganda['districts']], [(None, 1)])
+
+    def test_national_hazard_is_rejected(self):
+        response = self.client.get('/api/v1/readiness/marburg/drilldown')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('fvdpoe', response.data['data']['hazards'])
@@ -33,6 +33,7 @@ urlpatterns = [
     path('load/mpox/district', MpoxDistrictUploadView.as_view()),
     path('load/natural_disaster', NaturalDisasterUploadView.as_view()),
     path('load/riftvalley_fever', RiftValleyFeverUploadView.as_view()),
+    path('load/signal', SignalEventUploadView.as_view()),
     
     
     path('summary/arbovirus', ArboVirusSummaryView.as_view()),
@@ -54,6 +55,15 @@ urlpatterns = [
     # WHO Signal Intelligence endpoints
     path('who-data', WHODataView.as_view()),
     path('who-data/health', WHOHealthCheckView.as_view()),
+    path('who-data/catalog', WHODataCatalogView.as_view()),
+    path('who-data/excel', WHOExcelView.as_view()),
     
     path('heatmap', RegionalHeatmapAPIView.as_view()),
+    path('matrix', ReadinessMatrixView.as_view()),
+    path('<str:hazard>/dictionary', ReadinessDictionaryView.as_view()),
+    path('<str:hazard>/trend', ReadinessTrendView.as_view()),
+    path('<str:hazard>/categories', ReadinessCategoriesView.as_view()),
+    path('<str:hazard>/drilldown', ReadinessDrilldownView.as_view()),
+    path('<str:hazard>/gaps', ReadinessGapsView.as_view()),
+    path('<str:hazard>/simulate', ReadinessSimulationView.as_view()),
 ]
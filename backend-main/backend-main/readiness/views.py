@@ -1,22 +1,33 @@
 import re
-from datetime import datetime
+import json
+import hashlib
+from bisect import bisect_right
 from django.core.files.storage import default_storage
+from django.http import StreamingHttpResponse
 import pandas as pd
 from django.shortcuts import render
 from rest_framework.views import APIView
 from rest_framework import status, generics
 from rest_framework.permissions import AllowAny
-from django.db.models import Sum, F, FloatField
-from django.db.models.functions import Cast, Lower, FirstValue
+from rest_framework.utils.encoders import JSONEncoder
+from django.db.models import Sum, F, FloatField, Count, Min, Max, Q, Value, ExpressionWrapper, Avg
+from django.core.cache import cache
+from django.db.models.functions import Cast, FirstValue, Coalesce, Least, NullIf, Round
 from django_filters.rest_framework import DjangoFilterBackend
 
 from account.serializers import FileUploadSerializer
 from utils.index import gen_unique_key, custom_response
-from utils.pagination import LargeResultsSetPagination
+from utils.pagination import LargeResultsSetPagination, KnownCountPagination, encode_cursor, decode_cursor
+from utils.sparse_fields import SparseFieldsMixin
+from utils.values_serializer import ValuesListMixin
+from utils.conditional import dataset_conditional
+from utils.who_data_parser import json_safe
 from utils.filters import *
 from .models import *
 from .tasks import *
 from .serializers import *
+# Imported after the star imports, which re-export the datetime module
+from datetime import datetime
 
 class ArboVirusUploadView(APIView):
     def post(self, request, *args, **kwargs):
@@ -275,25 +286,57 @@ class RiftValleyFeverUploadView(APIView):
     
 
 
-class ArboVirusSummaryView(generics.ListAPIView):
-    serializer_class = ArbovirusSerializer
-    queryset = ArboVirus.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
-    filterset_class = ArbovirusFilter
-    filter_backends = [DjangoFilterBackend]
-    
+class SignalEventUploadView(APIView):
+    def post(self, request, *args, **kwargs):
+        serializer = FileUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        file = serializer.validated_data['file']
+        file_path = default_storage.save(f"uploads/readiness/signal/{file.name}", file)
+        load_signal_events.delay(file_path)
+
+        return custom_response(
+            "OK",
+            message="Data imported successfully",
+            data={},
+            http_status=status.HTTP_200_OK
+        )
+
+
+class ReadinessSummaryMixin(ValuesListMixin, SparseFieldsMixin):
+    """
+    Shared ``get`` for the ``summary/<hazard>`` views. Totals, completion and
+    the country list come from the ReadinessSummary rollup, and the page
+    count reuses the rollup total, so no request scans the readiness table.
+    The loaders keep the rollup current; tables loaded before it existed
+    are summarised after ``migrate``.
+    Rows support the ``fields``/``omit`` sparse fieldsets and are serialized
+    from values() rows. Responses carry the hazard's dataset version as
+    ETag, so unchanged polls get a 304.
+    """
+    hazard = None
+    pagination_class = KnownCountPagination
+
+    @dataset_conditional(lambda view, request: [view.hazard])
     def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
+        summary = ReadinessSummary.objects.filter(hazard=self.hazard)
+
+        country = request.query_params.get('country')
+        # Same normalisation as the country filter, so the rollup count matches the filtered rows
+        filtered = summary.filter(country_norm=normalize_key(country)) if country else summary
+        totals = filtered.aggregate(total=Sum('total_questions'), answered=Sum('answered_questions'))
+        total_questions = totals['total'] or 0
+        answered_questions = totals['answered'] or 0
         try:
             completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
+        except ZeroDivisionError:
             completion_pct = 0
 
+        self.paginator.known_count = total_questions
+        response = super().get(request, *args, **kwargs)
+
         return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
+                "countries": summary.values_list("country_norm", flat=True).distinct(),
                 "total_questions": total_questions,
                 "answered_questions": answered_questions,
                 "completion_pct": completion_pct,
@@ -301,427 +344,141 @@ class ArboVirusSummaryView(generics.ListAPIView):
             },
             status=status.HTTP_200_OK
         )
+
+
+class ArboVirusSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'arbovirus'
+    serializer_class = ArbovirusSerializer
+    queryset = ArboVirus.objects.all()
+    filterset_class = ArbovirusFilter
+    filter_backends = [DjangoFilterBackend]
+    
         
         
-class CholeraSummaryView(generics.ListAPIView):
+class CholeraSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'cholera'
     serializer_class = CholeraSerializer
-    queryset = Cholera.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = Cholera.objects.all()
     filterset_class = CholeraFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )
         
 
-class CholeraSubNationalSummaryView(generics.ListAPIView):
+class CholeraSubNationalSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'cholerasubnational'
     serializer_class = CholeraSubNationalSerializer
-    queryset = CholeraSubNational.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = CholeraSubNational.objects.all()
     filterset_class = CholeraSubNationalFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )
         
         
-class CycloneSummaryView(generics.ListAPIView):
+class CycloneSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'cyclone'
     serializer_class = CycloneSerializer
-    queryset = Cyclone.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = Cyclone.objects.all()
     filterset_class = CycloneFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
 
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )
 
-
-class FVDSummaryView(generics.ListAPIView):
+class FVDSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'fvd'
     serializer_class = FVDSerializer
-    queryset = FVD.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = FVD.objects.all()
     filterset_class = FvDFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )      
-        
-        
-class FVDPoESummaryView(generics.ListAPIView):
-    serializer_class = FVDPoESerializer
-    queryset = FVDPoE.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
-    filterset_class = FvDPoEFilter
-    filter_backends = [DjangoFilterBackend]
-    
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )     
         
         
-
-class FVDPoESummaryView(generics.ListAPIView):
+class FVDPoESummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'fvdpoe'
     serializer_class = FVDPoESerializer
-    queryset = FVDPoE.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = FVDPoE.objects.all()
     filterset_class = FvDPoEFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        )    
         
         
-class LassaFeverSummaryView(generics.ListAPIView):
+class LassaFeverSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'lassafever'
     serializer_class = LassaFeverSerializer
-    queryset = LassaFever.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = LassaFever.objects.all()
     filterset_class = LassaFeverFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
         
     
-class LassaFeverDistrictSummaryView(generics.ListAPIView):
+class LassaFeverDistrictSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'lassafeverdistrict'
     serializer_class = LassaFeverDistrictSerializer
-    queryset = LassaFeverDistrict.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = LassaFeverDistrict.objects.all()
     filterset_class = LassaFeverDistrictFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
             
             
-class MarburgSummaryView(generics.ListAPIView):
+class MarburgSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'marburg'
     serializer_class = MarburgSerializer
-    queryset = Marburg.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = Marburg.objects.all()
     filterset_class = MarburgFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
 
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
-
-class MeningitisSummaryView(generics.ListAPIView):
+class MeningitisSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'meningitis'
     serializer_class = MeningitisSerializer
-    queryset = Meningitis.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = Meningitis.objects.all()
     filterset_class = MeningitisFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
         
 
-class MeningitiseEliminationSummaryView(generics.ListAPIView):
+class MeningitiseEliminationSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'meningitiseelimination'
     serializer_class = MeningitisEliminationSerializer
-    queryset = MeningitiseElimination.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = MeningitiseElimination.objects.all()
     filterset_class = MeningitiseEliminationFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
 
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
-
-class MpoxSummaryView(generics.ListAPIView):
+class MpoxSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'mpox'
     serializer_class = MpoxSerializer
-    queryset = Mpox.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = Mpox.objects.all()
     filterset_class = MpoxFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
 
-class MpoxDistrictSummaryView(generics.ListAPIView):
+class MpoxDistrictSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'mpoxdistrict'
     serializer_class = MpoxDistrictSerializer
-    queryset = MpoxDistrict.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
-    filterset_class = MpoxFilter
+    queryset = MpoxDistrict.objects.all()
+    filterset_class = MpoxDistrictFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
 
-class NaturalDisasterSummaryView(generics.ListAPIView):
+class NaturalDisasterSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'naturaldisaster'
     serializer_class = NaturalDisasterSerializer
-    queryset = NaturalDisaster.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = NaturalDisaster.objects.all()
     filterset_class = NaturalDisasterFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
 
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
-
-class RiftValleyFeverSummaryView(generics.ListAPIView):
+class RiftValleyFeverSummaryView(ReadinessSummaryMixin, generics.ListAPIView):
+    hazard = 'riftvalley'
     serializer_class = RiftValleySerializer
-    queryset = RiftValleyFever.objects.all().annotate(country_lower=Lower(F('country')))
-    pagination_class=LargeResultsSetPagination
+    queryset = RiftValleyFever.objects.all()
     filterset_class = RiftValleyFilter
     filter_backends = [DjangoFilterBackend]
     
-    def get(self, request, *args, **kwargs):
-        filtered_qs = self.filter_queryset(self.get_queryset())
-        response = super().get(request, *args, **kwargs)
-        total_questions = filtered_qs.count()
-        answered_questions = filtered_qs.filter(question_score__gt=0).count()
-        try:
-            completion_pct = (answered_questions / total_questions) * 100
-        except Exception as err:
-            completion_pct = 0
-
-        return Response({
-                "countries": self.queryset.values_list("country_lower", flat=True).distinct(),
-                "total_questions": total_questions,
-                "answered_questions": answered_questions,
-                "completion_pct": completion_pct,
-                **response.data
-            },
-            status=status.HTTP_200_OK
-        ) 
 
 
 
@@ -733,69 +490,707 @@ class RiftValleyFeverSummaryView(generics.ListAPIView):
 class RegionalHeatmapAPIView(APIView):
     """
     Returns regional readiness scores as a flat array for the heatmap
+
+    Query Parameters:
+    - readiness: Hazard key (default: arbovirus)
+    - hazards: Comma separated hazard keys; returns {hazard: heatmap} for all of them at once
+
+    Scores are capped and averaged in SQL per region and cached per hazard
+    dataset version, so a reload invalidates them; the version is also the
+    response's ETag.
     """
-    def get(self, request):
+    cache_timeout = 60 * 60 * 24
+
+    def get_readiness(self, request):
         readiness = request.query_params.get('readiness', 'arbovirus')
-        qs = self.get_qs(readiness)
-        heatmap_array = []
+        return readiness if readiness in READINESS_MODELS else 'arbovirus'
+
+    def get_hazards(self, request):
+        return [hazard.strip() for hazard in request.query_params.get('hazards', '').split(',') if hazard.strip()]
+
+    @dataset_conditional(lambda view, request: view.get_hazards(request) or [view.get_readiness(request)])
+    def get(self, request):
+        hazards = self.get_hazards(request)
+        if not hazards:
+            readiness = self.get_readiness(request)
+            return Response(self.get_heatmaps([readiness])[readiness])
+
+        unknown = [hazard for hazard in hazards if hazard not in READINESS_MODELS]
+        if unknown:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazards: {', '.join(unknown)}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(self.get_heatmaps(hazards))
+
+    def get_heatmaps(self, hazards):
+        versions = DatasetVersion.get_versions(hazards)
+        keys = {hazard: f"readiness:heatmap:{hazard}:{versions[hazard]}" for hazard in hazards}
+        heatmaps = cache.get_many(list(keys.values()))
+
+        result = {}
+        for hazard, key in keys.items():
+            if key not in heatmaps:
+                heatmaps[key] = self.compute_heatmap(READINESS_MODELS[hazard].objects.all())
+                cache.set(key, heatmaps[key], self.cache_timeout)
+            result[hazard] = heatmaps[key]
+        return result
+
+    def compute_heatmap(self, qs):
+        # Weighted score per row, capped at 100%; missing values count as 0 like before
+        score = Round(Least(F('weighted_score') * 100, Value(100.0)), 2)
+        region = Coalesce(NullIf('admin_level_name', Value('')), NullIf('country', Value('')), Value('Unknown'))
+
+        rows = (
+            qs
+            .annotate(region=region)
+            .values('region')
+            .annotate(score=Avg(score), first_id=Min('id'))
+            .order_by('first_id')
+        )
+        return [{"region": row['region'], "score": round(row['score'], 2)} for row in rows]
+
+
+def readiness_cache_key(name, hazard, *params):
+    """Cache key of a per-hazard readiness response, valid until the hazard is reloaded"""
+    version = DatasetVersion.get_versions([hazard])[hazard]
+    digest = hashlib.sha1(json.dumps(params).encode()).hexdigest()
+    return f"readiness:{name}:{hazard}:{version}:{digest}"
+
 
-        for entry in qs:
-            region = entry.admin_level_name or entry.country or "Unknown"
+def country_keys(query_params):
+    """Sorted, distinct ``country_norm`` lookup keys of the comma-separated ``countries`` param"""
+    return sorted({normalize_key(item) for item in query_params.get('countries', '').split(',') if item.strip()})
 
-            # Compute weighted score
-            score = float(entry.question_score or 0) * float(entry.question_category_weight or 0)
-            score = min(score * 100, 100)  # cap at 100%
 
-            heatmap_array.append({
-                "region": region,
-                "score": round(score, 2)
+def readiness_cell(total, answered, weighted):
+    """Totals, completion and weighted score of one rollup aggregate, as returned by the API"""
+    total = total or 0
+    answered = answered or 0
+    return {
+        'total_questions': total,
+        'answered_questions': answered,
+        'completion_pct': round((answered / total) * 100, 2) if total else 0,
+        'weighted_score_sum': round(float(weighted or 0), 4),
+    }
+
+
+class ReadinessMatrixView(APIView):
+    """
+    Country x hazard readiness matrix in one response.
+
+    Query Parameters:
+    - countries: Comma separated country names (case-insensitive); default all
+    - hazards: Comma separated hazard keys (e.g. arbovirus,cholera); default all
+    - breakdown: 'category' - Add a per-category (by category code) breakdown to every cell
+
+    Cells are read from the ReadinessSummary rollup. The category breakdown
+    is a single UNION ALL aggregate over the selected hazard tables.
+    """
+
+    def get(self, request, *args, **kwargs):
+        countries = self._get_list(request.query_params, 'countries')
+        hazards = self._get_list(request.query_params, 'hazards') or list(READINESS_MODELS)
+        unknown = [hazard for hazard in hazards if hazard not in READINESS_MODELS]
+        if unknown:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazards: {', '.join(unknown)}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        summary = ReadinessSummary.objects.filter(hazard__in=hazards)
+        if countries:
+            summary = summary.filter(country_norm__in=countries)
+        rows = (
+            summary
+            .values('hazard', 'country_norm')
+            .annotate(
+                country_name=Min('country'),
+                total=Sum('total_questions'),
+                answered=Sum('answered_questions'),
+                weighted=Sum('weighted_score_sum'),
+            )
+            .order_by('country_norm', 'hazard')
+        )
+
+        matrix = {}
+        for row in rows:
+            entry = matrix.setdefault(row['country_norm'], {
+                'country': row['country_name'],
+                'country_norm': row['country_norm'],
+                'hazards': {},
             })
+            entry['hazards'][row['hazard']] = readiness_cell(row['total'], row['answered'], row['weighted'])
+
+        if request.query_params.get('breakdown') == 'category':
+            for row in self._category_rows(hazards, countries):
+                entry = matrix.get(row['country_norm'])
+                cell = entry['hazards'].get(row['hazard']) if entry else None
+                if cell is not None:
+                    cell.setdefault('categories', {})[row['category_code']] = {
+                        'category': row['category_name'],
+                        **readiness_cell(row['total'], row['answered'], row['weighted']),
+                    }
 
-        # Aggregate scores by region if multiple entries exist
-        region_map = {}
-        for item in heatmap_array:
-            region_map.setdefault(item["region"], []).append(item["score"])
+        return custom_response(
+            "OK",
+            message="Readiness matrix retrieved successfully",
+            data={
+                'hazards': hazards,
+                'countries': [entry['country'] for entry in matrix.values()],
+                'matrix': list(matrix.values()),
+            },
+            http_status=status.HTTP_200_OK
+        )
+
+    def _category_rows(self, hazards, countries):
+        """
+        Per (hazard, country, category code) aggregates of all selected tables
+        in one UNION ALL query. Codes are shared across languages, names are not.
+        """
+        querysets = []
+        for hazard in hazards:
+            queryset = READINESS_MODELS[hazard].objects.annotate(hazard=Value(hazard))
+            if countries:
+                queryset = queryset.filter(country_norm__in=countries)
+            querysets.append(
+                queryset
+                .values('hazard', 'country_norm', 'category_code')
+                .annotate(
+                    category_name=Min('category_ref__category'),
+                    total=Count('id'),
+                    answered=Count('id', filter=Q(question_score__gt=0)),
+                    weighted=Sum('weighted_score'),
+                )
+                .order_by()
+            )
+        return querysets[0].union(*querysets[1:], all=True)
+
+    def _get_list(self, query_params, name):
+        """Comma-separated query param values as lookup keys, matched against ``country_norm`` and hazard keys"""
+        value = query_params.get(name, '')
+        return [normalize_key(item) for item in value.split(',') if item.strip()]
+
+
+class ReadinessDictionaryView(APIView):
+    """
+    Question, category and comment dictionary entries of one hazard, for
+    clients that fetch readiness rows with
+    ``omit=language,question,question_language,category,category_language,comments``
+    and expand the ``question_ref``/``category_ref``/``comment_ref`` ids themselves.
+
+    Query Parameters:
+    - questions / categories / comments: Comma separated entry ids; default all entries
+    """
+
+    def get(self, request, hazard, *args, **kwargs):
+        if hazard not in READINESS_MODELS:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazard: {hazard}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = {}
+        for name, model in (
+            ('questions', ReadinessQuestion), ('categories', ReadinessCategory), ('comments', ReadinessComment),
+        ):
+            entries = model.objects.filter(hazard=hazard)
+            ids = [item for item in request.query_params.get(name, '').split(',') if item.strip().isdigit()]
+            if ids:
+                entries = entries.filter(id__in=ids)
+            data[name] = list(entries.order_by('id').values('id', *model.TEXT_FIELDS))
+
+        return custom_response(
+            "OK",
+            message="Readiness dictionary retrieved successfully",
+            data=data,
+            http_status=status.HTTP_200_OK
+        )
 
-        result_array = [
-            {"region": reg, "score": round(sum(scores) / len(scores), 2)}
-            for reg, scores in region_map.items()
+
+class ReadinessTrendView(APIView):
+    """
+    Readiness of one hazard per data period and country, for trend charts.
+
+    Query Parameters:
+    - countries: Comma separated country names (case-insensitive); default all
+    - breakdown: 'category' - Add a per-category (by category code) series to every period
+
+    Read from the ReadinessSummary and ReadinessCategorySummary rollups, so
+    the cost follows the number of countries and periods, not table rows.
+    Periods are ordered chronologically and labels that are not periods
+    (e.g. 'nan' from empty CSV cells) are left out. Hazards without data
+    periods return a single ``null`` period.
+    """
+
+    @dataset_conditional(lambda view, request: [view.kwargs['hazard']])
+    def get(self, request, hazard, *args, **kwargs):
+        if hazard not in READINESS_MODELS:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazard: {hazard}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        countries = country_keys(request.query_params)
+        summary = ReadinessSummary.objects.filter(hazard=hazard)
+        if countries:
+            summary = summary.filter(country_norm__in=countries)
+        rows = (
+            summary
+            .values('country_norm', 'data_period')
+            .annotate(
+                country_name=Min('country'),
+                total=Sum('total_questions'),
+                answered=Sum('answered_questions'),
+                weighted=Sum('weighted_score_sum'),
+            )
+            .order_by('country_norm')
+        )
+
+        trend = {}
+        for row in rows:
+            entry = trend.setdefault(row['country_norm'], {
+                'country': row['country_name'],
+                'country_norm': row['country_norm'],
+                'periods': {},
+            })
+            entry['periods'][row['data_period']] = {
+                'data_period': row['data_period'],
+                **readiness_cell(row['total'], row['answered'], row['weighted']),
+            }
+
+        if request.query_params.get('breakdown') == 'category':
+            categories = ReadinessCategorySummary.objects.filter(hazard=hazard)
+            if countries:
+                categories = categories.filter(country_norm__in=countries)
+            for row in categories.order_by('category_code'):
+                entry = trend.get(row.country_norm)
+                period = entry['periods'].get(row.data_period) if entry else None
+                if period is not None:
+                    period.setdefault('categories', {})[row.category_code] = {
+                        'category': row.category,
+                        **readiness_cell(row.total_questions, row.answered_questions, row.weighted_score_sum),
+                    }
+
+        periods = sorted(
+            {period for entry in trend.values() for period in entry['periods'] if self._is_period(period)},
+            key=self._period_key,
+        )
+        for entry in trend.values():
+            entry['periods'] = [entry['periods'][period] for period in periods if period in entry['periods']]
+        trend = {country: entry for country, entry in trend.items() if entry['periods']}
+
+        return custom_response(
+            "OK",
+            message="Readiness trend retrieved successfully",
+            data={
+                'hazard': hazard,
+                'periods': periods,
+                'countries': list(trend.values()),
+            },
+            http_status=status.HTTP_200_OK
+        )
+
+    def _is_period(self, period):
+        # Hazards without data periods have a single null period; other labels ('nan', '') are dropped
+        return period is None or data_period_key(period) is not None
+
+    def _period_key(self, period):
+        # Chronological, see data_period_key; no period goes last
+        return (period is None, data_period_key(period) or ())
+
+
+class ReadinessCategoriesView(APIView):
+    """
+    Per-category readiness scorecard of one hazard, per country.
+
+    Query Parameters:
+    - countries: Comma separated country names (case-insensitive); default all
+    - period: Only this data period (e.g. 2025, 2024-Q1); default all periods
+
+    Every category carries the same figures as the WHO parser's
+    ``get_readiness_by_category`` (mean CategoryScore, category weight and
+    grade, Yes/No NationalYN counts, completion rate) next to the usual
+    readiness cell. Read from the ReadinessCategorySummary rollup and cached
+    per dataset version.
+    """
+    cache_timeout = 60 * 60 * 24
+
+    @dataset_conditional(lambda view, request: [view.kwargs['hazard']])
+    def get(self, request, hazard, *args, **kwargs):
+        if hazard not in READINESS_MODELS:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazard: {hazard}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        countries = country_keys(request.query_params)
+        period = request.query_params.get('period') or None
+        key = readiness_cache_key('categories', hazard, countries, period)
+
+        data = cache.get(key)
+        if data is None:
+            data = {
+                'hazard': hazard,
+                'data_period': period,
+                'countries': self.get_scorecards(hazard, countries, period),
+            }
+            cache.set(key, data, self.cache_timeout)
+
+        return custom_response(
+            "OK",
+            message="Readiness categories retrieved successfully",
+            data=data,
+            http_status=status.HTTP_200_OK
+        )
+
+    def get_scorecards(self, hazard, countries, period):
+        from utils.who_data_parser import WHODataParser
+
+        summary = ReadinessCategorySummary.objects.filter(hazard=hazard)
+        if countries:
+            summary = summary.filter(country_norm__in=countries)
+        if period:
+            summary = summary.filter(data_period=period)
+        rows = (
+            summary
+            .values('country_norm', 'category_code')
+            .annotate(
+                country_name=Min('country'),
+                category_name=Min('category'),
+                total=Sum('total_questions'),
+                answered=Sum('answered_questions'),
+                weighted=Sum('weighted_score_sum'),
+                yes=Sum('yes_count'),
+                no=Sum('no_count'),
+                category_score=Sum('category_score_sum'),
+                category_weight=Max('category_weight'),
+            )
+            .order_by('country_norm', 'category_code')
+        )
+
+        scorecards = {}
+        for row in rows:
+            entry = scorecards.setdefault(row['country_norm'], {
+                'country': row['country_name'],
+                'country_norm': row['country_norm'],
+                'categories': [],
+            })
+            category_score = row['category_score'] / row['total'] if row['total'] else 0
+            entry['categories'].append({
+                'category_code': row['category_code'],
+                'category': row['category_name'],
+                'category_score': round(category_score, 4),
+                'category_weight': row['category_weight'],
+                'category_grade': WHODataParser.score_to_grade(category_score),
+                'yes_responses': row['yes'],
+                'no_responses': row['no'],
+                'completion_rate': round((row['yes'] / row['total']) * 100, 2) if row['total'] else 0,
+                **readiness_cell(row['total'], row['answered'], row['weighted']),
+            })
+        return list(scorecards.values())
+
+
+class ReadinessDrilldownView(APIView):
+    """
+    Country -> district -> PoE readiness tree of one subnational hazard
+    (cholerasubnational, mpoxdistrict, lassafeverdistrict, fvdpoe), with the
+    completion and score aggregates of every node.
+
+    Query Parameters:
+    - countries: Comma separated country names (case-insensitive); default all
+    - period: Only this data period (e.g. 2025, 2024-Q1); default all periods
+
+    Built from one ReadinessSummary query (the rollup is kept per district
+    and PoE) and cached per dataset version.
+    """
+    cache_timeout = 60 * 60 * 24
+
+    @dataset_conditional(lambda view, request: [view.kwargs['hazard']])
+    def get(self, request, hazard, *args, **kwargs):
+        hazards = self.get_hazards()
+        if hazard not in hazards:
+            return custom_response(
+                "ERROR",
+                message=f"No district drill-down for hazard: {hazard}",
+                data={'hazards': hazards},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        countries = country_keys(request.query_params)
+        period = request.query_params.get('period') or None
+        key = readiness_cache_key('drilldown', hazard, countries, period)
+
+        data = cache.get(key)
+        if data is None:
+            data = {
+                'hazard': hazard,
+                'data_period': period,
+                'countries': self.get_tree(hazard, countries, period),
+            }
+            cache.set(key, data, self.cache_timeout)
+
+        return custom_response(
+            "OK",
+            message="Readiness drill-down retrieved successfully",
+            data=data,
+            http_status=status.HTTP_200_OK
+        )
+
+    def get_hazards(self):
+        return [
+            hazard for hazard, model in READINESS_MODELS.items()
+            if any(field.name == 'district_norm' for field in model._meta.get_fields())
         ]
 
-        return Response(result_array)
-    
-    def get_qs(self, readiness):
-        if readiness == 'arbovirus':
-            return ArboVirus.objects.all()
-        elif readiness == 'cholera':
-            return Cholera.objects.all()
-        elif readiness == 'cholerasubnational':
-            return CholeraSubNational.objects.all()
-        elif readiness == 'cyclone':
-            return Cyclone.objects.all()
-        elif readiness == 'fvd':
-            return FVD.objects.all()
-        elif readiness == 'fvdpoe':
-            return FVDPoE.objects.all()
-        elif readiness == 'lassafever':
-            return LassaFever.objects.all()
-        elif readiness == 'lassafeverdistrict':
-            return LassaFeverDistrict.objects.all()
-        elif readiness == 'marburg':
-            return Marburg.objects.all()
-        elif readiness == 'meningitis':
-            return Meningitis.objects.all()
-        elif readiness == 'meningitiseelimination':
-            return MeningitiseElimination.objects.all()
-        elif readiness == 'mpox':
-            return Mpox.objects.all()
-        elif readiness == 'mpoxdistrict':
-            return MpoxDistrict.objects.all()
-        elif readiness == 'naturaldisaster':
-            return NaturalDisaster.objects.all()
-        elif readiness == 'riftvalley':
-            return RiftValleyFever.objects.all()
+    def get_tree(self, hazard, countries, period):
+        summary = ReadinessSummary.objects.filter(hazard=hazard)
+        if countries:
+            summary = summary.filter(country_norm__in=countries)
+        if period:
+            summary = summary.filter(data_period=period)
+        rows = (
+            summary
+            .values('country_norm', 'district_norm', 'poe_name')
+            .annotate(
+                country_name=Min('country'),
+                district_name=Min('district'),
+                total=Sum('total_questions'),
+                answered=Sum('answered_questions'),
+                weighted=Sum('weighted_score_sum'),
+            )
+            .order_by('country_norm', 'district_norm', 'poe_name')
+        )
+
+        with_poes = hazard == 'fvdpoe'
+        tree = {}
+        for row in rows:
+            country = tree.setdefault(row['country_norm'], {
+                'country': row['country_name'],
+                'country_norm': row['country_norm'],
+                'totals': [0, 0, 0],
+                'districts': {},
+            })
+            district = country['districts'].setdefault(row['district_norm'], {
+                'district': row['district_name'],
+                'district_norm': row['district_norm'],
+                'totals': [0, 0, 0],
+                'poes': [],
+            })
+            for node in (country, district):
+                node['totals'][0] += row['total'] or 0
+                node['totals'][1] += row['answered'] or 0
+                node['totals'][2] += row['weighted'] or 0
+            if with_poes:
+                district['poes'].append({
+                    'poe_name': row['poe_name'],
+                    **readiness_cell(row['total'], row['answered'], row['weighted']),
+                })
+
+        result = []
+        for country in tree.values():
+            districts = []
+            for district in country['districts'].values():
+                node = {
+                    'district': district['district'],
+                    'district_norm': district['district_norm'],
+                    **readiness_cell(*district['totals']),
+                }
+                if with_poes:
+                    node['poes'] = district['poes']
+                districts.append(node)
+            result.append({
+                'country': country['country'],
+                'country_norm': country['country_norm'],
+                **readiness_cell(*country['totals']),
+                'districts': districts,
+            })
+        return result
+
+
+class ReadinessGapsView(APIView):
+    """
+    Unanswered (NationalYN 'no') questions of one country, ranked by the
+    readiness they would add: question category weight x category weight.
+
+    Query Parameters:
+    - country: Country name (case-insensitive); required
+    - period: Data period (e.g. 2025, 2024-Q1); default the country's latest
+    - limit: Number of questions to return (default 20, max 100)
+
+    Ranked and limited in SQL over the per-country index of unanswered
+    questions, and cached per dataset version.
+    """
+    default_limit = 20
+    max_limit = 100
+    cache_timeout = 60 * 60 * 24
+
+    @dataset_conditional(lambda view, request: [view.kwargs['hazard']])
+    def get(self, request, hazard, *args, **kwargs):
+        if hazard not in READINESS_MODELS:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazard: {hazard}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        country = normalize_key(request.query_params.get('country', ''))
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = 0
+        if not country or not 0 < limit <= self.max_limit:
+            return custom_response(
+                "ERROR",
+                message=f"country is required and limit must be between 1 and {self.max_limit}",
+                data={},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        period = request.query_params.get('period') or None
+        key = readiness_cache_key('gaps', hazard, country, period, limit)
+        data = cache.get(key)
+        if data is None:
+            data = self.get_gaps(hazard, country, period, limit)
+            cache.set(key, data, self.cache_timeout)
+
+        return custom_response(
+            "OK",
+            message="Readiness gaps retrieved successfully",
+            data=data,
+            http_status=status.HTTP_200_OK
+        )
+
+    def get_gaps(self, hazard, country, period, limit):
+        model = READINESS_MODELS[hazard]
+        field_names = {field.name for field in model._meta.get_fields()}
+        rows = model.objects.filter(country_norm=country)
+        if 'data_period' in field_names:
+            if not period:
+                # Latest real period over all of the country's rows, as ReadinessSimulator picks it,
+                # so a fully answered latest period reports no gaps instead of an older period's
+                period = latest_data_period(rows.values_list('data_period', flat=True).distinct())
+            # Without a real period every row is period-less ('nan' and the like), see data_period_key
+            if period:
+                rows = rows.filter(data_period=period)
         else:
-            return ArboVirus.objects.all()
+            period = None
+        gaps = rows.filter(national_yn='no')
+
+        location_fields = [name for name in ('district', 'poe_name') if name in field_names]
+        gap_weight = ExpressionWrapper(
+            Coalesce(F('question_category_weight'), Value(0.0)) * Coalesce(F('category_weight'), Value(0.0)),
+            output_field=FloatField(),
+        )
+        rows = (
+            gaps
+            .annotate(gap_weight=gap_weight)
+            .order_by('-gap_weight', 'id')
+            .values(
+                'id', 'question_key', 'category_code', 'question_category_weight', 'category_weight',
+                'gap_weight', *location_fields,
+                question=F('question_ref__question'),
+                category_name=F('category_ref__category'),
+            )[:limit]
+        )
+
+        return {
+            'hazard': hazard,
+            'country_norm': country,
+            'data_period': period,
+            'total_gaps': gaps.count(),
+            'gaps': [
+                {
+                    'id': row['id'],
+                    'question_key': row['question_key'],
+                    'question': row['question'],
+                    'category_code': row['category_code'],
+                    'category': row['category_name'],
+                    **{name: row[name] for name in location_fields},
+                    'question_category_weight': row['question_category_weight'],
+                    'category_weight': row['category_weight'],
+                    'gap_weight': round(row['gap_weight'], 6),
+                }
+                for row in rows
+            ],
+        }
+
+
+class ReadinessSimulationView(APIView):
+    """
+    What-if readiness of one country: how its category and overall scores
+    (0-10, with the readiness grade) change when sets of questions flip to
+    'yes'.
+
+    Request body (JSON):
+    - country: Country name (case-insensitive); required
+    - scenarios: List of scenarios, each a list of question keys to flip
+      (e.g. from the gaps endpoint); up to 1000 per request
+
+    Scored by the hazard's shared ReadinessSimulator, so a request costs one
+    version lookup plus matrix products until the hazard is reloaded.
+    """
+    max_scenarios = 1000
+
+    def post(self, request, hazard, *args, **kwargs):
+        from utils.readiness_simulator import get_simulator
+
+        if hazard not in READINESS_MODELS:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown hazard: {hazard}",
+                data={'hazards': list(READINESS_MODELS)},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        country = normalize_key(request.data.get('country')) or ''
+        scenarios = request.data.get('scenarios')
+        valid = (
+            isinstance(scenarios, list) and 0 < len(scenarios) <= self.max_scenarios
+            and all(isinstance(scenario, list) and all(isinstance(key, str) for key in scenario) for scenario in scenarios)
+        )
+        if not country or not valid:
+            return custom_response(
+                "ERROR",
+                message=f"country and scenarios (1 to {self.max_scenarios} lists of question keys) are required",
+                data={},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        simulator = get_simulator(hazard)
+        if country not in simulator.country_index:
+            return custom_response(
+                "ERROR",
+                message=f"No {hazard} readiness data for country: {country}",
+                data={},
+                http_status=status.HTTP_404_NOT_FOUND
+            )
+        unknown = simulator.unknown_questions({key for scenario in scenarios for key in scenario})
+        if unknown:
+            return custom_response(
+                "ERROR",
+                message=f"Unknown questions: {', '.join(sorted(unknown))}",
+                data={},
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return custom_response(
+            "OK",
+            message="Readiness simulation completed successfully",
+            data={'hazard': hazard, **simulator.simulate(country, scenarios)},
+            http_status=status.HTTP_200_OK
+        )
 
 
 class WHODataView(APIView):
@@ -810,83 +1205,60 @@ class WHODataView(APIView):
     - eventType: Filter by type (PHE, SIGNAL, RRA, EIS, Readiness, ReadinessCategory)
     - grade: Filter by grade (Grade 1, 2, 3, Ungraded)
     - status: Filter by status (Ongoing, Monitoring, Closed, Assessment)
-    - source: Filter by source (WHO, EXISTING)
+    - source: Filter by source (WHO, EXISTING; EXISTING is one event per country with Mpox rows)
     - isSubnational: 'true' | 'false' - Filter by admin level
     - category: Filter by readiness category name
+    - page_size / cursor: Cursor pagination; pass the returned next_cursor to get the next page
+    - fields: Comma separated list of event fields to return (e.g. id,country,disease)
+    - stream: 'ndjson' - Stream events as newline delimited JSON instead of one JSON body
+    
+    Once signal events have been loaded into SignalEvent they replace the
+    parsed signal CSVs for every dataType, so all selections see the same
+    signal events.
     """
     permission_classes = [AllowAny]
+    default_page_size = 100
+    max_page_size = 1000
 
     def get(self, request, *args, **kwargs):
-        from utils.who_data_parser import WHODataParser, combine_and_deduplicate
+        from utils.who_data_parser import WHODataParser
+        from utils.who_event_store import get_event_store
+        from utils.who_data_refresher import is_refresher_running
 
         try:
             who_parser = WHODataParser()
             
             # Get data type filter
             data_type = request.query_params.get('dataType', 'all').lower()
-            
-            if data_type == 'signal':
-                who_events = who_parser.get_signal_events()
-            elif data_type == 'readiness_summary':
-                who_events = who_parser.get_readiness_summary()
-            elif data_type == 'readiness_category':
-                who_events = who_parser.get_readiness_categories()
-            else:
-                who_events = who_parser.parse_all_csv_files()
-
-            # Get existing data from Django models
-            existing_events = self._get_existing_events()
 
-            # Combine and deduplicate
-            all_events = combine_and_deduplicate(who_events, existing_events)
+            # Combined, deduplicated and indexed events; rebuilt only when the parse cache, the
+            # loaded signal events or the existing model events change, and off the request path (existing events query
+            # included) while the background refresher is running
+            store = get_event_store(who_parser, self._get_existing_events, allow_stale=is_refresher_running(),
+                                    signal_source=self._get_signal_source)
+            event_types = store.event_type_counts(data_type)
 
             # Apply filters from query params
-            filtered_events = self._apply_filters(all_events, request.query_params)
-            
-            # Get summary statistics
-            summary = who_parser.get_summary()
-            
-            # Count by data type
-            signal_count = len([e for e in filtered_events if e.get('dataType') == 'signal'])
-            summary_count = len([e for e in filtered_events if e.get('dataType') == 'readiness_summary'])
-            category_count = len([e for e in filtered_events if e.get('dataType') == 'readiness_category'])
+            filtered_ids = store.filter_ids(request.query_params, data_type)
+
+            try:
+                page_ids, next_cursor = self._paginate(sorted(filtered_ids), request.query_params, store.version)
+            except ValueError as e:
+                return self._bad_request(e)
+            fields = self._get_fields(request.query_params)
+
+            if request.query_params.get('stream', '').lower() in ('ndjson', 'true', '1'):
+                events = (store.events[event_id] for event_id in page_ids)
+                return self._stream_events(events, fields, next_cursor, len(filtered_ids))
+
+            filtered_events = [self._project(event, fields) for event in store.get_events(page_ids)]
             
-            # Get unique values for filters
-            unique_countries = sorted(list(set(e.get('country', '') for e in filtered_events if e.get('country'))))
-            unique_diseases = sorted(list(set(e.get('disease', '') for e in filtered_events if e.get('disease'))))
-            unique_categories = sorted(list(set(e.get('category', '') for e in filtered_events if e.get('category'))))
+            # Data type counts and filter values in one pass, memoized per filter selection
+            described = store.describe(filtered_ids, store.filter_key(request.query_params, data_type))
 
-            return custom_response(
-                "OK",
-                message="WHO data retrieved successfully",
-                data={
-                    'events': filtered_events,
-                    'metadata': {
-                        'total_events': len(filtered_events),
-                        'by_data_type': {
-                            'signal_events': signal_count,
-                            'readiness_summaries': summary_count,
-                            'readiness_categories': category_count,
-                        },
-                        'existing_events': len(existing_events),
-                        'last_updated': datetime.now().isoformat(),
-                        'files_summary': summary,
-                        'filters': {
-                            'countries': unique_countries,
-                            'diseases': unique_diseases,
-                            'categories': unique_categories,
-                        },
-                        'event_types': {
-                            'phe': len([e for e in who_events if e.get('eventType') == 'PHE']),
-                            'signal': len([e for e in who_events if e.get('eventType') == 'SIGNAL']),
-                            'rra': len([e for e in who_events if e.get('eventType') == 'RRA']),
-                            'eis': len([e for e in who_events if e.get('eventType') == 'EIS']),
-                            'readiness': len([e for e in who_events if e.get('eventType') == 'Readiness']),
-                            'readiness_category': len([e for e in who_events if e.get('eventType') == 'ReadinessCategory']),
-                        }
-                    }
-                },
-                http_status=status.HTTP_200_OK
+            return self._build_response(
+                filtered_events, next_cursor, len(filtered_ids), described['by_data_type'],
+                described['facets'], event_types, store.existing_count, who_parser.get_summary()
             )
         except Exception as e:
             import traceback
@@ -897,19 +1269,150 @@ class WHODataView(APIView):
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _build_response(self, events, next_cursor, total, by_data_type, facets, event_types,
+                        existing_count, files_summary):
+        return custom_response(
+            "OK",
+            message="WHO data retrieved successfully",
+            data={
+                'events': events,
+                'next_cursor': next_cursor,
+                'metadata': {
+                    'total_events': total,
+                    'by_data_type': {
+                        'signal_events': by_data_type['signal'],
+                        'readiness_summaries': by_data_type['readiness_summary'],
+                        'readiness_categories': by_data_type['readiness_category'],
+                    },
+                    'existing_events': existing_count,
+                    'last_updated': datetime.now().isoformat(),
+                    'files_summary': files_summary,
+                    'filters': {
+                        'countries': facets['country'],
+                        'diseases': facets['disease'],
+                        'categories': facets['category'],
+                    },
+                    'event_types': {
+                        'phe': event_types['PHE'],
+                        'signal': event_types['SIGNAL'],
+                        'rra': event_types['RRA'],
+                        'eis': event_types['EIS'],
+                        'readiness': event_types['Readiness'],
+                        'readiness_category': event_types['ReadinessCategory'],
+                    }
+                }
+            },
+            http_status=status.HTTP_200_OK
+        )
+
+    def _bad_request(self, error):
+        return custom_response(
+            "ERROR",
+            message=str(error),
+            data={},
+            http_status=status.HTTP_400_BAD_REQUEST
+        )
+
+    def _paginate(self, ids, query_params, version):
+        """
+        Cursor pagination over the sorted event ids. The cursor carries the
+        store version so a page is never resolved against a rebuilt store.
+        Without ``cursor`` or ``page_size`` every event is returned.
+        """
+        cursor = query_params.get('cursor')
+        page_size = self._get_page_size(query_params)
+        if page_size is None:
+            return ids, None
+
+        start = 0
+        if cursor:
+            cursor_version, last_id = decode_cursor(cursor, 2)
+            if cursor_version != version:
+                raise ValueError("Cursor is stale, the WHO data has changed. Restart from the first page")
+            if not last_id.isdigit():
+                raise ValueError("Invalid cursor")
+            start = bisect_right(ids, int(last_id))
+
+        page_ids = ids[start:start + page_size]
+        next_cursor = None
+        if start + page_size < len(ids):
+            next_cursor = encode_cursor(version, page_ids[-1])
+        return page_ids, next_cursor
+
+    def _get_page_size(self, query_params):
+        """Requested page size, or None when the client did not ask for pagination"""
+        page_size = query_params.get('page_size')
+        if not query_params.get('cursor') and not page_size:
+            return None
+        try:
+            page_size = min(int(page_size or self.default_page_size), self.max_page_size)
+        except ValueError:
+            raise ValueError("page_size must be an integer")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        return page_size
+
+    def _get_fields(self, query_params):
+        fields = query_params.get('fields')
+        if not fields:
+            return None
+        return [field.strip() for field in fields.split(',') if field.strip()]
+
+    def _project(self, event, fields):
+        if fields is None:
+            return event
+        return {field: event[field] for field in fields if field in event}
+
+    def _stream_events(self, events, fields, next_cursor, total):
+        """
+        Stream events one JSON document per line so memory stays bounded per
+        request. Missing float values are written as null, never as bare NaN.
+        """
+        def generate():
+            for event in events:
+                yield json.dumps(json_safe(self._project(event, fields)), cls=JSONEncoder, allow_nan=False) + "\n"
+
+        response = StreamingHttpResponse(generate(), content_type='application/x-ndjson')
+        response['X-Total-Count'] = str(total)
+        if next_cursor:
+            response['X-Next-Cursor'] = next_cursor
+        return response
+
+    def _get_signal_source(self):
+        """
+        (version, loader) of the signal events loaded into SignalEvent, or None
+        while the table is empty and the signal CSVs are served as parsed
+        """
+        count = SignalEvent.objects.count()
+        if not count:
+            return None
+        version = f"{DatasetVersion.get_versions(['signal'])['signal']}-{count}"
+        return version, lambda: [json_safe(event.as_event()) for event in SignalEvent.objects.order_by('pk')]
+
     def _get_existing_events(self):
-        """Fetch existing events from Django models and convert to dict format"""
+        """
+        Fetch existing events from Django models and convert to dict format.
+        Rows are grouped per country in SQL, since every row of a country maps
+        to the same event after deduplication.
+
+        Behaviour change: the original query asked Mpox for a ``year`` field
+        it does not have, so it always failed and no existing events were
+        ever returned. Every country with Mpox readiness rows now adds one
+        ``source: EXISTING`` event to the response, counted in
+        ``metadata.existing_events``.
+        """
         existing_events = []
         
         try:
-            mpox_data = Mpox.objects.all().values('country', 'year')
-            for item in mpox_data:
+            mpox_countries = Mpox.objects.values('country').annotate(rows=Count('id')).order_by('country')
+            report_date = datetime.now().isoformat()
+            for item in mpox_countries:
                 existing_events.append({
                     'source': 'EXISTING',
                     'dataType': 'existing',
                     'country': item.get('country', 'Unknown'),
                     'disease': 'Mpox',
-                    'year': item.get('year', 2025),
+                    'year': datetime.now().year,
                     'eventType': 'Readiness',
                     'status': 'Monitoring',
                     'grade': 'Ungraded',
@@ -918,69 +1421,95 @@ class WHODataView(APIView):
                     'cases': 0,
                     'deaths': 0,
                     'description': 'Mpox readiness data',
-                    'reportDate': datetime.now().isoformat()
+                    'reportDate': report_date,
+                    'source_priority': 2
                 })
         except Exception as e:
             print(f"Error fetching existing events: {e}")
 
         return existing_events
 
-    def _apply_filters(self, events, query_params):
-        """Apply query parameter filters to events"""
-        filtered = events
 
-        # Filter by country
-        country = query_params.get('country')
-        if country:
-            filtered = [e for e in filtered if e.get('country', '').lower() == country.lower()]
+class WHODataCatalogView(APIView):
+    """
+    Distinct countries, districts, diseases and data periods available in
+    the WHO CSV sources, for populating filter dropdowns. Served from the
+    parser's per-file catalog, so no CSV is read unless it has changed.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        from utils.who_data_parser import WHODataParser
 
-        # Filter by disease
-        disease = query_params.get('disease')
-        if disease:
-            filtered = [e for e in filtered if disease.lower() in e.get('disease', '').lower()]
+        catalog = WHODataParser().get_catalog()
+        return custom_response(
+            "OK",
+            message="WHO data catalog retrieved successfully",
+            data=catalog,
+            http_status=status.HTTP_200_OK
+        )
+
+
+class WHOExcelView(APIView):
+    """
+    Lazy access to the WHO Excel workbooks. Only the requested sheet is parsed.
+    
+    Query Parameters:
+    - file: Workbook name; without it every workbook's sheets and columns are listed
+    - sheet: Sheet name; without it the workbook's sheets and columns are listed
+    - offset / limit: Row slice of the sheet to return (default: all rows)
+    """
+    permission_classes = [AllowAny]
 
-        # Filter by event type
-        event_type = query_params.get('eventType')
-        if event_type:
-            filtered = [e for e in filtered if e.get('eventType', '').upper() == event_type.upper()]
+    def get(self, request, *args, **kwargs):
+        from utils.who_data_parser import WHODataParser
 
-        # Filter by grade
-        grade = query_params.get('grade')
-        if grade:
-            filtered = [e for e in filtered if grade.lower() in e.get('grade', '').lower()]
+        parser = WHODataParser()
+        excel_file = request.query_params.get('file')
+        sheet_name = request.query_params.get('sheet')
 
-        # Filter by status
-        status_filter = query_params.get('status')
-        if status_filter:
-            filtered = [e for e in filtered if e.get('status', '').lower() == status_filter.lower()]
+        try:
+            if not excel_file:
+                data = {name: parser.get_excel_outline(name) for name in parser.get_all_excel_files()}
+            elif not sheet_name:
+                data = parser.get_excel_outline(excel_file)
+            else:
+                offset, limit = self._get_slice(request.query_params)
+                stop = offset + limit if limit is not None else None
+                data = parser.load_excel_sheet(excel_file, sheet_name, offset, stop)
+        except FileNotFoundError as e:
+            return custom_response("ERROR", message=str(e), data={}, http_status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return custom_response("ERROR", message=str(e), data={}, http_status=status.HTTP_400_BAD_REQUEST)
 
-        # Filter by source
-        source = query_params.get('source')
-        if source:
-            filtered = [e for e in filtered if e.get('source', '').upper() == source.upper()]
-        
-        # Filter by subnational
-        is_subnational = query_params.get('isSubnational')
-        if is_subnational:
-            is_sub = is_subnational.lower() == 'true'
-            filtered = [e for e in filtered if e.get('isSubnational', False) == is_sub]
-        
-        # Filter by category (for readiness_category data)
-        category = query_params.get('category')
-        if category:
-            filtered = [e for e in filtered if category.lower() in e.get('category', '').lower()]
+        return custom_response(
+            "OK",
+            message="WHO Excel data retrieved successfully",
+            data=data,
+            http_status=status.HTTP_200_OK
+        )
 
-        return filtered
+    def _get_slice(self, query_params):
+        try:
+            offset = int(query_params.get('offset', 0))
+            limit = int(query_params['limit']) if 'limit' in query_params else None
+        except ValueError:
+            raise ValueError("offset and limit must be integers")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must be non-negative")
+        return offset, limit
 
 
 class WHOHealthCheckView(APIView):
     """
     Health check endpoint for WHO data integration.
+    Also reports whether the in-process WHO data cache is warm.
     """
     permission_classes = [AllowAny]
 
     def get(self, request, *args, **kwargs):
         from utils.who_data_parser import WHODataParser
+        from utils.who_data_refresher import get_cache_status
         import os
 
         parser = WHODataParser()
@@ -1000,7 +1529,8 @@ class WHOHealthCheckView(APIView):
                 'status': 'healthy' if all_files_present else 'degraded',
                 'summary': summary,
                 'csv_files': csv_status,
-                'who_data_dir': parser.who_data_dir
+                'who_data_dir': parser.who_data_dir,
+                'cache': get_cache_status()
             },
             http_status=status.HTTP_200_OK
         )
\ No newline at end of file
@@ -3,6 +3,8 @@ import pandas as pd
 from celery import shared_task
 from .models import *
 from utils.index import *
+from readiness.models import DatasetVersion
+from utils.storage import read_storage_csv
 
 def normalize_text(text:str)->str:
     # remove prefix "_" if it exists
@@ -26,16 +28,16 @@ def extract_base_data(row):
 @shared_task
 def load_stardata(file_path):
     print("START LOADING STARDATA")
-    file = default_storage.open(file_path, mode="rb")
-    df = pd.read_csv(file)
+    df = read_storage_csv(file_path)
     df = df.where(pd.notna(df), None)  # NaN → None
 
-    for idx, row in df.iterrows():
-        base_data = extract_base_data(row)
-        unique_key = gen_unique_key('stardata', idx)
+    with DatasetVersion.loading('stardata'):
+        for idx, row in df.iterrows():
+            base_data = extract_base_data(row)
+            unique_key = gen_unique_key('stardata', idx)
 
-        StarData.objects.update_or_create(
-            key_on_table=unique_key,
-            defaults=base_data
-        )
+            StarData.objects.update_or_create(
+                key_on_table=unique_key,
+                defaults=base_data
+            )
     print("END LOADING STARDATA")
\ No newline at end of file
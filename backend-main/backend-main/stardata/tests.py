@@ -1,3 +1,55 @@
-from django.test import TestCase
+import io
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+
+from readiness.models import DatasetVersion
+from stardata.models import StarData
+from stardata.tasks import extract_base_data, load_stardata
+
+
+class LoadStarDataTests(TestCase):
+    """Rows and the dataset version of a load are written together"""
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings = override_settings(MEDIA_ROOT=media_root.name, UPLOAD_COLUMNAR_CACHE_DIR=f'{media_root.name}/.columnar')
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.path = default_storage.save(
+            'uploads/stardata/stardata.csv', ContentFile(b'_N,Country,Hazard\n1,Kenya,Flood\n2,Uganda,Drought\n'),
+        )
+
+    def load(self):
+        with redirect_stdout(io.StringIO()):
+            load_stardata(self.path)
+
+    def test_load_bumps_version(self):
+        self.load()
+
+        self.assertEqual(StarData.objects.count(), 2)
+        self.assertEqual(DatasetVersion.get_versions(['stardata']), {'stardata': 1})
+
+    def test_failed_load_keeps_rows_and_version(self):
+        self.load()
+        rows = [extract_base_data, mock.Mock(side_effect=RuntimeError('boom'))]
+        with mock.patch('stardata.tasks.extract_base_data', side_effect=lambda row: rows.pop(0)(row)):
+            with self.assertRaises(RuntimeError):
+                self.load()
+
+        self.assertEqual(StarData.objects.count(), 2)
+        self.assertEqual(DatasetVersion.get_versions(['stardata']), {'stardata': 1})
+
+    def test_failed_first_load_writes_nothing(self):
+        rows = [extract_base_data, mock.Mock(side_effect=RuntimeError('boom'))]
+        with mock.patch('stardata.tasks.extract_base_data', side_effect=lambda row: rows.pop(0)(row)):
+            with self.assertRaises(RuntimeError):
+                self.load()
+
+        self.assertFalse(StarData.objects.exists())
+        self.assertEqual(DatasetVersion.get_versions(['stardata']), {'stardata': 0})
@@ -9,6 +9,8 @@ from django.db.models.functions import Trim
 from account.serializers import FileUploadSerializer
 from utils.index import custom_response
 from utils.pagination import *
+from utils.sparse_fields import SparseFieldsMixin
+from utils.values_serializer import ValuesListMixin
 from utils.filters import *
 from .models import *
 from .tasks import *
@@ -31,10 +33,10 @@ class StardataUploadView(APIView):
         )
 
 
-class StardataListView(generics.ListAPIView):
+class StardataListView(ValuesListMixin, SparseFieldsMixin, generics.ListAPIView):
     serializer_class=StardataSerializer
     queryset=StarData.objects.all()
-    pagination_class=LargeResultsSetPagination
+    pagination_class=SelectablePagination
     filterset_class = StardataFilter
     filter_backends = [DjangoFilterBackend]
     
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+
+class ColumnarCache:
+    """
+    Sidecar cache that keeps a columnar (Feather) copy of every source CSV
+    or Excel sheet it is asked to read.
+
+    Each source (file name, sheet and read options) has its own small
+    manifest entry under ``manifest/`` recording the SHA-1 of the source
+    bytes, its mtime and size, and the Feather file holding its parsed frame.
+    Entries and sidecars are written to a temporary file and moved into place
+    with ``os.replace``, so concurrent processes never see a partial write and
+    never overwrite each other's entries. Sidecars are named after the source
+    hash, so the same bytes under another name (a re-upload, a fresh
+    checkout) reuse the existing sidecar. Later reads - from any process,
+    across restarts - memory-map the Feather file instead of re-parsing the
+    source. When pyarrow is not installed the cache is a no-op and every read
+    goes straight to pandas.
+    """
+
+    MANIFEST_DIR = 'manifest'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    @property
+    def enabled(self) -> bool:
+        return feather is not None
+
+    def read_csv(self, file_path: str, **kwargs) -> pd.DataFrame:
+        """Read a CSV file through the cache"""
+        return self._read(file_path, None, kwargs, lambda: pd.read_csv(file_path, **kwargs))
+
+    def read_excel(self, file_path: str, sheet_name: str, workbook: pd.ExcelFile = None, **kwargs) -> pd.DataFrame:
+        """
+        Read a single Excel sheet through the cache. Pass an already opened
+        ``workbook`` to avoid re-opening the file for every sheet on a miss.
+        """
+        return self._read(
+            file_path, sheet_name, kwargs,
+            lambda: pd.read_excel(workbook if workbook is not None else file_path, sheet_name=sheet_name, **kwargs)
+        )
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """Drop the manifest entries and sidecars of one source file, or of all of them"""
+        prefix = f"{os.path.basename(file_path)}::" if file_path is not None else ''
+        for entry_path, entry in self._iter_entries():
+            if entry.get('key', '').startswith(prefix):
+                self._remove_file(entry.get('file'))
+                os.remove(entry_path)
+
+    def _read(self, file_path: str, sheet_name: Optional[str], options: Dict[str, Any],
+              loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        if not self.enabled:
+            return loader()
+
+        key = self._entry_key(file_path, sheet_name, options)
+        stat = os.stat(file_path)
+        entry = self._read_entry(key)
+
+        # Fast path: the source is untouched since the sidecar was written
+        if entry and entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+            if entry.get('file') is None:
+                # Known not to fit a columnar layout; don't retry the conversion
+                return loader()
+            df = self._load_sidecar(entry.get('file'))
+            if df is not None:
+                return df
+
+        source_hash = self._hash_file(file_path)
+        sidecar_name = self._sidecar_name(source_hash, sheet_name, options)
+        # Same bytes under a new mtime or name (a fresh checkout, a re-upload): reuse the sidecar
+        df = self._load_sidecar(sidecar_name)
+        if df is None:
+            df = loader()
+            if not self._write_sidecar(df, sidecar_name):
+                sidecar_name = None
+        if entry and entry.get('file') not in (None, sidecar_name):
+            self._remove_file(entry.get('file'))
+        self._write_entry(key, {
+            'key': key,
+            'hash': source_hash,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'file': sidecar_name,
+        })
+        return df
+
+    def _entry_key(self, file_path: str, sheet_name: Optional[str], options: Dict[str, Any]) -> str:
+        return f"{os.path.basename(file_path)}::{sheet_name or ''}::{json.dumps(options, sort_keys=True, default=str)}"
+
+    def _sidecar_name(self, source_hash: str, sheet_name: Optional[str], options: Dict[str, Any]) -> str:
+        read_key = f"{sheet_name or ''}::{json.dumps(options, sort_keys=True, default=str)}"
+        return f"{source_hash[:20]}-{hashlib.sha1(read_key.encode()).hexdigest()[:12]}.feather"
+
+    def _hash_file(self, file_path: str) -> str:
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(self.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_sidecar(self, sidecar_name: Optional[str]) -> Optional[pd.DataFrame]:
+        if not sidecar_name:
+            return None
+        path = os.path.join(self.cache_dir, sidecar_name)
+        if not os.path.isfile(path):
+            return None
+        try:
+            return feather.read_table(path, memory_map=True).to_pandas()
+        except Exception as e:
+            # A truncated or corrupt sidecar is dropped and rebuilt from the source
+            print(f"❌ Error reading columnar cache {path}: {e}")
+            self._remove_file(sidecar_name)
+            return None
+
+    def _write_sidecar(self, df: pd.DataFrame, sidecar_name: str) -> bool:
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            os.close(fd)
+            df.to_feather(tmp_path)
+            os.replace(tmp_path, os.path.join(self.cache_dir, sidecar_name))
+            return True
+        except Exception as e:
+            # Mixed-type object columns or non-string headers cannot be stored as Feather;
+            # those sources are recorded as uncacheable and parsed on every read.
+            print(f"⚠️ Skipping columnar cache for {sidecar_name}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def _remove_file(self, name: Optional[str]):
+        if not name:
+            return
+        path = os.path.join(self.cache_dir, name)
+        if os.path.isfile(path):
+            os.remove(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, self.MANIFEST_DIR, f"{hashlib.sha1(key.encode()).hexdigest()}.json")
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(key)) as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get('key') == key else None
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]):
+        manifest_dir = os.path.join(self.cache_dir, self.MANIFEST_DIR)
+        os.makedirs(manifest_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as fh:
+            json.dump(entry, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._entry_path(key))
+
+    def _iter_entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """(path, entry) of every manifest entry"""
+        manifest_dir = os.path.join(self.cache_dir, self.MANIFEST_DIR)
+        if not os.path.isdir(manifest_dir):
+            return
+        for name in sorted(os.listdir(manifest_dir)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(manifest_dir, name)
+            try:
+                with open(path) as fh:
+                    yield path, json.load(fh)
+            except (OSError, ValueError):
+                continue
@@ -0,0 +1,39 @@
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from readiness.models import DatasetVersion
+
+
+def dataset_conditional(datasets):
+    """
+    Conditional GET for view ``get`` methods whose response only changes
+    when a loader runs.
+
+    The ETag and Last-Modified headers are derived from the DatasetVersion
+    of ``datasets`` (a list, or a callable taking the view and request), so
+    a client sending them back gets a ``304 Not Modified`` for the cost of
+    one small query until one of those datasets is reloaded.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            names = datasets(view, request) if callable(datasets) else datasets
+            etag, last_modified = DatasetVersion.get_state(names)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            # Cached per user, always revalidated
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
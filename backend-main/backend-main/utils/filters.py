@@ -58,7 +58,7 @@ class ArbovirusFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = ArboVirus
@@ -70,7 +70,7 @@ class CholeraFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = Cholera
@@ -81,7 +81,7 @@ class CholeraSubNationalFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = CholeraSubNational
@@ -92,7 +92,7 @@ class CycloneFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = Cyclone
@@ -104,7 +104,7 @@ class FvDFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = FVD
@@ -116,7 +116,7 @@ class FvDPoEFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = FVDPoE
@@ -128,7 +128,7 @@ class LassaFeverFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = LassaFever
@@ -140,7 +140,7 @@ class LassaFeverDistrictFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = LassaFeverDistrict
@@ -152,7 +152,7 @@ class MarburgFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = Marburg
@@ -164,7 +164,7 @@ class MeningitisFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = Meningitis
@@ -176,7 +176,7 @@ class MeningitiseEliminationFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = MeningitiseElimination
@@ -188,7 +188,7 @@ class MpoxFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = Mpox
@@ -199,7 +199,7 @@ class MpoxDistrictFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = MpoxDistrict
@@ -210,7 +210,7 @@ class NaturalDisasterFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = NaturalDisaster
@@ -221,7 +221,7 @@ class RiftValleyFilter(django_filters.FilterSet):
     def filter_country(self, queryset, name, value):
         return (
             queryset
-            .filter(country_lower=value.lower())
+            .filter(country_norm=normalize_key(value))
         )
     class Meta:
         model = RiftValleyFever
@@ -1,5 +1,7 @@
 # This file contain the pagination classes 
-from rest_framework.pagination import PageNumberPagination
+import base64
+from django.core.paginator import Paginator as DjangoPaginator
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 6
@@ -12,3 +14,98 @@ class LargeResultsSetPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 1000
 
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on the primary key. Every page is a ``pk > last``
+    range scan, so page 700 costs the same as page 1, and no COUNT query
+    runs unless ``with_count=true`` is passed.
+    """
+    ordering = 'pk'
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    count_query_param = 'with_count'
+    count = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true'):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data = {'count': self.count, **response.data}
+        return response
+
+
+class SelectablePagination(LargeResultsSetPagination):
+    """
+    LargeResultsSetPagination by default; ``?pagination=cursor`` (or a
+    ``cursor`` from a previous keyset page) switches the request to
+    KeysetPagination. Views that should always be keyset paginated set
+    ``pagination_class = KeysetPagination`` instead.
+    """
+    pagination_query_param = 'pagination'
+    cursor_pagination_class = KeysetPagination
+    cursor_paginator = None
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.pagination_query_param) == 'cursor'
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = self.cursor_pagination_class() if self.use_cursor(request) else None
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class KnownCountPagination(SelectablePagination):
+    """
+    SelectablePagination that takes the total from ``known_count`` when
+    the view already has it (e.g. from a rollup table) instead of running a
+    COUNT query. Keyset pages report it as ``count`` for free.
+    """
+    known_count = None
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.known_count is not None:
+            # Paginator.count is a cached_property; seed it
+            paginator.count = self.known_count
+        return paginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.cursor_paginator is not None and self.known_count is not None:
+            response.data = {'count': self.known_count, **response.data}
+        return response
+
+
+def encode_cursor(*parts) -> str:
+    """Opaque, url-safe cursor built from the given parts"""
+    raw = ":".join(str(part) for part in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_parts: int) -> list:
+    """Inverse of ``encode_cursor``; raises ValueError on a malformed cursor"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    parts = raw.rsplit(":", expected_parts - 1)
+    if len(parts) != expected_parts:
+        raise ValueError("Invalid cursor")
+    return parts
@@ -0,0 +1,156 @@
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from readiness.models import READINESS_MODELS, DatasetVersion, data_period_key, latest_data_period
+from utils.who_data_parser import WHODataParser
+
+
+class ReadinessSimulator:
+    """
+    What-if readiness of one hazard, held as dense NumPy arrays.
+
+    Built from each country's latest data period (by ``data_period_key``).
+    Every question key is a column with, per country, its question category
+    weight (``weights``) and share of 'yes' answers (``answers``, averaged
+    over districts and PoEs), and ``categories`` maps questions to category
+    codes as a one-hot matrix.
+
+    A category scores 10 x sum(weight x answer) / sum(weight) over its
+    questions and the overall score is the category weight average of the
+    category scores, on the 0-10 scale of the readiness grades. Scoring any
+    number of scenarios (sets of questions flipped to 'yes') for a country
+    is one mask and two matrix products.
+    """
+
+    def __init__(self, hazard: str, version: int = 0):
+        self.hazard = hazard
+        self.version = version
+        model = READINESS_MODELS[hazard]
+        has_period = any(field.name == 'data_period' for field in model._meta.get_fields())
+        columns = ['country_norm', 'country', 'question_key', 'category_code',
+                   'question_category_weight', 'category_weight', 'national_yn']
+        if has_period:
+            columns.append('data_period')
+
+        df = pd.DataFrame.from_records(
+            model.objects.exclude(question_key=None).exclude(country_norm=None).values_list(*columns),
+            columns=columns,
+        )
+        if has_period:
+            # Labels that are not periods (e.g. 'nan' from empty CSV cells) count as no period, see data_period_key
+            periods = {label for label in df['data_period'].unique() if data_period_key(label)}
+            df['data_period'] = df['data_period'].where(df['data_period'].isin(periods), '')
+        else:
+            df['data_period'] = ''
+        # Each country's latest real period; a country without one keeps its period-less rows
+        latest = (
+            df[df['data_period'] != '']
+            .groupby('country_norm')['data_period']
+            .agg(latest_data_period)
+        )
+        df = df[df['data_period'] == df['country_norm'].map(latest).fillna('')]
+        df['category_code'] = df['category_code'].fillna('')
+        df['weight'] = df['question_category_weight'].fillna(0.0).astype(float)
+        df['category_weight'] = df['category_weight'].fillna(0.0).astype(float)
+        df['answer'] = (df['national_yn'] == 'yes').astype(float)
+
+        countries = df.groupby('country_norm').agg(country=('country', 'first'), data_period=('data_period', 'first'))
+        self.countries: List[str] = list(countries.index)
+        self.country_names: List[str] = list(countries['country'])
+        self.data_periods: List[Optional[str]] = [period or None for period in countries['data_period']] if has_period else [None] * len(countries)
+        self.country_index = {country: i for i, country in enumerate(self.countries)}
+
+        question_categories = df.groupby('question_key')['category_code'].first()
+        self.questions: List[str] = list(question_categories.index)
+        self.question_index = {question: i for i, question in enumerate(self.questions)}
+        self.category_codes: List[str] = sorted(set(question_categories))
+        category_index = {code: i for i, code in enumerate(self.category_codes)}
+
+        shape = (len(self.countries), len(self.questions))
+        self.weights = np.zeros(shape)
+        self.answers = np.zeros(shape)
+        cells = df.groupby(['country_norm', 'question_key']).agg(weight=('weight', 'mean'), answer=('answer', 'mean'))
+        rows = [self.country_index[country] for country, _ in cells.index]
+        cols = [self.question_index[question] for _, question in cells.index]
+        self.weights[rows, cols] = cells['weight'].to_numpy()
+        self.answers[rows, cols] = cells['answer'].to_numpy()
+
+        self.categories = np.zeros((len(self.questions), len(self.category_codes)))
+        self.categories[np.arange(len(self.questions)), [category_index[code] for code in question_categories]] = 1
+
+        self.category_weights = np.zeros((len(self.countries), len(self.category_codes)))
+        category_weights = df.groupby(['country_norm', 'category_code'])['category_weight'].max()
+        rows = [self.country_index[country] for country, _ in category_weights.index]
+        cols = [category_index[code] for _, code in category_weights.index]
+        self.category_weights[rows, cols] = category_weights.to_numpy()
+
+    def unknown_questions(self, question_keys: Sequence[str]) -> List[str]:
+        return [key for key in question_keys if key not in self.question_index]
+
+    def simulate(self, country: str, scenarios: Sequence[Sequence[str]]) -> Dict[str, Any]:
+        """
+        Baseline and per-scenario scores of ``country``, each scenario being
+        the question keys flipped to 'yes'. Questions must be known (see
+        ``unknown_questions``); questions the country was not asked change
+        nothing.
+        """
+        c = self.country_index[country]
+        flips = np.zeros((len(scenarios) + 1, len(self.questions)), dtype=bool)
+        for i, scenario in enumerate(scenarios, start=1):
+            flips[i, [self.question_index[key] for key in scenario]] = True
+
+        weights = self.weights[c]
+        answers = np.where(flips, 1.0, self.answers[c])
+        category_totals = weights @ self.categories
+        scored = category_totals > 0
+        category_scores = np.divide(
+            10 * ((answers * weights) @ self.categories), category_totals,
+            out=np.zeros((len(flips), len(self.category_codes))), where=scored,
+        )
+        category_weights = self.category_weights[c] * scored
+        weight_total = category_weights.sum()
+        overall = category_scores @ category_weights / weight_total if weight_total else np.zeros(len(flips))
+
+        codes = [code for code, is_scored in zip(self.category_codes, scored) if is_scored]
+        results = [
+            {
+                'overall_score': round(float(overall[i]), 4),
+                'grade': WHODataParser.score_to_grade(float(overall[i])),
+                'categories': {code: round(float(score), 4) for code, score in zip(codes, category_scores[i, scored])},
+            }
+            for i in range(len(flips))
+        ]
+        baseline = results[0]
+        for scenario, result in zip(scenarios, results[1:]):
+            result['flips'] = list(scenario)
+            result['overall_delta'] = round(result['overall_score'] - baseline['overall_score'], 4)
+
+        return {
+            'country': self.country_names[c],
+            'country_norm': country,
+            'data_period': self.data_periods[c],
+            'baseline': baseline,
+            'scenarios': results[1:],
+        }
+
+
+_simulators: Dict[str, ReadinessSimulator] = {}
+_simulators_lock = threading.Lock()
+
+
+def get_simulator(hazard: str) -> ReadinessSimulator:
+    """Shared simulator of ``hazard``, rebuilt only when the hazard's dataset version changes"""
+    version = DatasetVersion.get_versions([hazard])[hazard]
+    with _simulators_lock:
+        simulator = _simulators.get(hazard)
+        if simulator is not None and simulator.version == version:
+            return simulator
+
+    # Built outside the lock and swapped in whole, so readers never see a partial simulator
+    simulator = ReadinessSimulator(hazard, version)
+    with _simulators_lock:
+        _simulators[hazard] = simulator
+    return simulator
@@ -0,0 +1,79 @@
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsMixin:
+    """
+    List view mixin adding ``fields`` and ``omit`` query parameters
+    (comma separated serializer field names).
+
+    The projection is pushed down to the query: only the selected columns
+    are loaded with ``.only()``, foreign keys behind dotted serializer
+    sources (e.g. the readiness question dictionary) are joined, and reverse
+    relations (e.g. ESPAR indicators) are prefetched only when they are
+    selected. Fields that are not selected are dropped from the serializer.
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+
+    def get_serializer_field_names(self):
+        return list(self.get_serializer_class()().fields)
+
+    def get_requested_fields(self):
+        """Selected serializer field names, or None when every field is returned"""
+        if getattr(self, '_requested_fields', False) is not False:
+            return self._requested_fields
+
+        fields = self._get_list(self.fields_query_param)
+        omit = self._get_list(self.omit_query_param)
+        requested = None
+        if fields or omit:
+            available = self.get_serializer_field_names()
+            unknown = [name for name in fields + omit if name not in available]
+            if unknown:
+                raise ValidationError({'fields': f"Unknown fields: {', '.join(unknown)}"})
+            requested = [name for name in (fields or available) if name not in omit]
+
+        self._requested_fields = requested
+        return requested
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        requested = self.get_requested_fields()
+        serializer_fields = self.get_serializer_class()().fields
+
+        columns, select, prefetch = [], [], []
+        model_fields = {field.name: field for field in queryset.model._meta.get_fields()}
+        for name in requested if requested is not None else serializer_fields:
+            source_attrs = serializer_fields[name].source_attrs
+            field = model_fields.get(source_attrs[0]) if source_attrs else None
+            if field is None:
+                continue
+            if len(source_attrs) > 1 and field.many_to_one:
+                # Dotted source through a foreign key (e.g. a dictionary entry): join it
+                columns.append('__'.join(source_attrs))
+                select.append(source_attrs[0])
+            elif field.concrete and not field.many_to_many:
+                columns.append(field.name)
+            elif field.one_to_many or field.many_to_many:
+                prefetch.append(field.name)
+
+        if select:
+            queryset = queryset.select_related(*dict.fromkeys(select))
+        if requested is not None:
+            queryset = queryset.only(*columns)
+            if prefetch:
+                queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        requested = self.get_requested_fields()
+        if requested is not None:
+            fields = serializer.child.fields if hasattr(serializer, 'child') else serializer.fields
+            for name in set(fields) - set(requested):
+                fields.pop(name)
+        return serializer
+
+    def _get_list(self, param):
+        value = self.request.query_params.get(param, '')
+        return [item.strip() for item in value.split(',') if item.strip()]
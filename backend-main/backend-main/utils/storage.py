@@ -0,0 +1,26 @@
+import os
+
+import pandas as pd
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+from utils.columnar_cache import ColumnarCache
+
+
+def read_storage_csv(file_path: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV saved through ``default_storage``. On local storage the read
+    goes through a columnar sidecar cache in ``UPLOAD_COLUMNAR_CACHE_DIR``,
+    keyed by the file contents, so re-loading the same export (a re-upload,
+    a retried task) memory-maps the parsed frame instead of parsing it again.
+    """
+    try:
+        path = default_storage.path(file_path)
+    except NotImplementedError:
+        path = None
+
+    if path and os.path.isfile(path):
+        return ColumnarCache(settings.UPLOAD_COLUMNAR_CACHE_DIR).read_csv(path, **kwargs)
+
+    with default_storage.open(file_path, mode="rb") as fh:
+        return pd.read_csv(fh, **kwargs)
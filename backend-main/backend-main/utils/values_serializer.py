@@ -0,0 +1,185 @@
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+# (serializer field, model field) pairs whose database value is already its representation
+PASSTHROUGH = (
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField, models.AutoField)),
+    (serializers.FloatField, (models.FloatField,)),
+)
+
+
+COLUMN, NESTED, MANY = 'column', 'nested', 'many'
+
+
+class UnsupportedField(Exception):
+    pass
+
+
+class ValuesReader:
+    """
+    Read-only representation of a ModelSerializer built from ``values()``
+    rows instead of model instances.
+
+    The serializer's fields are compiled once into (output name, values()
+    key, converter) triples: plain columns and dotted sources through
+    foreign keys become ``__`` lookups, nested serializers become prefixed
+    lookups, and many=True nested serializers are filled with one extra
+    query per page. Converters are the serializer fields' own
+    ``to_representation``, skipped where the database value already is the
+    representation, so the output matches the serializer's.
+
+    Serializers with fields that need the instance (method fields, ``*``
+    sources, custom relations) are not supported; ``supported`` is False
+    and callers fall back to the serializer.
+    """
+
+    def __init__(self, serializer, model=None, prefix=''):
+        self.model = model or serializer.Meta.model
+        self.prefix = prefix
+        # In serializer field order: (COLUMN, name, values() key, converter or None),
+        # (NESTED, name, ValuesReader, values() key of the FK) or (MANY, name, ValuesReader, reverse FK name)
+        self.fields = []
+        try:
+            self._compile(serializer)
+            self.supported = True
+        except UnsupportedField:
+            self.supported = False
+
+    def _compile(self, serializer):
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            source_attrs = field.source_attrs
+            if not source_attrs or isinstance(field, (serializers.SerializerMethodField, serializers.HiddenField)):
+                raise UnsupportedField(name)
+
+            model_field = self._get_model_field(self.model, source_attrs)
+            lookup = self.prefix + '__'.join(source_attrs)
+
+            if isinstance(field, serializers.ListSerializer):
+                if len(source_attrs) != 1 or not model_field.one_to_many:
+                    raise UnsupportedField(name)
+                child = ValuesReader(field.child, model_field.related_model)
+                if not child.supported:
+                    raise UnsupportedField(name)
+                self.fields.append((MANY, name, child, model_field.field.name))
+            elif isinstance(field, serializers.BaseSerializer):
+                if len(source_attrs) != 1 or not model_field.many_to_one:
+                    raise UnsupportedField(name)
+                child = ValuesReader(field, model_field.related_model, prefix=lookup + '__')
+                if not child.supported or child.has_many:
+                    raise UnsupportedField(name)
+                self.fields.append((NESTED, name, child, lookup))
+            elif isinstance(field, serializers.PrimaryKeyRelatedField):
+                if field.pk_field is not None or not model_field.many_to_one:
+                    raise UnsupportedField(name)
+                self.fields.append((COLUMN, name, lookup, None))
+            elif isinstance(field, serializers.RelatedField) or model_field is None:
+                raise UnsupportedField(name)
+            else:
+                self.fields.append((COLUMN, name, lookup, self._get_converter(field, model_field)))
+
+    def _get_model_field(self, model, source_attrs):
+        """Model field at the end of a (possibly dotted) source, following foreign keys"""
+        model_field = None
+        for attr in source_attrs:
+            if model is None:
+                raise UnsupportedField(attr)
+            try:
+                model_field = model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                return None
+            model = model_field.related_model
+        return model_field
+
+    def _get_converter(self, field, model_field):
+        for field_class, model_field_classes in PASSTHROUGH:
+            if type(field) is field_class and isinstance(model_field, model_field_classes):
+                return None
+        return field.to_representation
+
+    @property
+    def has_many(self):
+        return any(kind == MANY for kind, *_ in self.fields)
+
+    def get_lookups(self):
+        lookups = []
+        for kind, _, target, lookup in self.fields:
+            if kind == COLUMN:
+                lookups.append(target)
+            elif kind == NESTED:
+                lookups.append(lookup)
+                lookups.extend(target.get_lookups())
+        return lookups
+
+    def values(self, queryset):
+        """``queryset`` as the values() rows this reader represents; ``pk`` is always selected"""
+        return queryset.values('pk', *dict.fromkeys(self.get_lookups()))
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        many_values = {
+            name: self._get_many(child, fk_name, [row['pk'] for row in rows])
+            for kind, name, child, fk_name in self.fields if kind == MANY
+        }
+        return [self._represent(row, many_values) for row in rows]
+
+    def _represent(self, row, many_values=None):
+        item = OrderedDict()
+        for kind, name, target, extra in self.fields:
+            if kind == COLUMN:
+                value = row[target]
+                item[name] = extra(value) if extra is not None and value is not None else value
+            elif kind == NESTED:
+                item[name] = target._represent(row) if row[extra] is not None else None
+            else:
+                item[name] = many_values[name].get(row['pk'], [])
+        return item
+
+    def _get_many(self, child, fk_name, pks):
+        """Child rows of every parent on the page, grouped by parent pk, in one query"""
+        queryset = child.model._default_manager.filter(**{f'{fk_name}__in': pks}).order_by('pk')
+        rows = list(queryset.values(fk_name, 'pk', *dict.fromkeys(child.get_lookups())))
+        grouped = {}
+        for row, item in zip(rows, child.to_representation(rows)):
+            grouped.setdefault(row[fk_name], []).append(item)
+        return grouped
+
+
+# Compiled readers by (serializer class, selected fields)
+_readers = {}
+
+
+class ValuesListMixin:
+    """
+    List view mixin serving ``list()`` from ``values()`` rows through a
+    ValuesReader built from the view's serializer, skipping model
+    instantiation and per-field serializer calls. Works with
+    SparseFieldsMixin, whose field selection narrows the values() query.
+    Views whose serializer the reader does not support, and every write,
+    keep using the serializer.
+    """
+
+    def get_values_reader(self):
+        serializer = self.get_serializer(many=True).child
+        key = (type(serializer), tuple(serializer.fields))
+        if key not in _readers:
+            _readers[key] = ValuesReader(serializer)
+        return _readers[key]
+
+    def list(self, request, *args, **kwargs):
+        reader = self.get_values_reader()
+        if not reader.supported:
+            return super().list(request, *args, **kwargs)
+
+        queryset = reader.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(reader.to_representation(page))
+        return Response(reader.to_representation(queryset))
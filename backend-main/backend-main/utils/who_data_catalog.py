@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+
+class WHODataCatalog:
+    """
+    Persistent per-file index of the countries, districts, diseases and data
+    periods found in the WHO CSV sources.
+
+    Entries are written while the files are parsed and stored in
+    ``catalog.json`` next to the columnar cache sidecars. An entry stays
+    valid until the source file's mtime or size changes, so dropdown lookups
+    never have to re-read the CSVs.
+    """
+
+    FILE_NAME = 'catalog.json'
+
+    COUNTRY_COLUMNS = ['Country', 'country', 'country_name']
+    DISTRICT_COLUMNS = ['District', 'district']
+    DISEASE_COLUMNS = ['disease', 'disease_name']
+    DATA_PERIOD_COLUMNS = ['DataPeriod', 'data_period']
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, self.FILE_NAME)
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+
+    def is_current(self, file_name: str, file_path: str) -> bool:
+        entry = self.entries.get(file_name)
+        if not entry:
+            return False
+        stat = os.stat(file_path)
+        return entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size
+
+    def record(self, file_name: str, file_path: str, df: pd.DataFrame, kind: str, disease: Optional[str] = None):
+        """Index one parsed source file"""
+        stat = os.stat(file_path)
+        diseases = [disease] if disease else self._distinct(df, self.DISEASE_COLUMNS)
+        self.entries[file_name] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'kind': kind,
+            'countries': self._distinct(df, self.COUNTRY_COLUMNS),
+            'districts': self._distinct(df, self.DISTRICT_COLUMNS),
+            'diseases': diseases,
+            'data_periods': self._distinct(df, self.DATA_PERIOD_COLUMNS),
+        }
+        self._dirty = True
+
+    def prune(self, file_names: List[str]):
+        """Forget files that are no longer in the data directory"""
+        for file_name in set(self.entries) - set(file_names):
+            del self.entries[file_name]
+            self._dirty = True
+
+    def values(self, field: str, kind: Optional[str] = None) -> List[str]:
+        """Sorted union of ``field`` across all (or one kind of) files"""
+        found = set()
+        for entry in self.entries.values():
+            if kind is None or entry.get('kind') == kind:
+                found.update(entry.get(field, []))
+        return sorted(found)
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.json.tmp')
+            with os.fdopen(fd, 'w') as fh:
+                json.dump(self.entries, fh, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"❌ Error saving WHO data catalog: {e}")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _distinct(self, df: pd.DataFrame, columns: List[str]) -> List[str]:
+        for column in columns:
+            if column in df.columns:
+                return sorted({str(value).strip() for value in df[column].dropna().unique() if str(value).strip()})
+        return []
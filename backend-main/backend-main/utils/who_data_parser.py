@@ -1,8 +1,54 @@
 import pandas as pd
+import hashlib
+import math
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
+from utils.columnar_cache import ColumnarCache
+from utils.who_data_catalog import WHODataCatalog
+
+# Parsed events shared across parser instances, keyed by data directory
+_parse_cache: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+_parse_cache_lock = threading.Lock()
+
+# Catalog lookups shared across parser instances, keyed by data directory
+_catalog_cache: Dict[str, Tuple[str, Dict[str, List[str]]]] = {}
+
+# File summaries keyed by data directory and invalidated by the directory mtime,
+# which changes whenever a file is added, removed or renamed
+_summary_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Excel outlines (sheet -> header columns) and sheet frames, keyed by (file path, sheet)
+# and invalidated by the workbook's mtime
+_excel_cache: Dict[Tuple[str, Optional[str]], Tuple[int, Any]] = {}
+_excel_cache_lock = threading.Lock()
+
+
+class LazyExcelSheets(Mapping):
+    """Read-only sheet name -> load_excel_sheet() mapping that parses a sheet on first access"""
+
+    def __init__(self, parser: 'WHODataParser', excel_file: str, outline: Dict[str, List[Any]]):
+        self.parser = parser
+        self.excel_file = excel_file
+        self.outline = outline
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, sheet_name: str) -> Dict[str, Any]:
+        if sheet_name not in self.outline:
+            raise KeyError(sheet_name)
+        if sheet_name not in self._loaded:
+            self._loaded[sheet_name] = self.parser.load_excel_sheet(self.excel_file, sheet_name)
+        return self._loaded[sheet_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.outline)
+
+    def __len__(self) -> int:
+        return len(self.outline)
+
 
 class WHODataParser:
     """
@@ -28,12 +74,20 @@ class WHODataParser:
         'status', 'description', 'year', 'reportDate', 'cases', 'deaths'
     ]
     
-    def __init__(self, who_data_dir: str = None):
+    def __init__(self, who_data_dir: str = None, cache_dir: str = None):
         if who_data_dir is None:
             self.who_data_dir = os.path.join(os.path.dirname(__file__), '..', 'who-data')
         else:
             self.who_data_dir = who_data_dir
         
+        # Columnar sidecar cache so repeated reads skip CSV/Excel parsing
+        if cache_dir is None:
+            cache_dir = os.getenv('WHO_DATA_CACHE_DIR', os.path.join(self.who_data_dir, '.columnar'))
+        self.columnar_cache = ColumnarCache(cache_dir)
+        
+        # Per-file index of countries/districts/diseases/data periods, kept beside the cache
+        self.catalog = WHODataCatalog(cache_dir)
+        
         # WHO Signal Intelligence CSV files (event-based data)
         self.signal_files = [
             'phe_data.csv',
@@ -108,24 +162,60 @@ class WHODataParser:
                         events = self.parse_readiness_csv(file_path, csv_file, is_subnational=True)
                     else:
                         events = self.parse_readiness_csv(file_path, csv_file, is_subnational=False)
-                    all_events.extend(events)
+                    all_events.extend(json_safe(events))
                     print(f"✅ Parsed {len(events)} records from {csv_file}")
                 except Exception as e:
                     print(f"❌ Error parsing {csv_file}: {e}")
+        
+        self.catalog.prune(csv_files)
+        self.catalog.save()
                     
         return all_events
     
+    def get_source_signature(self, csv_files: Optional[List[str]] = None) -> str:
+        """
+        Fingerprint of the CSV sources (name, mtime, size) used to key the parse
+        cache; limited to ``csv_files`` when given.
+        """
+        entries = []
+        for csv_file in sorted(self.get_all_csv_files() if csv_files is None else csv_files):
+            try:
+                stat = os.stat(os.path.join(self.who_data_dir, csv_file))
+            except OSError:
+                continue
+            entries.append(f"{csv_file}:{stat.st_mtime_ns}:{stat.st_size}")
+        return hashlib.sha1('|'.join(entries).encode()).hexdigest()
+    
+    def get_cached_events(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Parse all CSV files once per source signature and share the result
+        across requests. Returns the signature together with the events.
+        """
+        cache_key = os.path.abspath(self.who_data_dir)
+        signature = self.get_source_signature()
+        with _parse_cache_lock:
+            cached = _parse_cache.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached
+        
+        events = self.parse_all_csv_files()
+        with _parse_cache_lock:
+            _parse_cache[cache_key] = (signature, events)
+        return signature, events
+    
     def parse_signal_csv(self, file_path: str, csv_file: str) -> List[Dict[str, Any]]:
         """Parse WHO Signal Intelligence CSV files (PHE, Signal, RRA, EIS)"""
-        df = pd.read_csv(file_path)
+        df = self.columnar_cache.read_csv(file_path)
         
         event_type = csv_file.replace('_data.csv', '').upper()
         
         df = self.standardize_signal_columns(df)
+        self.catalog.record(csv_file, file_path, df, 'signal')
         df['source'] = 'WHO'
         df['dataType'] = 'signal'
         df['eventType'] = event_type
         df['sourceFile'] = csv_file
+        df['source_priority'] = 1
         
         events = df.to_dict('records')
         return [self.validate_signal_event(event) for event in events]
@@ -137,9 +227,10 @@ class WHODataParser:
         1. Aggregated country-level summary
         2. Detailed category breakdown
         """
-        df = pd.read_csv(file_path)
+        df = self.columnar_cache.read_csv(file_path)
         
         disease_type = self.extract_disease_from_filename(csv_file)
+        self.catalog.record(csv_file, file_path, df, 'readiness', disease=disease_type)
         
         # Get both aggregated and detailed data
         aggregated_events = self.aggregate_readiness_by_country(df, disease_type, csv_file, is_subnational)
@@ -174,7 +265,7 @@ class WHODataParser:
             avg_question_score = group['QuestionScore'].mean() if 'QuestionScore' in group.columns else 0
             
             # Get unique categories
-            categories = group['Category'].unique().tolist() if 'Category' in group.columns else []
+            categories = group['Category'].dropna().unique().tolist() if 'Category' in group.columns else []
             
             # Count responses
             yes_count = (group['NationalYN'] == 'yes').sum() if 'NationalYN' in group.columns else 0
@@ -217,7 +308,8 @@ class WHODataParser:
                 'dataPeriod': data_period,
                 'sourceFile': csv_file,
                 'reportDate': datetime.now().isoformat(),
-                'year': datetime.now().year
+                'year': datetime.now().year,
+                'source_priority': 1
             }
             events.append(event)
         
@@ -279,42 +371,87 @@ class WHODataParser:
                 
                 # Metadata
                 'sourceFile': csv_file,
-                'reportDate': datetime.now().isoformat()
+                'reportDate': datetime.now().isoformat(),
+                'source_priority': 1
             }
             events.append(event)
         
         return events
     
-    def parse_excel_files(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Parse all Excel files and return structured data"""
+    def parse_excel_files(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sheets and header columns of every Excel file. ``data`` maps each sheet
+        name to its load_excel_sheet() result, parsed when first accessed, so
+        only the outline is read up front.
+        """
         excel_data = {}
         
         for excel_file in self.get_all_excel_files():
-            file_path = os.path.join(self.who_data_dir, excel_file)
-            if os.path.exists(file_path):
-                try:
-                    # Read all sheets
-                    xlsx = pd.ExcelFile(file_path)
-                    file_data = {}
-                    
-                    for sheet_name in xlsx.sheet_names:
-                        df = pd.read_excel(xlsx, sheet_name=sheet_name)
-                        file_data[sheet_name] = {
-                            'columns': df.columns.tolist(),
-                            'row_count': len(df),
-                            'data': df.to_dict('records')
-                        }
-                    
-                    excel_data[excel_file] = {
-                        'sheets': list(xlsx.sheet_names),
-                        'data': file_data
-                    }
-                    print(f"✅ Parsed Excel file: {excel_file} ({len(xlsx.sheet_names)} sheets)")
-                except Exception as e:
-                    print(f"❌ Error parsing Excel {excel_file}: {e}")
+            try:
+                outline = self.get_excel_outline(excel_file)
+                excel_data[excel_file] = {
+                    'sheets': list(outline),
+                    'columns': outline,
+                    'data': LazyExcelSheets(self, excel_file, outline)
+                }
+                print(f"✅ Indexed Excel file: {excel_file} ({len(outline)} sheets)")
+            except Exception as e:
+                print(f"❌ Error parsing Excel {excel_file}: {e}")
         
         return excel_data
     
+    def get_excel_outline(self, excel_file: str) -> Dict[str, List[Any]]:
+        """Sheet names and header columns of a workbook, without loading any rows"""
+        file_path = self._get_excel_path(excel_file)
+        cache_key = (file_path, None)
+        mtime = os.stat(file_path).st_mtime_ns
+        with _excel_cache_lock:
+            cached = _excel_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with pd.ExcelFile(file_path) as xlsx:
+            outline = {
+                sheet_name: pd.read_excel(xlsx, sheet_name=sheet_name, nrows=0).columns.tolist()
+                for sheet_name in xlsx.sheet_names
+            }
+        with _excel_cache_lock:
+            _excel_cache[cache_key] = (mtime, outline)
+        return outline
+    
+    def get_excel_sheet(self, excel_file: str, sheet_name: str) -> pd.DataFrame:
+        """Load a single sheet on demand; other sheets of the workbook are not parsed"""
+        if sheet_name not in self.get_excel_outline(excel_file):
+            raise ValueError(f"Sheet '{sheet_name}' not found in {excel_file}")
+        
+        file_path = self._get_excel_path(excel_file)
+        cache_key = (file_path, sheet_name)
+        mtime = os.stat(file_path).st_mtime_ns
+        with _excel_cache_lock:
+            cached = _excel_cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        df = self.columnar_cache.read_excel(file_path, sheet_name)
+        with _excel_cache_lock:
+            _excel_cache[cache_key] = (mtime, df)
+        return df
+    
+    def load_excel_sheet(self, excel_file: str, sheet_name: str, start: int = 0, stop: Optional[int] = None) -> Dict[str, Any]:
+        """Columns, total row count and the ``[start:stop]`` rows of one sheet"""
+        df = self.get_excel_sheet(excel_file, sheet_name)
+        rows = df.iloc[start:stop]
+        return {
+            'columns': df.columns.tolist(),
+            'row_count': len(df),
+            'data': rows.astype(object).where(rows.notna(), None).to_dict('records')
+        }
+    
+    def _get_excel_path(self, excel_file: str) -> str:
+        if excel_file not in self.get_all_excel_files():
+            raise FileNotFoundError(f"Excel file '{excel_file}' not found")
+        return os.path.join(self.who_data_dir, excel_file)
+    
     def extract_disease_from_filename(self, filename: str) -> str:
         """Extract disease/hazard type from filename"""
         filename_lower = filename.lower()
@@ -352,7 +489,8 @@ class WHODataParser:
         else:
             return 'Unknown'
     
-    def score_to_grade(self, score: float) -> str:
+    @staticmethod
+    def score_to_grade(score: float) -> str:
         """Convert readiness score to grade"""
         if score >= 8:
             return 'Grade 1'  # High readiness
@@ -471,6 +609,21 @@ class WHODataParser:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get comprehensive summary of all available data files"""
+        cache_key = os.path.abspath(self.who_data_dir)
+        try:
+            dir_mtime = os.stat(self.who_data_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        cached = _summary_cache.get(cache_key)
+        if dir_mtime is not None and cached and cached[0] == dir_mtime:
+            return cached[1]
+        
+        summary = self._build_summary()
+        if dir_mtime is not None:
+            _summary_cache[cache_key] = (dir_mtime, summary)
+        return summary
+    
+    def _build_summary(self) -> Dict[str, Any]:
         csv_files = self.get_all_csv_files()
         excel_files = self.get_all_excel_files()
         
@@ -495,56 +648,112 @@ class WHODataParser:
             }
         }
     
+    def get_catalog(self) -> Dict[str, List[str]]:
+        """
+        Distinct countries, districts, diseases and data periods across the
+        CSV sources. Only files whose mtime or size changed since they were
+        last indexed are re-read; the result is shared per source signature.
+        """
+        cache_key = os.path.abspath(self.who_data_dir)
+        signature = self.get_source_signature()
+        with _parse_cache_lock:
+            cached = _catalog_cache.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        csv_files = self.get_all_csv_files()
+        for csv_file in csv_files:
+            file_path = os.path.join(self.who_data_dir, csv_file)
+            if not os.path.exists(file_path) or self.catalog.is_current(csv_file, file_path):
+                continue
+            try:
+                df = self.columnar_cache.read_csv(file_path)
+                if csv_file in self.signal_files:
+                    self.catalog.record(csv_file, file_path, self.standardize_signal_columns(df), 'signal')
+                else:
+                    self.catalog.record(csv_file, file_path, df, 'readiness',
+                                        disease=self.extract_disease_from_filename(csv_file))
+            except Exception as e:
+                print(f"❌ Error indexing {csv_file}: {e}")
+        self.catalog.prune(csv_files)
+        self.catalog.save()
+        
+        result = {
+            'countries': self.catalog.values('countries'),
+            'districts': self.catalog.values('districts'),
+            # Signal files carry free-text disease names; hazards come from readiness files
+            'diseases': self.catalog.values('diseases', kind='readiness'),
+            'data_periods': self.catalog.values('data_periods'),
+        }
+        with _parse_cache_lock:
+            _catalog_cache[cache_key] = (signature, result)
+        return result
+    
     def get_available_diseases(self) -> List[str]:
         """Get list of all available diseases/hazards"""
-        diseases = set()
-        for csv_file in self.get_all_csv_files():
-            if csv_file not in self.signal_files:
-                diseases.add(self.extract_disease_from_filename(csv_file))
-        return sorted(list(diseases))
+        return self.get_catalog()['diseases']
     
     def get_available_countries(self) -> List[str]:
         """Get list of all countries in the data"""
-        countries = set()
-        for csv_file in self.get_all_csv_files():
-            file_path = os.path.join(self.who_data_dir, csv_file)
-            if os.path.exists(file_path):
-                try:
-                    df = pd.read_csv(file_path, usecols=['Country'] if 'Country' in pd.read_csv(file_path, nrows=0).columns else ['country'])
-                    col = 'Country' if 'Country' in df.columns else 'country'
-                    countries.update(df[col].dropna().unique())
-                except:
-                    pass
-        return sorted(list(countries))
+        return self.get_catalog()['countries']
+
+
+def json_safe(value: Any) -> Any:
+    """
+    ``value`` with NaN and infinite floats (pandas' missing values) replaced
+    by None, in nested lists and dicts too, so events serialize as valid JSON.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    return value
+
+
+def dedupe_key(event: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    Identity of a WHO event for deduplication. Values are compared by their
+    string form, as the old concatenated keys were, but kept in a tuple so a
+    separator inside a value cannot make two different events collide.
+    """
+    data_type = event.get('dataType', 'unknown')
+    if data_type == 'signal':
+        return (data_type, str(event.get('country', '')), str(event.get('disease', '')),
+                str(event.get('reportDate', ''))[:10])
+    if data_type == 'readiness_summary':
+        return (data_type, str(event.get('country', '')), str(event.get('district', '')),
+                str(event.get('disease', '')))
+    if data_type == 'readiness_category':
+        return (data_type, str(event.get('country', '')), str(event.get('district', '')),
+                str(event.get('disease', '')), str(event.get('categoryCode', '')))
+    return ('other', str(event.get('id', '')))
+
+
+def existing_dedupe_key(event: Dict[str, Any]) -> Tuple[str, ...]:
+    """Identity of an event built from the Django models"""
+    return ('existing', str(event.get('country', '')), str(event.get('disease', '')),
+            str(event.get('reportDate', ''))[:10])
 
 
 def combine_and_deduplicate(who_events: List[Dict[str, Any]], existing_events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Intelligent merge strategy prioritizing WHO data"""
-    event_map = {}
+    """
+    Intelligent merge strategy prioritizing WHO data. A later WHO event
+    replaces an earlier one with the same key; existing events are only added
+    for keys not seen yet. The input events are left untouched, they carry
+    their ``source_priority`` from when they were built.
+    """
+    event_map: Dict[Tuple[str, ...], Dict[str, Any]] = {}
     
     for event in who_events:
-        data_type = event.get('dataType', 'unknown')
-        if data_type == 'signal':
-            key = f"signal-{event.get('country', '')}-{event.get('disease', '')}-{str(event.get('reportDate', ''))[:10]}"
-        elif data_type == 'readiness_summary':
-            key = f"summary-{event.get('country', '')}-{event.get('district', '')}-{event.get('disease', '')}"
-        elif data_type == 'readiness_category':
-            key = f"category-{event.get('country', '')}-{event.get('district', '')}-{event.get('disease', '')}-{event.get('categoryCode', '')}"
-        else:
-            key = f"other-{event.get('id', '')}"
-        
-        event['source_priority'] = 1
-        event_map[key] = event
+        event_map[dedupe_key(event)] = event
     
     for event in existing_events:
-        key = f"existing-{event.get('country', '')}-{event.get('disease', '')}-{str(event.get('reportDate', ''))[:10]}"
-        if key not in event_map:
-            event['source_priority'] = 2
-            event_map[key] = event
+        event_map.setdefault(existing_dedupe_key(event), event)
     
     return list(event_map.values())
 
-
 if __name__ == '__main__':
     parser = WHODataParser()
     
@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.who_data_parser import WHODataParser
+from utils.who_event_store import SignalSource, get_current_store, get_event_store
+
+
+class WHODataRefresher(threading.Thread):
+    """
+    Daemon thread that polls the who-data directory and rebuilds the parse
+    cache, catalog and event store whenever a source file changes, so
+    requests keep being served from the previous store instead of paying
+    for the parse. Changed signal CSVs are loaded into SignalEvent first.
+
+    Change detection compares the (name, mtime, size) source signature on
+    every tick, which costs one directory listing and a stat per file.
+    """
+
+    def __init__(self, existing_events_loader: Callable[[], List[Dict[str, Any]]],
+                 interval: float = 30, who_data_dir: str = None,
+                 signal_source: Optional[Callable[[], Optional[SignalSource]]] = None):
+        super().__init__(name='who-data-refresher', daemon=True)
+        self.existing_events_loader = existing_events_loader
+        self.signal_source = signal_source
+        # Signature of the signal CSVs last loaded into SignalEvent
+        self.signal_signature: Optional[str] = None
+        self.interval = interval
+        self.who_data_dir = who_data_dir
+        self.last_refresh: Optional[str] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+
+    def refresh(self) -> bool:
+        """Bring every WHO data cache up to date; returns False if the refresh failed"""
+        parser = WHODataParser(self.who_data_dir)
+        started = time.monotonic()
+        try:
+            self.sync_signal_events(parser)
+            get_event_store(parser, self.existing_events_loader, signal_source=self.signal_source)
+            parser.get_catalog()
+            for excel_file in parser.get_all_excel_files():
+                parser.get_excel_outline(excel_file)
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"❌ Error refreshing WHO data cache: {e}")
+            return False
+
+        self.last_refresh = datetime.now().isoformat()
+        self.last_duration = round(time.monotonic() - started, 3)
+        self.last_error = None
+        return True
+
+    def sync_signal_events(self, parser: WHODataParser):
+        """Load the signal CSVs into SignalEvent when one of them changed since the last refresh"""
+        from readiness.tasks import load_who_signal_events
+
+        signature = parser.get_source_signature(parser.signal_files)
+        if signature == self.signal_signature:
+            return
+        load_who_signal_events(parser.who_data_dir)
+        self.signal_signature = signature
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_refresher: Optional[WHODataRefresher] = None
+_refresher_lock = threading.Lock()
+
+
+def start_refresher(existing_events_loader: Callable[[], List[Dict[str, Any]]],
+                    interval: float = 30,
+                    signal_source: Optional[Callable[[], Optional[SignalSource]]] = None) -> WHODataRefresher:
+    """Start the process-wide refresher once; later calls return the running one"""
+    global _refresher
+
+    with _refresher_lock:
+        if _refresher is None or not _refresher.is_alive():
+            _refresher = WHODataRefresher(existing_events_loader, interval, signal_source=signal_source)
+            _refresher.start()
+        return _refresher
+
+
+def start_refresher_from_environment() -> Optional[WHODataRefresher]:
+    """
+    Start the refresher when ``WHO_DATA_REFRESH`` is set (interval from
+    ``WHO_DATA_REFRESH_INTERVAL``). Called from the WSGI/ASGI entry points,
+    so only web server processes run it; management commands and Celery
+    workers never load those modules. Other processes can run
+    ``manage.py refresh_who_data --watch`` instead.
+    """
+    if os.getenv('WHO_DATA_REFRESH', '').lower() not in ('1', 'true', 'yes'):
+        return None
+
+    from readiness.views import WHODataView
+
+    view = WHODataView()
+    return start_refresher(
+        view._get_existing_events,
+        interval=float(os.getenv('WHO_DATA_REFRESH_INTERVAL', 30)),
+        signal_source=view._get_signal_source
+    )
+
+
+def is_refresher_running() -> bool:
+    return _refresher is not None and _refresher.is_alive()
+
+
+def get_cache_status() -> Dict[str, Any]:
+    """Warmth of the in-process WHO data caches, for readiness checks"""
+    store = get_current_store()
+    status = {
+        'warm': store is not None,
+        'version': store.version if store else None,
+        'built_at': store.built_at if store else None,
+        'events': len(store.events) if store else 0,
+        'refresher': {'running': is_refresher_running()},
+    }
+    if _refresher is not None:
+        status['refresher'].update({
+            'interval': _refresher.interval,
+            'last_refresh': _refresher.last_refresh,
+            'last_duration': _refresher.last_duration,
+            'last_error': _refresher.last_error,
+        })
+    return status
@@ -0,0 +1,216 @@
+import hashlib
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from utils.who_data_parser import WHODataParser, combine_and_deduplicate
+
+
+class WHOEventStore:
+    """
+    In-memory inverted index over the combined WHO events.
+
+    Every indexed field keeps a posting list (value -> set of event ids) so
+    the WHODataView filters become set intersections and facet counts are
+    available without walking the event list.
+    """
+
+    # query param -> (event field, match mode)
+    FILTERS = {
+        'country': ('country', 'exact'),
+        'disease': ('disease', 'contains'),
+        'eventType': ('eventType', 'exact'),
+        'grade': ('grade', 'contains'),
+        'status': ('status', 'exact'),
+        'source': ('source', 'exact'),
+        'isSubnational': ('isSubnational', 'bool'),
+        'category': ('category', 'contains'),
+    }
+    INDEXED_FIELDS = [field for field, _ in FILTERS.values()] + ['dataType']
+    DESCRIBE_FACETS = ['country', 'disease', 'category']
+    DESCRIBE_CACHE_SIZE = 256
+
+    def __init__(self, events: List[Dict[str, Any]], version: str = '',
+                 source_events: Optional[List[Dict[str, Any]]] = None, existing_count: int = 0):
+        self.events = events
+        self.version = version
+        # Number of existing model events the store was built with
+        self.existing_count = existing_count
+        self.built_at = datetime.now().isoformat()
+        self.all_ids = frozenset(range(len(events)))
+        self.postings: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in self.INDEXED_FIELDS}
+        # Stores are shared by request threads; the memo is the only state they mutate
+        self._describe_cache: Dict[Tuple, Dict[str, Any]] = {}
+        self._describe_lock = threading.Lock()
+
+        for event_id, event in enumerate(events):
+            for field in self.INDEXED_FIELDS:
+                if field == 'isSubnational':
+                    value = bool(event.get(field, False))
+                else:
+                    value = event.get(field)
+                self.postings[field].setdefault(value, set()).add(event_id)
+
+        # Facet counts for the unfiltered store
+        self.facets: Dict[str, Dict[Any, int]] = {
+            field: {value: len(ids) for value, ids in postings.items()}
+            for field, postings in self.postings.items()
+        }
+
+        # Event type counts over the parsed WHO events before deduplication
+        self.source_event_types: Dict[str, Counter] = {}
+        for event in source_events or []:
+            data_type = event.get('dataType', 'unknown')
+            self.source_event_types.setdefault(data_type, Counter())[event.get('eventType')] += 1
+
+    @staticmethod
+    def _normalize(value: Any) -> str:
+        return '' if value is None else str(value).lower()
+
+    def _match(self, field: str, mode: str, needle: str) -> Set[int]:
+        """Union of the posting lists whose value matches the needle"""
+        if mode == 'bool':
+            return self.postings[field].get(needle.lower() == 'true', set())
+
+        needle = needle.lower()
+        matched = set()
+        for value, ids in self.postings[field].items():
+            normalized = self._normalize(value)
+            if (mode == 'exact' and normalized == needle) or (mode == 'contains' and needle in normalized):
+                matched |= ids
+        return matched
+
+    def data_type_ids(self, data_type: str = 'all') -> Set[int]:
+        """Ids for a WHODataView ``dataType`` selection; existing model events are always included"""
+        if data_type not in ('signal', 'readiness_summary', 'readiness_category'):
+            return set(self.all_ids)
+        return self.postings['dataType'].get(data_type, set()) | self.postings['dataType'].get('existing', set())
+
+    def filter_key(self, query_params: Mapping[str, str], data_type: str = 'all') -> Tuple:
+        """Hashable key identifying a ``filter_ids`` selection"""
+        return (data_type,) + tuple((param, query_params.get(param) or '') for param in self.FILTERS)
+
+    def filter_ids(self, query_params: Mapping[str, str], data_type: str = 'all') -> Set[int]:
+        """Apply the WHODataView query parameter filters as set intersections"""
+        ids = self.data_type_ids(data_type)
+        for param, (field, mode) in self.FILTERS.items():
+            value = query_params.get(param)
+            if not value:
+                continue
+            ids &= self._match(field, mode, value)
+            if not ids:
+                break
+        return ids
+
+    def get_events(self, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Events for the given ids in their original order"""
+        return [self.events[event_id] for event_id in sorted(ids)]
+
+    def count(self, field: str, value: Any, ids: Optional[Set[int]] = None) -> int:
+        postings = self.postings[field].get(value, set())
+        if ids is None:
+            return self.facets[field].get(value, 0)
+        return len(postings & ids)
+
+    def event_type_counts(self, data_type: str = 'all') -> Counter:
+        """Pre-deduplication event type counts for a ``dataType`` selection"""
+        if data_type in self.source_event_types:
+            return self.source_event_types[data_type]
+        if data_type in ('signal', 'readiness_summary', 'readiness_category'):
+            return Counter()
+        return sum(self.source_event_types.values(), Counter())
+
+    def describe(self, ids: Set[int], cache_key: Optional[Tuple] = None) -> Dict[str, Any]:
+        """
+        Data type counts and country/disease/category facets for the given ids,
+        computed in a single pass. Results are memoized per ``cache_key`` for
+        the lifetime of the store, since the store itself never changes.
+        """
+        if cache_key is not None:
+            with self._describe_lock:
+                cached = self._describe_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        by_data_type = Counter()
+        facets = {field: set() for field in self.DESCRIBE_FACETS}
+        for event_id in ids:
+            event = self.events[event_id]
+            by_data_type[event.get('dataType')] += 1
+            for field, values in facets.items():
+                value = event.get(field)
+                if value:
+                    values.add(value)
+
+        result = {
+            'by_data_type': by_data_type,
+            'facets': {field: sorted(values) for field, values in facets.items()},
+        }
+        if cache_key is not None:
+            with self._describe_lock:
+                if cache_key not in self._describe_cache and len(self._describe_cache) >= self.DESCRIBE_CACHE_SIZE:
+                    self._describe_cache.pop(next(iter(self._describe_cache)))
+                self._describe_cache[cache_key] = result
+        return result
+
+    def facet_values(self, field: str, ids: Optional[Set[int]] = None) -> List[Any]:
+        """Sorted distinct truthy values of ``field`` among the given ids"""
+        postings = self.postings[field]
+        if ids is None:
+            return sorted(value for value in postings if value)
+        return sorted(value for value, value_ids in postings.items() if value and not value_ids.isdisjoint(ids))
+
+
+# (version, loader) of signal events loaded outside the CSVs
+SignalSource = Tuple[str, Callable[[], List[Dict[str, Any]]]]
+
+_store: Optional[WHOEventStore] = None
+_store_lock = threading.Lock()
+
+
+def get_current_store() -> Optional[WHOEventStore]:
+    """The store currently being served, or None before the first build"""
+    return _store
+
+
+def get_event_store(parser: WHODataParser, existing_events_loader: Callable[[], List[Dict[str, Any]]],
+                    allow_stale: bool = False,
+                    signal_source: Optional[Callable[[], Optional[SignalSource]]] = None) -> WHOEventStore:
+    """
+    Return the shared event store, rebuilding it only when the parse cache
+    signature, the signal events or the existing model events change. With
+    ``allow_stale`` the current store is returned as is, without loading the
+    existing events; used while a background refresher is responsible for
+    rebuilding it.
+
+    ``signal_source`` returns a (version, loader) pair for signal events kept
+    outside the CSVs (the SignalEvent table); when it returns one, the loaded
+    events replace the parsed CSV signal events.
+    """
+    global _store
+
+    if allow_stale and _store is not None:
+        return _store
+
+    existing_events = existing_events_loader()
+    signature, who_events = parser.get_cached_events()
+    signals = signal_source() if signal_source else None
+    if signals is not None:
+        signature = f"{signature}:signal-{signals[0]}"
+    existing_key = repr([(e.get('country'), e.get('disease'), e.get('year')) for e in existing_events])
+    version = f"{signature}:{hashlib.sha1(existing_key.encode()).hexdigest()}"
+
+    with _store_lock:
+        if _store is not None and _store.version == version:
+            return _store
+
+    if signals is not None:
+        who_events = [event for event in who_events if event.get('dataType') != 'signal'] + signals[1]()
+
+    # Built outside the lock and swapped in whole, so readers never see a partial store
+    store = WHOEventStore(combine_and_deduplicate(who_events, existing_events), version,
+                          source_events=who_events, existing_count=len(existing_events))
+    with _store_lock:
+        _store = store
+    return store